@@ -144,6 +144,7 @@ from .palette import (
     
     # Color loading functions
     load_colors,
+    load_colors_with_overrides,
     load_palette,
 )
 
@@ -156,7 +157,9 @@ from .filament_palette import (
     
     # Filament loading functions
     load_filaments,
+    load_filaments_with_overrides,
     load_maker_synonyms,
+    load_maker_synonyms_with_overrides,
     load_owned_filaments,
     save_owned_filaments,
 )
@@ -319,8 +322,11 @@ __all__ = [
     "ColorRecord",
     "FilamentRecord",
     "load_colors",
+    "load_colors_with_overrides",
     "load_filaments",
+    "load_filaments_with_overrides",
     "load_maker_synonyms",
+    "load_maker_synonyms_with_overrides",
     "load_owned_filaments",
     "save_owned_filaments",
     "load_palette",
@@ -16,187 +16,84 @@ but nothing imports from it (except __main__.py).
 
 from __future__ import annotations
 import argparse
+import os
+import stat
 import sys
 from pathlib import Path
+from string import Template
 
 from . import __version__
 from .constants import ColorConstants
-from .config import set_dual_color_mode
 from .logging_config import setup_logging
-from .conversions import rgb_to_lab, lab_to_rgb, rgb_to_hsl, hsl_to_rgb, rgb_to_lch, lch_to_lab, lch_to_rgb
-from .gamut import is_in_srgb_gamut, find_nearest_in_gamut
-from .palette import Palette, load_colors, load_palette
-from .filament_palette import FilamentPalette, load_filaments, load_maker_synonyms
-from .color_deficiency import simulate_cvd, correct_cvd
-from .validation import validate_color
-from .export import export_filaments, export_colors, list_export_formats
-from .cli_commands.handlers import (
-    handle_name_command,
-    handle_validate_command,
-    handle_cvd_command,
-    handle_color_command,
-    handle_filament_command,
-    handle_convert_command,
-    handle_image_command,
-)
-from .cli_commands.utils import (
-    validate_color_input_exclusivity,
-    get_rgb_from_args,
-    parse_hex_or_exit,
-    is_valid_lab,
-    is_valid_lch,
-    get_program_name
-)
+from .cli_commands import handlers
+from .cli_commands.utils import get_program_name
 from .cli_commands.reporting import handle_verification_flags
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """
-    Build and return the argument parser for color-tools.
+# One-line help for each subcommand. Kept separate from the builders so the
+# top-level --help listing can be produced from argument-less stubs.
+_SUBCOMMAND_HELP = {
+    "color": "Work with CSS colors",
+    "filament": "Work with 3D printing filaments",
+    "convert": "Convert between color spaces",
+    "name": "Generate descriptive color names from RGB values",
+    "validate": "Validate if a hex code matches a color name",
+    "cvd": "Color vision deficiency simulation and correction",
+    "image": "Image color analysis and manipulation",
+}
 
-    Separated from main() so the wizard and tests can introspect available
-    choices (--space, --metric, --from, --to, etc.) without running the CLI.
-    """
-    # Determine the proper program name based on how we were invoked
-    prog_name = get_program_name()
 
-    parser = argparse.ArgumentParser(
-        prog=prog_name,
-        description="Color search and conversion tools",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
-Examples:
-  # Find nearest CSS color to an RGB value
-  {prog_name} color --nearest --value 128 64 200 --space rgb
-  {prog_name} color --nearest --hex "#8040C8"
-  
-  # Find color by name
-  {prog_name} color --name "coral"
-  
-  # Generate descriptive name for an RGB color
-  {prog_name} name --value 255 128 64
-  {prog_name} name --hex "#FF8040"
-  
-  # Simulate color blindness
-  {prog_name} cvd --value 255 0 0 --type protanopia --mode simulate
-  {prog_name} cvd --hex "#FF0000" --type deutan --mode correct
-  
-  # Extract and redistribute luminance from image
-  {prog_name} image --file photo.jpg --redistribute-luminance --colors 8
-  
-  # Convert image formats (WebP, PNG, JPEG, HEIC, AVIF, etc.)
-  {prog_name} image --file photo.webp --convert png
-  {prog_name} image --file photo.jpg --convert webp --quality 80 --lossy
-  
-  # Add watermarks to images
-  {prog_name} image --file photo.jpg --watermark --watermark-text "© 2025 MyBrand"
-  {prog_name} image --file photo.jpg --watermark --watermark-image logo.png --watermark-position top-right
-  
-  # Simulate colorblindness and convert to retro palettes
-  {prog_name} image --file chart.png --cvd-simulate deuteranopia --output colorblind_view.png
-  {prog_name} image --file photo.jpg --quantize-palette cga4 --dither --output retro.png
-  
-  # Find nearest filament to an RGB color
-  {prog_name} filament --nearest --value 255 0 0
-  {prog_name} filament --nearest --hex "#FF0000"
-  
-  # Find all PLA filaments from two different makers
-  {prog_name} filament --type PLA --maker "Bambu Lab" "Sunlu"
+# Argument choices shared by the subcommand builders. Tuples are built once at
+# import time rather than as fresh list literals on every parser build.
+_COLOR_SPACE_CHOICES = ("rgb", "hsl", "lab", "lch")
+_CONVERT_SPACE_CHOICES = ("rgb", "hsl", "lab", "lch", "cmy", "cmyk")
+_COLOR_METRIC_CHOICES = ("euclidean", "de76", "de94", "de2000", "cmc", "cmc21", "cmc11", "hyab")
+_FILAMENT_METRIC_CHOICES = ("euclidean", "de76", "de94", "de2000", "cmc", "hyab")
+_IMAGE_METRIC_CHOICES = ("de2000", "de94", "de76", "cmc", "euclidean", "hsl_euclidean", "hyab")
+_DUAL_COLOR_MODE_CHOICES = ("first", "last", "mix")
+_CVD_TYPE_CHOICES = ("protanopia", "protan", "deuteranopia", "deutan", "tritanopia", "tritan", "all")
+_CVD_MODE_CHOICES = ("simulate", "correct")
+_WATERMARK_POSITION_CHOICES = (
+    "top-left", "top-center", "top-right",
+    "center-left", "center", "center-right",
+    "bottom-left", "bottom-center", "bottom-right",
+)
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
-  # List all filament makers
-  {prog_name} filament --list-makers
-  
-  # Convert between color spaces
-  {prog_name} convert --from rgb --to lab --value 255 128 0
-  {prog_name} convert --from rgb --to cmyk --value 255 128 0
-  {prog_name} convert --from cmyk --to rgb --value 0 50 100 0
-  {prog_name} convert --from rgb --to cmy --value 255 128 0
+# CMC l:c defaults, resolved once instead of per --cmc-l/--cmc-c argument
+_CMC_L_DEFAULT = ColorConstants.CMC_L_DEFAULT
+_CMC_C_DEFAULT = ColorConstants.CMC_C_DEFAULT
 
-  # Check if LAB color is in sRGB gamut
-  {prog_name} convert --check-gamut --value 50 100 50
-  
-  # Show user file overrides
-  {prog_name} --check-overrides
-        """
-    )
-    
-    # Global arguments (apply to all subcommands)
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
-        help="Show version number and exit"
-    )
-    parser.add_argument(
-        "--json", 
-        type=str, 
-        metavar="DIR",
-        default=None,  # Will use default package data if None
-        help="Path to directory containing JSON data files (colors.json, filaments.json, maker_synonyms.json). Default: uses package data directory"
-    )
-    parser.add_argument(
-        "--verify-constants",
-        action="store_true",
-        help="Verify integrity of color science constants before proceeding"
-    )
-    parser.add_argument(
-        "--verify-data",
-        action="store_true",
-        help="Verify integrity of core data files (colors.json, filaments.json, maker_synonyms.json) before proceeding"
-    )
-    parser.add_argument(
-        "--verify-matrices",
-        action="store_true",
-        help="Verify integrity of transformation matrices before proceeding"
-    )
-    parser.add_argument(
-        "--verify-all",
-        action="store_true",
-        help="Verify integrity of constants, data files, matrices, and user data before proceeding"
-    )
-    parser.add_argument(
-        "--verify-user-data",
-        action="store_true",
-        help="Verify integrity of user data files (user/user-colors.json, user/user-filaments.json) against .sha256 files"
-    )
-    parser.add_argument(
-        "--generate-user-hashes",
-        action="store_true",
-        help="Generate .sha256 files for all user data files and exit"
-    )
-    parser.add_argument(
-        "--check-overrides",
-        action="store_true",
-        help="Show report of user overrides (user/user-colors.json, user/user-filaments.json) and exit"
-    )
-    parser.add_argument(
-        "--interactive", "-i",
-        action="store_true",
-        help="Launch the interactive wizard (guided prompts for color, filament, and convert commands)"
-    )
-    parser.add_argument(
-        "--log-file",
-        type=str,
-        metavar="PATH",
-        default=None,
-        help="Write log output to this file (enables file logging; default: no file logging)"
-    )
-    parser.add_argument(
-        "--log-level",
-        type=str,
-        metavar="LEVEL",
-        default="DEBUG",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Minimum log level written to the log file (default: DEBUG)"
-    )
 
-    # Create subparsers for the three main commands
-    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
-    
-    # ==================== COLOR SUBCOMMAND ====================
+# Arguments shared by several subcommands
+
+_HEX_HELP = "Hex color value (e.g., '#FF8040' or 'FF8040') - shortcut for RGB input"
+_RGB_VALUE_HELP = "RGB color value (0-255 for each component)"
+_EXPORT_OUTPUT_HELP = "Output filename (auto-generated with timestamp if not specified)"
+_LIST_EXPORT_FORMATS_HELP = "List available export formats and exit"
+
+
+def _add_hex_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--hex COLOR`` RGB shortcut argument."""
+    parser.add_argument("--hex", type=str, metavar="COLOR", help=_HEX_HELP)
+
+
+def _add_rgb_value_arg(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--value R G B`` integer RGB argument."""
+    parser.add_argument("--value", nargs=3, type=int, metavar=("R", "G", "B"), help=_RGB_VALUE_HELP)
+
+
+def _add_export_output_args(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--output FILE`` and ``--list-export-formats`` export arguments."""
+    parser.add_argument("--output", type=str, metavar="FILE", help=_EXPORT_OUTPUT_HELP)
+    parser.add_argument("--list-export-formats", action="store_true", help=_LIST_EXPORT_FORMATS_HELP)
+
+
+def _build_color_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``color`` subcommand and its arguments."""
     color_parser = subparsers.add_parser(
         "color",
-        help="Work with CSS colors",
+        help=_SUBCOMMAND_HELP["color"],
         description="Search and query CSS color database"
     )
     
@@ -217,34 +114,29 @@ Examples:
         metavar=("V1", "V2", "V3"),
         help="Color value tuple (RGB: r g b | HSL: h s l | LAB: L a b | LCH: L C h)"
     )
-    color_parser.add_argument(
-        "--hex",
-        type=str,
-        metavar="COLOR",
-        help="Hex color value (e.g., '#FF8040' or 'FF8040') - shortcut for RGB input"
-    )
+    _add_hex_arg(color_parser)
     color_parser.add_argument(
         "--space", 
-        choices=["rgb", "hsl", "lab", "lch"], 
+        choices=_COLOR_SPACE_CHOICES, 
         default="lab",
         help="Color space of the input value (default: lab)"
     )
     color_parser.add_argument(
         "--metric",
-        choices=["euclidean", "de76", "de94", "de2000", "cmc", "cmc21", "cmc11", "hyab"],
+        choices=_COLOR_METRIC_CHOICES,
         default="de2000",
         help="Distance metric for LAB space (default: de2000). 'cmc21'=CMC(2:1), 'cmc11'=CMC(1:1), 'hyab'=best for large differences"
     )
     color_parser.add_argument(
         "--cmc-l", 
         type=float, 
-        default=ColorConstants.CMC_L_DEFAULT, 
+        default=_CMC_L_DEFAULT, 
         help="CMC lightness parameter (default: 2.0)"
     )
     color_parser.add_argument(
         "--cmc-c", 
         type=float, 
-        default=ColorConstants.CMC_C_DEFAULT, 
+        default=_CMC_C_DEFAULT, 
         help="CMC chroma parameter (default: 1.0)"
     )
     color_parser.add_argument(
@@ -267,22 +159,14 @@ Examples:
         metavar="FORMAT",
         help="Export colors to file (formats: csv, json)"
     )
-    color_parser.add_argument(
-        "--output",
-        type=str,
-        metavar="FILE",
-        help="Output filename (auto-generated with timestamp if not specified)"
-    )
-    color_parser.add_argument(
-        "--list-export-formats",
-        action="store_true",
-        help="List available export formats and exit"
-    )
-    
-    # ==================== FILAMENT SUBCOMMAND ====================
+    _add_export_output_args(color_parser)
+
+
+def _build_filament_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``filament`` subcommand and its arguments."""
     filament_parser = subparsers.add_parser(
         "filament",
-        help="Work with 3D printing filaments",
+        help=_SUBCOMMAND_HELP["filament"],
         description="Search and query 3D printing filament database"
     )
     
@@ -291,35 +175,24 @@ Examples:
         action="store_true", 
         help="Find nearest filament to the given RGB color"
     )
-    filament_parser.add_argument(
-        "--value", 
-        nargs=3, 
-        type=int, 
-        metavar=("R", "G", "B"),
-        help="RGB color value (0-255 for each component)"
-    )
-    filament_parser.add_argument(
-        "--hex",
-        type=str,
-        metavar="COLOR",
-        help="Hex color value (e.g., '#FF8040' or 'FF8040') - shortcut for RGB input"
-    )
+    _add_rgb_value_arg(filament_parser)
+    _add_hex_arg(filament_parser)
     filament_parser.add_argument(
         "--metric",
-        choices=["euclidean", "de76", "de94", "de2000", "cmc", "hyab"],
+        choices=_FILAMENT_METRIC_CHOICES,
         default="de2000",
         help="Distance metric (default: de2000). 'hyab'=best for large/dissimilar color differences"
     )
     filament_parser.add_argument(
         "--cmc-l", 
         type=float, 
-        default=ColorConstants.CMC_L_DEFAULT, 
+        default=_CMC_L_DEFAULT, 
         help="CMC lightness parameter (default: 2.0)"
     )
     filament_parser.add_argument(
         "--cmc-c", 
         type=float, 
-        default=ColorConstants.CMC_C_DEFAULT, 
+        default=_CMC_C_DEFAULT, 
         help="CMC chroma parameter (default: 1.0)"
     )
     filament_parser.add_argument(
@@ -402,7 +275,7 @@ Examples:
     )
     filament_parser.add_argument(
         "--dual-color-mode",
-        choices=["first", "last", "mix"],
+        choices=_DUAL_COLOR_MODE_CHOICES,
         default="first",
         help="How to handle dual-color filaments: 'first' (default), 'last', or 'mix' (perceptual blend)"
     )
@@ -414,35 +287,27 @@ Examples:
         metavar="FORMAT",
         help="Export filtered filaments to file (formats: autoforge, csv, json)"
     )
-    filament_parser.add_argument(
-        "--output",
-        type=str,
-        metavar="FILE",
-        help="Output filename (auto-generated with timestamp if not specified)"
-    )
-    filament_parser.add_argument(
-        "--list-export-formats",
-        action="store_true",
-        help="List available export formats and exit"
-    )
-    
-    # ==================== CONVERT SUBCOMMAND ====================
+    _add_export_output_args(filament_parser)
+
+
+def _build_convert_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``convert`` subcommand and its arguments."""
     convert_parser = subparsers.add_parser(
         "convert",
-        help="Convert between color spaces",
+        help=_SUBCOMMAND_HELP["convert"],
         description="Convert colors between RGB, HSL, LAB, LCH, CMY, and CMYK spaces"
     )
     
     convert_parser.add_argument(
         "--from",
         dest="from_space",
-        choices=["rgb", "hsl", "lab", "lch", "cmy", "cmyk"],
+        choices=_CONVERT_SPACE_CHOICES,
         help="Source color space"
     )
     convert_parser.add_argument(
         "--to",
         dest="to_space",
-        choices=["rgb", "hsl", "lab", "lch", "cmy", "cmyk"],
+        choices=_CONVERT_SPACE_CHOICES,
         help="Target color space"
     )
     convert_parser.add_argument(
@@ -463,27 +328,18 @@ Examples:
         action="store_true", 
         help="Check if LAB/LCH color is in sRGB gamut (requires --value or --hex)"
     )
-    
-    # ==================== NAME SUBCOMMAND ====================
+
+
+def _build_name_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``name`` subcommand and its arguments."""
     name_parser = subparsers.add_parser(
         "name",
-        help="Generate descriptive color names from RGB values",
+        help=_SUBCOMMAND_HELP["name"],
         description="Generate intelligent, descriptive names for colors using perceptual analysis"
     )
     
-    name_parser.add_argument(
-        "--value",
-        nargs=3,
-        type=int,
-        metavar=("R", "G", "B"),
-        help="RGB color value (0-255 for each component)"
-    )
-    name_parser.add_argument(
-        "--hex",
-        type=str,
-        metavar="COLOR",
-        help="Hex color value (e.g., '#FF8040' or 'FF8040') - shortcut for RGB input"
-    )
+    _add_rgb_value_arg(name_parser)
+    _add_hex_arg(name_parser)
     name_parser.add_argument(
         "--threshold",
         type=float,
@@ -496,11 +352,13 @@ Examples:
         action="store_true",
         help="Show match type (exact/near/generated) in output"
     )
-    
-    # ==================== VALIDATE SUBCOMMAND ====================
+
+
+def _build_validate_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``validate`` subcommand and its arguments."""
     validate_parser = subparsers.add_parser(
         "validate",
-        help="Validate if a hex code matches a color name",
+        help=_SUBCOMMAND_HELP["validate"],
         description="""Validate color name/hex pairings using fuzzy matching and perceptual color distance (Delta E 2000).
         
         Note: For best fuzzy matching results, install the optional [fuzzy] extra:
@@ -532,44 +390,129 @@ Examples:
         action="store_true",
         help="Output results in JSON format"
     )
-    
-    # ==================== CVD SUBCOMMAND ====================
+
+
+def _build_cvd_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``cvd`` subcommand and its arguments."""
     cvd_parser = subparsers.add_parser(
         "cvd",
-        help="Color vision deficiency simulation and correction",
+        help=_SUBCOMMAND_HELP["cvd"],
         description="Simulate how colors appear with color blindness or apply corrections"
     )
     
-    cvd_parser.add_argument(
-        "--value",
-        nargs=3,
-        type=int,
-        metavar=("R", "G", "B"),
-        help="RGB color value (0-255 for each component)"
-    )
-    cvd_parser.add_argument(
-        "--hex",
-        type=str,
-        metavar="COLOR",
-        help="Hex color value (e.g., '#FF8040' or 'FF8040') - shortcut for RGB input"
-    )
+    _add_rgb_value_arg(cvd_parser)
+    _add_hex_arg(cvd_parser)
     cvd_parser.add_argument(
         "--type",
-        choices=["protanopia", "protan", "deuteranopia", "deutan", "tritanopia", "tritan", "all"],
+        choices=_CVD_TYPE_CHOICES,
         required=True,
         help="Type of color vision deficiency (protanopia=red-blind, deuteranopia=green-blind, tritanopia=blue-blind, all=combined universal)"
     )
     cvd_parser.add_argument(
         "--mode",
-        choices=["simulate", "correct"],
+        choices=_CVD_MODE_CHOICES,
         default="simulate",
         help="Mode: 'simulate' shows how colors appear to CVD individuals, 'correct' applies daltonization (default: simulate)"
     )
-    
-    # ==================== IMAGE SUBCOMMAND ====================
+    cvd_parser.add_argument(
+        "--values-file",
+        type=str,
+        metavar="FILE",
+        help="Transform every color in FILE, one per line as 'R,G,B' or hex (blank lines and lines starting with '# ' are skipped)"
+    )
+
+
+def _add_watermark_options(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--watermark-*`` source and styling options to the image parser."""
+    parser.add_argument(
+        "--watermark-text",
+        type=str,
+        help="Text to use for watermark (e.g., '© 2025 My Brand')"
+    )
+    parser.add_argument(
+        "--watermark-image",
+        type=str,
+        help="Path to image file to use as watermark (PNG recommended)"
+    )
+    parser.add_argument(
+        "--watermark-svg",
+        type=str,
+        help="Path to SVG file to use as watermark (requires cairosvg)"
+    )
+    parser.add_argument(
+        "--watermark-position",
+        type=str,
+        choices=_WATERMARK_POSITION_CHOICES,
+        default="bottom-right",
+        help="Position for watermark (default: bottom-right)"
+    )
+    parser.add_argument(
+        "--watermark-font-name",
+        type=str,
+        help="System font name for text watermark (e.g., 'Arial', 'Times New Roman')"
+    )
+    parser.add_argument(
+        "--watermark-font-file",
+        type=str,
+        help="Custom font file for text watermark (path or filename in fonts/ directory)"
+    )
+    parser.add_argument(
+        "--watermark-font-size",
+        type=int,
+        default=24,
+        help="Font size for text watermark in points (default: 24)"
+    )
+    parser.add_argument(
+        "--watermark-color",
+        type=str,
+        default="255,255,255",
+        help="Text color as R,G,B (default: 255,255,255 white)"
+    )
+    parser.add_argument(
+        "--watermark-stroke-color",
+        type=str,
+        help="Text outline color as R,G,B (e.g., 0,0,0 for black outline)"
+    )
+    parser.add_argument(
+        "--watermark-stroke-width",
+        type=int,
+        default=0,
+        help="Text outline width in pixels (default: 0, no outline)"
+    )
+    parser.add_argument(
+        "--watermark-opacity",
+        type=float,
+        default=0.8,
+        help="Watermark opacity from 0.0 (transparent) to 1.0 (opaque) (default: 0.8)"
+    )
+    parser.add_argument(
+        "--watermark-scale",
+        type=float,
+        default=1.0,
+        help="Scale factor for image/SVG watermark (default: 1.0)"
+    )
+    parser.add_argument(
+        "--watermark-margin",
+        type=int,
+        default=10,
+        help="Margin from edges in pixels for preset positions (default: 10)"
+    )
+
+
+def _build_image_parser(
+    subparsers: argparse._SubParsersAction,
+    with_watermark_options: bool = True,
+) -> None:
+    """
+    Register the ``image`` subcommand and its arguments.
+
+    The ``--watermark-*`` options are only read when ``--watermark`` is
+    given, so main() passes ``with_watermark_options=False`` when argv can't
+    contain any of them (see _wants_watermark_options).
+    """
     image_parser = subparsers.add_parser(
         "image",
-        help="Image color analysis and manipulation",
+        help=_SUBCOMMAND_HELP["image"],
         description="""Image processing operations:
         
 - Format Conversion: Convert between PNG, JPEG, WebP, HEIC, AVIF, etc.
@@ -610,13 +553,13 @@ Examples:
     image_parser.add_argument(
         "--cvd-simulate",
         type=str,
-        choices=["protanopia", "protan", "deuteranopia", "deutan", "tritanopia", "tritan", "all"],
+        choices=_CVD_TYPE_CHOICES,
         help="Simulate color vision deficiency (protanopia, deuteranopia, tritanopia, or all)"
     )
     image_parser.add_argument(
         "--cvd-correct",
         type=str,
-        choices=["protanopia", "protan", "deuteranopia", "deutan", "tritanopia", "tritan", "all"],
+        choices=_CVD_TYPE_CHOICES,
         help="Apply CVD correction to improve discriminability for specified deficiency (use 'all' for universal correction)"
     )
     
@@ -629,7 +572,7 @@ Examples:
     image_parser.add_argument(
         "--metric",
         type=str,
-        choices=["de2000", "de94", "de76", "cmc", "euclidean", "hsl_euclidean", "hyab"],
+        choices=_IMAGE_METRIC_CHOICES,
         default="de2000",
         help="Color distance metric for palette quantization (default: de2000). 'hyab'=best for large differences"
     )
@@ -664,79 +607,8 @@ Examples:
         action="store_true",
         help="Add a watermark to the image (use with --watermark-text, --watermark-image, or --watermark-svg)"
     )
-    image_parser.add_argument(
-        "--watermark-text",
-        type=str,
-        help="Text to use for watermark (e.g., '© 2025 My Brand')"
-    )
-    image_parser.add_argument(
-        "--watermark-image",
-        type=str,
-        help="Path to image file to use as watermark (PNG recommended)"
-    )
-    image_parser.add_argument(
-        "--watermark-svg",
-        type=str,
-        help="Path to SVG file to use as watermark (requires cairosvg)"
-    )
-    image_parser.add_argument(
-        "--watermark-position",
-        type=str,
-        choices=["top-left", "top-center", "top-right", "center-left", "center", "center-right", "bottom-left", "bottom-center", "bottom-right"],
-        default="bottom-right",
-        help="Position for watermark (default: bottom-right)"
-    )
-    image_parser.add_argument(
-        "--watermark-font-name",
-        type=str,
-        help="System font name for text watermark (e.g., 'Arial', 'Times New Roman')"
-    )
-    image_parser.add_argument(
-        "--watermark-font-file",
-        type=str,
-        help="Custom font file for text watermark (path or filename in fonts/ directory)"
-    )
-    image_parser.add_argument(
-        "--watermark-font-size",
-        type=int,
-        default=24,
-        help="Font size for text watermark in points (default: 24)"
-    )
-    image_parser.add_argument(
-        "--watermark-color",
-        type=str,
-        default="255,255,255",
-        help="Text color as R,G,B (default: 255,255,255 white)"
-    )
-    image_parser.add_argument(
-        "--watermark-stroke-color",
-        type=str,
-        help="Text outline color as R,G,B (e.g., 0,0,0 for black outline)"
-    )
-    image_parser.add_argument(
-        "--watermark-stroke-width",
-        type=int,
-        default=0,
-        help="Text outline width in pixels (default: 0, no outline)"
-    )
-    image_parser.add_argument(
-        "--watermark-opacity",
-        type=float,
-        default=0.8,
-        help="Watermark opacity from 0.0 (transparent) to 1.0 (opaque) (default: 0.8)"
-    )
-    image_parser.add_argument(
-        "--watermark-scale",
-        type=float,
-        default=1.0,
-        help="Scale factor for image/SVG watermark (default: 1.0)"
-    )
-    image_parser.add_argument(
-        "--watermark-margin",
-        type=int,
-        default=10,
-        help="Margin from edges in pixels for preset positions (default: 10)"
-    )
+    if with_watermark_options:
+        _add_watermark_options(image_parser)
     
     # List available palettes
     image_parser.add_argument(
@@ -764,9 +636,260 @@ Examples:
         help="Use lossy compression for WebP/AVIF instead of lossless (only with --convert)"
     )
 
+
+# Subcommand name -> function that registers its full argument set
+_SUBCOMMAND_BUILDERS = {
+    "color": _build_color_parser,
+    "filament": _build_filament_parser,
+    "convert": _build_convert_parser,
+    "name": _build_name_parser,
+    "validate": _build_validate_parser,
+    "cvd": _build_cvd_parser,
+    "image": _build_image_parser,
+}
+
+# Global options that consume the following token as their value. Skipped
+# when sniffing argv for the subcommand so e.g. ``--json color`` isn't
+# mistaken for the ``color`` subcommand.
+_GLOBAL_VALUE_OPTIONS = frozenset({"--json", "--log-file", "--log-level"})
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """
+    Find the subcommand in argv without running the full parser.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        The subcommand name, or None if no known subcommand is present or
+        -h/--help comes before it (top-level help needs the full parser)
+    """
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+        elif token in _GLOBAL_VALUE_OPTIONS:
+            skip_value = True
+        elif token in ("-h", "--help"):
+            return None
+        elif token in _SUBCOMMAND_BUILDERS:
+            return token
+    return None
+
+
+# Global verification/maintenance flags as (flag, help). They're rarely used,
+# so main() only registers them when argv might contain one (see
+# _wants_admin_flags); otherwise their dests just default to False.
+_ADMIN_FLAGS = (
+    ("--verify-constants", "Verify integrity of color science constants before proceeding"),
+    ("--verify-data", "Verify integrity of core data files (colors.json, filaments.json, maker_synonyms.json) before proceeding"),
+    ("--verify-matrices", "Verify integrity of transformation matrices before proceeding"),
+    ("--verify-all", "Verify integrity of constants, data files, matrices, and user data before proceeding"),
+    ("--verify-user-data", "Verify integrity of user data files (user/user-colors.json, user/user-filaments.json) against .sha256 files"),
+    ("--generate-user-hashes", "Generate .sha256 files for all user data files and exit"),
+    ("--check-overrides", "Show report of user overrides (user/user-colors.json, user/user-filaments.json) and exit"),
+)
+
+
+def _wants_admin_flags(argv: list[str]) -> bool:
+    """
+    Return True if any token in ``argv`` could be one of the _ADMIN_FLAGS.
+
+    Mirrors argparse's abbreviation rule (a token is a prefix of the flag), so
+    short forms like ``--che`` or ``--gen`` keep working. Over-matching is
+    harmless: it only costs registering the admin flags.
+    """
+    for token in argv:
+        name = token.split("=", 1)[0]
+        if len(name) > 2 and name.startswith("--"):
+            if any(flag.startswith(name) for flag, _ in _ADMIN_FLAGS):
+                return True
+    return False
+
+
+def _wants_watermark_options(argv: list[str]) -> bool:
+    """
+    Return True if ``argv`` needs the image subcommand's --watermark-* options.
+
+    That's any ``--w`` token (``--watermark`` itself, a watermark option, or an
+    abbreviation of one) or a help request, which should list them all.
+    """
+    return any(token.startswith("--w") or token in ("-h", "--help") for token in argv)
+
+
+# Examples shown at the end of top-level --help; $prog is the program name
+_EPILOG_TEMPLATE = Template("""
+Examples:
+  # Find nearest CSS color to an RGB value
+  $prog color --nearest --value 128 64 200 --space rgb
+  $prog color --nearest --hex "#8040C8"
+  
+  # Find color by name
+  $prog color --name "coral"
+  
+  # Generate descriptive name for an RGB color
+  $prog name --value 255 128 64
+  $prog name --hex "#FF8040"
+  
+  # Simulate color blindness
+  $prog cvd --value 255 0 0 --type protanopia --mode simulate
+  $prog cvd --hex "#FF0000" --type deutan --mode correct
+  
+  # Extract and redistribute luminance from image
+  $prog image --file photo.jpg --redistribute-luminance --colors 8
+  
+  # Convert image formats (WebP, PNG, JPEG, HEIC, AVIF, etc.)
+  $prog image --file photo.webp --convert png
+  $prog image --file photo.jpg --convert webp --quality 80 --lossy
+  
+  # Add watermarks to images
+  $prog image --file photo.jpg --watermark --watermark-text "© 2025 MyBrand"
+  $prog image --file photo.jpg --watermark --watermark-image logo.png --watermark-position top-right
+  
+  # Simulate colorblindness and convert to retro palettes
+  $prog image --file chart.png --cvd-simulate deuteranopia --output colorblind_view.png
+  $prog image --file photo.jpg --quantize-palette cga4 --dither --output retro.png
+  
+  # Find nearest filament to an RGB color
+  $prog filament --nearest --value 255 0 0
+  $prog filament --nearest --hex "#FF0000"
+  
+  # Find all PLA filaments from two different makers
+  $prog filament --type PLA --maker "Bambu Lab" "Sunlu"
+
+  # List all filament makers
+  $prog filament --list-makers
+  
+  # Convert between color spaces
+  $prog convert --from rgb --to lab --value 255 128 0
+  $prog convert --from rgb --to cmyk --value 255 128 0
+  $prog convert --from cmyk --to rgb --value 0 50 100 0
+  $prog convert --from rgb --to cmy --value 255 128 0
+
+  # Check if LAB color is in sRGB gamut
+  $prog convert --check-gamut --value 50 100 50
+  
+  # Show user file overrides
+  $prog --check-overrides
+        """)
+
+
+def build_parser(
+    command: str | None = None,
+    lazy: bool = False,
+    with_admin_flags: bool = True,
+    with_watermark_options: bool = True,
+) -> argparse.ArgumentParser:
+    """
+    Build and return the argument parser for color-tools.
+
+    Separated from main() so the wizard and tests can introspect available
+    choices (--space, --metric, --from, --to, etc.) without running the CLI.
+
+    Args:
+        command: Subcommand to build when ``lazy`` is True
+        lazy: If True, only build the arguments for ``command``. When ``command``
+              is None or unknown, every subcommand is registered as an
+              argument-less stub so top-level --help still lists them all.
+              argparse construction dominates CLI startup, so main() uses this
+              to skip registering arguments it will never parse.
+        with_admin_flags: If False, the --verify-*, --generate-user-hashes and
+              --check-overrides flags aren't registered and simply default
+              to False on the parsed namespace.
+        with_watermark_options: If False, the image subcommand is built
+              without its --watermark-* options.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    # Determine the proper program name based on how we were invoked
+    prog_name = get_program_name()
+
+    # The examples epilog only appears in top-level help, which argparse can
+    # only print when no subcommand was selected (-h, no arguments, or the
+    # print_help() fallback in main()). Skip building it otherwise.
+    epilog = None
+    if not lazy or command not in _SUBCOMMAND_BUILDERS:
+        epilog = _EPILOG_TEMPLATE.substitute(prog=prog_name)
+
+    parser = argparse.ArgumentParser(
+        prog=prog_name,
+        description="Color search and conversion tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog,
+    )
+    
+    # Global arguments (apply to all subcommands)
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+        help="Show version number and exit"
+    )
+    parser.add_argument(
+        "--json", 
+        type=str, 
+        metavar="DIR",
+        default=None,  # Will use default package data if None
+        help="Path to directory containing JSON data files (colors.json, filaments.json, maker_synonyms.json). Default: uses package data directory"
+    )
+    if with_admin_flags:
+        for flag, help_text in _ADMIN_FLAGS:
+            parser.add_argument(flag, action="store_true", help=help_text)
+    else:
+        parser.set_defaults(**{flag[2:].replace("-", "_"): False for flag, _ in _ADMIN_FLAGS})
+    parser.add_argument(
+        "--interactive", "-i",
+        action="store_true",
+        help="Launch the interactive wizard (guided prompts for color, filament, and convert commands)"
+    )
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        metavar="PATH",
+        default=None,
+        help="Write log output to this file (enables file logging; default: no file logging)"
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        metavar="LEVEL",
+        default="DEBUG",
+        choices=_LOG_LEVEL_CHOICES,
+        help="Minimum log level written to the log file (default: DEBUG)"
+    )
+
+    # Create subparsers for the main commands
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    if not lazy:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+    elif command == "image":
+        _build_image_parser(subparsers, with_watermark_options)
+    elif command in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for name, help_text in _SUBCOMMAND_HELP.items():
+            subparsers.add_parser(name, help=help_text, add_help=False)
+
     return parser
 
 
+# Subcommand name -> (handler name, whether it takes the --json data directory).
+# Handlers are looked up by name at dispatch so only the one that runs is imported.
+_COMMAND_HANDLERS = {
+    "color": ("handle_color_command", True),
+    "filament": ("handle_filament_command", True),
+    "convert": ("handle_convert_command", False),
+    "name": ("handle_name_command", False),
+    "validate": ("handle_validate_command", False),
+    "cvd": ("handle_cvd_command", False),
+    "image": ("handle_image_command", False),
+}
+
+
 def main():
     """
     Main entry point for the CLI.
@@ -780,7 +903,14 @@ def main():
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-    parser = build_parser()
+    argv = sys.argv[1:]
+    command = _sniff_command(argv)
+    parser = build_parser(
+        command,
+        lazy=True,
+        with_admin_flags=command is None or _wants_admin_flags(argv),
+        with_watermark_options=_wants_watermark_options(argv),
+    )
 
     # Parse arguments
     args = parser.parse_args()
@@ -820,39 +950,24 @@ def main():
     json_path = None
     if args.json:
         json_path = Path(args.json)
-        if not json_path.exists():
+        # One stat answers both "does it exist" and "is it a directory"
+        try:
+            st = os.stat(json_path)
+        except FileNotFoundError:
             print(f"Error: JSON directory does not exist: {json_path}")
             sys.exit(1)
-        if not json_path.is_dir():
+        except OSError as e:
+            print(f"Error: Cannot access JSON directory: {json_path} ({e.strerror})")
+            sys.exit(1)
+        if not stat.S_ISDIR(st.st_mode):
             print(f"Error: --json must be a directory containing colors.json, filaments.json, and maker_synonyms.json")
             print(f"Provided path is not a directory: {json_path}")
             sys.exit(1)
     
-    # ==================== COLOR COMMAND HANDLER ====================
-    if args.command == "color":
-        handle_color_command(args, json_path)
-    
-    # ==================== FILAMENT COMMAND HANDLER ====================
-    elif args.command == "filament":
-        handle_filament_command(args, json_path)
-    
-    # ==================== CONVERT COMMAND HANDLER ====================
-    elif args.command == "convert":
-        handle_convert_command(args)
-    
-    # ==================== NAME COMMAND HANDLER ====================
-    elif args.command == "name":
-        handle_name_command(args)
-    
-    # ==================== VALIDATE COMMAND HANDLER ====================
-    elif args.command == "validate":
-        handle_validate_command(args)
-    
-    # ==================== CVD COMMAND HANDLER ====================
-    elif args.command == "cvd":
-        handle_cvd_command(args)
-    
-    # ==================== IMAGE COMMAND HANDLER ====================
-    elif args.command == "image":
-        handle_image_command(args)
-        sys.exit(0)
+    # Dispatch to the subcommand's handler
+    handler_name, takes_json_path = _COMMAND_HANDLERS[args.command]
+    handler = getattr(handlers, handler_name)
+    if takes_json_path:
+        handler(args, json_path)
+    else:
+        handler(args)
@@ -1,14 +1,6 @@
 """CLI package for color_tools."""
 
-from .handlers import (
-    handle_name_command,
-    handle_validate_command,
-    handle_cvd_command,
-    handle_color_command,
-    handle_filament_command,
-    handle_convert_command,
-    handle_image_command,
-)
+from . import handlers
 from .utils import (
     validate_color_input_exclusivity,
     get_rgb_from_args,
@@ -16,6 +8,7 @@ from .utils import (
     is_valid_lab,
     is_valid_lch,
     get_program_name,
+    exit_with_error,
 )
 from .reporting import (
     show_override_report,
@@ -40,9 +33,17 @@ __all__ = [
     "is_valid_lab",
     "is_valid_lch",
     "get_program_name",
+    "exit_with_error",
     # Reporting
     "show_override_report",
     "generate_user_hashes",
     "get_available_palettes",
     "handle_verification_flags",
 ]
+
+
+def __getattr__(name: str):
+    # Handlers are re-exported lazily; see cli_commands.handlers
+    if name in handlers.__all__:
+        return getattr(handlers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,33 @@
-"""Command handlers for color_tools CLI."""
-
-from .name import handle_name_command
-from .validate import handle_validate_command
-from .cvd import handle_cvd_command
-from .color import handle_color_command
-from .filament import handle_filament_command
-from .convert import handle_convert_command
-from .image import handle_image_command
-
-__all__ = [
-    "handle_name_command",
-    "handle_validate_command",
-    "handle_cvd_command",
-    "handle_color_command",
-    "handle_filament_command",
-    "handle_convert_command",
-    "handle_image_command",
-]
+"""Command handlers for color_tools CLI.
+
+Handlers are imported on first access (PEP 562 module ``__getattr__``), so
+the CLI only loads the module for the subcommand it actually runs.
+"""
+
+import importlib
+
+# Handler name -> submodule that defines it
+_HANDLER_MODULES = {
+    "handle_name_command": "name",
+    "handle_validate_command": "validate",
+    "handle_cvd_command": "cvd",
+    "handle_color_command": "color",
+    "handle_filament_command": "filament",
+    "handle_convert_command": "convert",
+    "handle_image_command": "image",
+}
+
+__all__ = list(_HANDLER_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = handler  # Cache so later lookups skip __getattr__
+    return handler
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
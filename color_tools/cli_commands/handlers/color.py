@@ -4,13 +4,31 @@ import sys
 from argparse import Namespace
 from pathlib import Path
 
-from ..utils import parse_hex_or_exit, is_valid_lab, is_valid_lch
+from ..utils import parse_hex_or_exit, is_valid_lab, is_valid_lch, exit_with_error
 from ...constants import ColorConstants
 from ...palette import Palette, load_colors, load_palette
 from ...export import export_colors, list_export_formats
 from ..reporting import get_available_palettes
 
 
+# Hex/RGB/HSL/LAB/LCH report lines, %-formatted from _detail_values()
+_DETAIL_LINES = (
+    "Hex:  %s",
+    "RGB:  %s",
+    "HSL:  (%.1f°, %.1f%%, %.1f%%)",
+    "LAB:  (%.2f, %.2f, %.2f)",
+    "LCH:  (%.2f, %.2f, %.1f°)",
+)
+_DETAILS_FMT = "".join(f"{line}\n" for line in _DETAIL_LINES)
+# One ranked --count N entry: header line plus the indented detail block
+_RANKED_FMT = "\n%d. %s (distance=%.2f)\n" + "".join(f"   {line}\n" for line in _DETAIL_LINES)
+
+
+def _detail_values(rec) -> tuple:
+    """Values for the detail lines of a color record, in _DETAIL_LINES order."""
+    return (rec.hex, rec.rgb, *rec.hsl, *rec.lab, *rec.lch)
+
+
 def handle_color_command(args: Namespace, json_path: "Path | str | None" = None) -> None:
     """
     Handle the 'color' command - search and query CSS colors.
@@ -26,8 +44,7 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
     """
     # Validate mutual exclusivity of --value and --hex
     if args.value is not None and args.hex is not None:
-        print("Error: Cannot specify both --value and --hex", file=sys.stderr)
-        sys.exit(2)
+        exit_with_error(2, "Error: Cannot specify both --value and --hex")
     
     # Load color palette (either custom retro palette or default CSS colors)
     if args.palette:
@@ -49,15 +66,14 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
         try:
             palette = load_palette(args.palette, json_path)
         except FileNotFoundError as e:
-            print(f"Error: {e}", file=sys.stderr)
+            lines = [f"Error: {e}"]
             available_palettes = get_available_palettes(json_path)
             if available_palettes:
                 palette_names = [name for name, _ in available_palettes]
-                print(f"Available palettes: {', '.join(palette_names)}", file=sys.stderr)
-            sys.exit(1)
+                lines.append(f"Available palettes: {', '.join(palette_names)}")
+            exit_with_error(1, *lines)
         except ValueError as e:
-            print(f"Error loading palette: {e}", file=sys.stderr)
-            sys.exit(1)
+            exit_with_error(1, f"Error loading palette: {e}")
     else:
         palette = Palette(load_colors(json_path))
     
@@ -75,8 +91,7 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
             output_path = export_colors(palette.records, args.export, args.output)
             print(f"✓ Exported {len(palette.records)} color(s) to {output_path}")
         except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
+            exit_with_error(1, f"Error: {e}")
         sys.exit(0)
     
     if args.name:
@@ -84,18 +99,12 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
         if not rec:
             print(f"Color '{args.name}' not found")
             sys.exit(1)
-        print(f"Name: {rec.name} [from {rec.source}]")
-        print(f"Hex:  {rec.hex}")
-        print(f"RGB:  {rec.rgb}")
-        print(f"HSL:  ({rec.hsl[0]:.1f}°, {rec.hsl[1]:.1f}%, {rec.hsl[2]:.1f}%)")
-        print(f"LAB:  ({rec.lab[0]:.2f}, {rec.lab[1]:.2f}, {rec.lab[2]:.2f})")
-        print(f"LCH:  ({rec.lch[0]:.2f}, {rec.lch[1]:.2f}, {rec.lch[2]:.1f}°)")
+        sys.stdout.write(f"Name: {rec.name} [from {rec.source}]\n" + _DETAILS_FMT % _detail_values(rec))
         sys.exit(0)
     
     if args.nearest:
         if args.value is None and args.hex is None:
-            print("Error: --nearest requires either --value or --hex", file=sys.stderr)
-            sys.exit(2)
+            exit_with_error(2, "Error: --nearest requires either --value or --hex")
         
         # Determine the color value and space
         val: tuple[float, float, float]
@@ -108,8 +117,7 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
                 val = (float(rgb_val[0]), float(rgb_val[1]), float(rgb_val[2]))
                 space = "rgb"  # --hex always implies RGB space
             except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                sys.exit(2)
+                exit_with_error(2, f"Error: {e}")
         else:
             # Handle --value input
             val = (float(args.value[0]), float(args.value[1]), float(args.value[2]))
@@ -117,15 +125,19 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
             
             # Validate LAB/LCH ranges if applicable
             if space == "lab" and not is_valid_lab(val):
-                print(f"Error: LAB values appear out of range: {val}", file=sys.stderr)
-                print(f"Expected: L* (0-{ColorConstants.XYZ_SCALE_FACTOR}), a* ({ColorConstants.AB_MIN}-{ColorConstants.AB_MAX}), b* ({ColorConstants.AB_MIN}-{ColorConstants.AB_MAX})", file=sys.stderr)
-                print("Tip: Use --space rgb or --hex for RGB input", file=sys.stderr)
-                sys.exit(2)
+                exit_with_error(
+                    2,
+                    f"Error: LAB values appear out of range: {val}",
+                    f"Expected: L* (0-{ColorConstants.XYZ_SCALE_FACTOR}), a* ({ColorConstants.AB_MIN}-{ColorConstants.AB_MAX}), b* ({ColorConstants.AB_MIN}-{ColorConstants.AB_MAX})",
+                    "Tip: Use --space rgb or --hex for RGB input",
+                )
             elif space == "lch" and not is_valid_lch(val):
-                print(f"Error: LCH values appear out of range: {val}", file=sys.stderr)
-                print(f"Expected: L* (0-{ColorConstants.XYZ_SCALE_FACTOR}), C* ({ColorConstants.CHROMA_MIN}-{ColorConstants.CHROMA_MAX}), h° (0-{ColorConstants.HUE_CIRCLE_DEGREES})", file=sys.stderr)
-                print("Tip: Use --space rgb or --hex for RGB input", file=sys.stderr)
-                sys.exit(2)
+                exit_with_error(
+                    2,
+                    f"Error: LCH values appear out of range: {val}",
+                    f"Expected: L* (0-{ColorConstants.XYZ_SCALE_FACTOR}), C* ({ColorConstants.CHROMA_MIN}-{ColorConstants.CHROMA_MAX}), h° (0-{ColorConstants.HUE_CIRCLE_DEGREES})",
+                    "Tip: Use --space rgb or --hex for RGB input",
+                )
         
         # Use the determined color space
         if args.count > 1:
@@ -138,14 +150,11 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
                 cmc_l=args.cmc_l,
                 cmc_c=args.cmc_c,
             )
-            print(f"Top {len(results)} nearest colors:")
+            # Build the whole report and write it once rather than per line
+            out = [f"Top {len(results)} nearest colors:\n"]
             for i, (rec, d) in enumerate(results, 1):
-                print(f"\n{i}. {rec.name} (distance={d:.2f})")
-                print(f"   Hex:  {rec.hex}")
-                print(f"   RGB:  {rec.rgb}")
-                print(f"   HSL:  ({rec.hsl[0]:.1f}°, {rec.hsl[1]:.1f}%, {rec.hsl[2]:.1f}%)")
-                print(f"   LAB:  ({rec.lab[0]:.2f}, {rec.lab[1]:.2f}, {rec.lab[2]:.2f})")
-                print(f"   LCH:  ({rec.lch[0]:.2f}, {rec.lch[1]:.2f}, {rec.lch[2]:.1f}°)")
+                out.append(_RANKED_FMT % (i, rec.name, d, *_detail_values(rec)))
+            sys.stdout.write("".join(out))
         else:
             # Single result (backward compatibility)
             rec, d = palette.nearest_color(
@@ -155,14 +164,11 @@ def handle_color_command(args: Namespace, json_path: "Path | str | None" = None)
                 cmc_l=args.cmc_l,
                 cmc_c=args.cmc_c,
             )
-            print(f"Nearest color: {rec.name} (distance={d:.2f}) [from {rec.source}]")
-            print(f"Hex:  {rec.hex}")
-            print(f"RGB:  {rec.rgb}")
-            print(f"HSL:  ({rec.hsl[0]:.1f}°, {rec.hsl[1]:.1f}%, {rec.hsl[2]:.1f}%)")
-            print(f"LAB:  ({rec.lab[0]:.2f}, {rec.lab[1]:.2f}, {rec.lab[2]:.2f})")
-            print(f"LCH:  ({rec.lch[0]:.2f}, {rec.lch[1]:.2f}, {rec.lch[2]:.1f}°)")
+            sys.stdout.write(
+                f"Nearest color: {rec.name} (distance={d:.2f}) [from {rec.source}]\n"
+                + _DETAILS_FMT % _detail_values(rec)
+            )
         sys.exit(0)
     
     # If we get here, no valid color operation was specified
-    print("Error: No operation specified. Use --name, --nearest, --export, or --list-export-formats", file=sys.stderr)
-    sys.exit(2)
+    exit_with_error(2, "Error: No operation specified. Use --name, --nearest, --export, or --list-export-formats")
@@ -18,6 +18,24 @@ _FOUR_COMPONENT_SPACES = {"cmyk"}
 # Color spaces that require exactly 3 input components
 _THREE_COMPONENT_SPACES = {"rgb", "hsl", "lab", "lch", "cmy"}
 
+# Every conversion goes through RGB: source space -> RGB, then RGB -> target space
+_TO_RGB = {
+    "rgb": lambda v: (int(v[0]), int(v[1]), int(v[2])),
+    "hsl": hsl_to_rgb,
+    "lab": lab_to_rgb,
+    "lch": lch_to_rgb,
+    "cmy": cmy_to_rgb,
+    "cmyk": cmyk_to_rgb,
+}
+_FROM_RGB = {
+    "rgb": lambda rgb: rgb,
+    "hsl": rgb_to_hsl,
+    "lab": rgb_to_lab,
+    "lch": rgb_to_lch,
+    "cmy": rgb_to_cmy,
+    "cmyk": rgb_to_cmyk,
+}
+
 
 def handle_convert_command(args: Namespace) -> None:
     """
@@ -45,6 +63,9 @@ def handle_convert_command(args: Namespace) -> None:
             try:
                 rgb_val = parse_hex_or_exit(args.hex)
                 lab = rgb_to_lab(rgb_val)
+                # Any 8-bit sRGB color is in the sRGB gamut by definition, so
+                # the LAB -> RGB round trip in is_in_srgb_gamut() is skipped
+                in_gamut = True
             except ValueError as e:
                 print(f"Error: {e}", file=sys.stderr)
                 sys.exit(2)
@@ -60,8 +81,8 @@ def handle_convert_command(args: Namespace) -> None:
                 lab = lch_to_lab(val)
             else:
                 lab = val
+            in_gamut = is_in_srgb_gamut(lab)
         
-        in_gamut = is_in_srgb_gamut(lab)
         print(f"LAB({lab[0]:.2f}, {lab[1]:.2f}, {lab[2]:.2f}) is {'IN' if in_gamut else 'OUT OF'} sRGB gamut")
         
         if not in_gamut:
@@ -114,39 +135,16 @@ def handle_convert_command(args: Namespace) -> None:
 
             val = tuple(float(v) for v in args.value)
 
-        # ------ Convert source space → RGB (intermediate) ------
-        if from_space == "rgb":
-            rgb = (int(val[0]), int(val[1]), int(val[2]))
-        elif from_space == "hsl":
-            rgb = hsl_to_rgb(val)
-        elif from_space == "lab":
-            rgb = lab_to_rgb(val)
-        elif from_space == "lch":
-            rgb = lch_to_rgb(val)
-        elif from_space == "cmy":
-            rgb = cmy_to_rgb(val)
-        elif from_space == "cmyk":
-            rgb = cmyk_to_rgb(val)
-        else:
+        # ------ Convert source space → RGB (intermediate) → target space ------
+        to_rgb = _TO_RGB.get(from_space)
+        if to_rgb is None:
             print(f"Error: Unsupported source space '{from_space}'", file=sys.stderr)
             sys.exit(2)
-
-        # ------ Convert RGB → target space ------
-        if to_space == "rgb":
-            result = rgb
-        elif to_space == "hsl":
-            result = rgb_to_hsl(rgb)
-        elif to_space == "lab":
-            result = rgb_to_lab(rgb)
-        elif to_space == "lch":
-            result = rgb_to_lch(rgb)
-        elif to_space == "cmy":
-            result = rgb_to_cmy(rgb)
-        elif to_space == "cmyk":
-            result = rgb_to_cmyk(rgb)
-        else:
+        from_rgb = _FROM_RGB.get(to_space)
+        if from_rgb is None:
             print(f"Error: Unsupported target space '{to_space}'", file=sys.stderr)
             sys.exit(2)
+        result = from_rgb(to_rgb(val))
 
         print(f"Converted {from_space.upper()}{val} -> {to_space.upper()}{result}")
         sys.exit(0)
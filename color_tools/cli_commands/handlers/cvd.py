@@ -3,8 +3,74 @@
 import sys
 from argparse import Namespace
 
-from ..utils import parse_hex_or_exit
+from ..utils import get_rgb_from_args
 from ...color_deficiency import simulate_cvd, correct_cvd
+from ...conversions import hex_to_rgb
+
+# --type value -> descriptive name shown in the output
+_DEFICIENCY_NAMES = {
+    "protanopia": "protanopia (red-blind)",
+    "protan": "protanopia (red-blind)",
+    "deuteranopia": "deuteranopia (green-blind)",
+    "deutan": "deuteranopia (green-blind)",
+    "tritanopia": "tritanopia (blue-blind)",
+    "tritan": "tritanopia (blue-blind)",
+    "all": "all types (protanopia + deuteranopia + tritanopia)"
+}
+
+
+def _read_values_file(path: str) -> list[tuple[int, int, int]]:
+    """
+    Read one color per line ('R,G,B', 'R G B' or hex) from a --values-file.
+    
+    Blank lines and '# ' comment lines are skipped ('#RGB' is still read as
+    hex). Exits with code 2 naming the offending line if a color is invalid.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError as e:
+        print(f"Error: Cannot read values file: {e}", file=sys.stderr)
+        sys.exit(2)
+    
+    colors: list[tuple[int, int, int]] = []
+    for lineno, line in enumerate(lines, 1):
+        text = line.strip()
+        if not text or text.startswith("# "):
+            continue
+        parts = text.replace(",", " ").split()
+        rgb = None
+        if len(parts) == 3:
+            try:
+                values = tuple(int(p) for p in parts)
+            except ValueError:
+                values = None
+            if values is not None and all(0 <= v <= 255 for v in values):
+                rgb = values
+        elif len(parts) == 1:
+            rgb = hex_to_rgb(parts[0])
+        if rgb is None:
+            print(f"Error: {path}:{lineno}: invalid color '{text}' (expected R,G,B with values 0-255 or hex)", file=sys.stderr)
+            sys.exit(2)
+        colors.append(rgb)  # type: ignore[arg-type]
+    return colors
+
+
+def _handle_values_file(args: Namespace, path: str) -> None:
+    """Transform every color in a --values-file and print one result per line."""
+    colors = _read_values_file(path)
+    transform = simulate_cvd if args.mode == "simulate" else correct_cvd
+    
+    # Files often repeat colors; transform each distinct color only once
+    results: dict[tuple[int, int, int], tuple[int, int, int]] = {}
+    out = [f"Mode: {args.mode}\n", f"Type: {_DEFICIENCY_NAMES[args.type.lower()]}\n"]
+    for rgb in colors:
+        result = results.get(rgb)
+        if result is None:
+            result = results[rgb] = transform(rgb, args.type)
+        out.append(f"({rgb[0]}, {rgb[1]}, {rgb[2]}) -> ({result[0]}, {result[1]}, {result[2]})\n")
+    sys.stdout.write("".join(out))
+    sys.exit(0)
 
 
 def handle_cvd_command(args: Namespace) -> None:
@@ -23,26 +89,15 @@ def handle_cvd_command(args: Namespace) -> None:
         print("Error: Cannot specify both --value and --hex", file=sys.stderr)
         sys.exit(2)
     
-    if args.value is None and args.hex is None:
-        print("Error: CVD command requires either --value or --hex", file=sys.stderr)
-        sys.exit(2)
-    
-    # Handle hex input
-    if args.hex is not None:
-        try:
-            r, g, b = parse_hex_or_exit(args.hex)
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(2)
-    else:
-        # Handle --value input
-        r, g, b = args.value
-        # Validate RGB values
-        if not all(0 <= v <= 255 for v in [r, g, b]):
-            print("Error: RGB values must be in range 0-255")
+    values_file = getattr(args, "values_file", None)
+    if values_file is not None:
+        if args.value is not None or args.hex is not None:
+            print("Error: Cannot combine --values-file with --value or --hex", file=sys.stderr)
             sys.exit(2)
+        _handle_values_file(args, values_file)
     
-    rgb = (r, g, b)
+    rgb = get_rgb_from_args(args, "CVD command requires either --value, --hex or --values-file")
+    r, g, b = rgb
     
     # Apply transformation based on mode
     if args.mode == "simulate":
@@ -53,16 +108,7 @@ def handle_cvd_command(args: Namespace) -> None:
         action = "corrected for"
     
     # Format deficiency type name
-    deficiency_names = {
-        "protanopia": "protanopia (red-blind)",
-        "protan": "protanopia (red-blind)",
-        "deuteranopia": "deuteranopia (green-blind)",
-        "deutan": "deuteranopia (green-blind)",
-        "tritanopia": "tritanopia (blue-blind)",
-        "tritan": "tritanopia (blue-blind)",
-        "all": "all types (protanopia + deuteranopia + tritanopia)"
-    }
-    deficiency = deficiency_names[args.type.lower()]
+    deficiency = _DEFICIENCY_NAMES[args.type.lower()]
     
     # Output result
     print(f"Input RGB:  ({r}, {g}, {b})")
@@ -34,29 +34,33 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
     if hasattr(args, 'dual_color_mode'):
         set_dual_color_mode(args.dual_color_mode)
     
-    # Load filament palette with maker synonyms and owned filaments
-    filament_palette = FilamentPalette.load_default()
+    # Load filament palette with maker synonyms and owned filaments on first
+    # use, so --list-export-formats and input errors skip the database parse
+    cached_palette = None
+
+    def _palette() -> FilamentPalette:
+        nonlocal cached_palette
+        if cached_palette is None:
+            cached_palette = FilamentPalette.load_default()
+        return cached_palette
     
     # Handle --list-owned
     if hasattr(args, 'list_owned') and args.list_owned:
-        owned = filament_palette.list_owned()
+        owned = _palette().list_owned()
         if not owned:
             print("No owned filaments configured")
             print(f"Add filaments with: color-tools filament --add-owned <ID>")
             sys.exit(0)
         
-        print(f"Owned filaments ({len(owned)}):")
-        for rec in owned:
-            print(f"  ID: {rec.id}")
-            print(f"      {rec}")
-            print()
+        sys.stdout.write(f"Owned filaments ({len(owned)}):\n")
+        sys.stdout.writelines(f"  ID: {rec.id}\n      {rec}\n\n" for rec in owned)
         sys.exit(0)
     
     # Handle --add-owned
     if hasattr(args, 'add_owned') and args.add_owned:
         try:
-            filament_palette.add_owned(args.add_owned, json_path)
-            filament = filament_palette.get_filament_by_id(args.add_owned)
+            _palette().add_owned(args.add_owned, json_path)
+            filament = _palette().get_filament_by_id(args.add_owned)
             print(f"✓ Added to owned list: {filament}")
             print(f"  ID: {args.add_owned}")
         except ValueError as e:
@@ -67,8 +71,8 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
     # Handle --remove-owned
     if hasattr(args, 'remove_owned') and args.remove_owned:
         try:
-            filament = filament_palette.get_filament_by_id(args.remove_owned)
-            filament_palette.remove_owned(args.remove_owned, json_path)
+            filament = _palette().get_filament_by_id(args.remove_owned)
+            _palette().remove_owned(args.remove_owned, json_path)
             print(f"✓ Removed from owned list: {filament}")
             print(f"  ID: {args.remove_owned}")
         except ValueError as e:
@@ -84,30 +88,26 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
     # Handle --list-export-formats
     if args.list_export_formats:
         formats = list_export_formats('filaments')
-        print("Available export formats for filaments:")
-        for name, description in formats.items():
-            print(f"  {name:12s} - {description}")
+        sys.stdout.write("Available export formats for filaments:\n")
+        sys.stdout.writelines(f"  {name:12s} - {description}\n" for name, description in formats.items())
         sys.exit(0)
     
     if args.list_makers:
-        print("Available makers:")
-        for maker in filament_palette.makers:
-            count = len(filament_palette.find_by_maker(maker))
-            print(f"  {maker} ({count} filaments)")
+        lines = ["Available makers:"]
+        lines.extend(f"  {name} ({count} filaments)" for name, count in _palette().group_counts("maker"))
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.exit(0)
     
     if args.list_types:
-        print("Available types:")
-        for type_name in filament_palette.types:
-            count = len(filament_palette.find_by_type(type_name))
-            print(f"  {type_name} ({count} filaments)")
+        lines = ["Available types:"]
+        lines.extend(f"  {name} ({count} filaments)" for name, count in _palette().group_counts("type"))
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.exit(0)
     
     if args.list_finishes:
-        print("Available finishes:")
-        for finish in filament_palette.finishes:
-            count = len(filament_palette.find_by_finish(finish))
-            print(f"  {finish} ({count} filaments)")
+        lines = ["Available finishes:"]
+        lines.extend(f"  {name} ({count} filaments)" for name, count in _palette().group_counts("finish"))
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.exit(0)
     
     if args.nearest:
@@ -139,7 +139,7 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
             
             if args.count > 1:
                 # Multiple results
-                results = filament_palette.nearest_filaments(
+                results = _palette().nearest_filaments(
                     rgb_val,
                     metric=args.metric,
                     count=args.count,
@@ -150,13 +150,13 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
                     cmc_l=args.cmc_l,
                     cmc_c=args.cmc_c,
                 )
-                print(f"Top {len(results)} nearest filaments:")
-                for i, (rec, d) in enumerate(results, 1):
-                    print(f"\n{i}. (distance={d:.2f})")
-                    print(f"   {rec}")
+                sys.stdout.write(f"Top {len(results)} nearest filaments:\n")
+                sys.stdout.writelines(
+                    f"\n{i}. (distance={d:.2f})\n   {rec}\n" for i, (rec, d) in enumerate(results, 1)
+                )
             else:
                 # Single result (backward compatibility)
-                rec, d = filament_palette.nearest_filament(
+                rec, d = _palette().nearest_filament(
                     rgb_val,
                     metric=args.metric,
                     maker=maker_filter,
@@ -176,7 +176,7 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
     if args.maker or args.type or args.finish or args.color or args.export:
         # Filter filaments (or get all if no filters and exporting)
         if args.maker or args.type or args.finish or args.color:
-            results = filament_palette.filter(
+            results = _palette().filter(
                 maker=args.maker,
                 type_name=args.type,
                 finish=args.finish,
@@ -186,11 +186,11 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
         elif args.export:
             # Export: respect owned filtering unless --all-filaments
             if owned_filter is False:
-                results = filament_palette.records  # All filaments
+                results = _palette().records  # All filaments
             else:
-                results = filament_palette.filter(owned=owned_filter)  # Owned or auto-detect
+                results = _palette().filter(owned=owned_filter)  # Owned or auto-detect
         else:
-            results = filament_palette.filter(
+            results = _palette().filter(
                 maker=args.maker,
                 type_name=args.type,
                 finish=args.finish,
@@ -213,9 +213,8 @@ def handle_filament_command(args: Namespace, json_path: "Path | str | None" = No
             sys.exit(0)
         
         # Display results if not exporting
-        print(f"Found {len(results)} filament(s):")
-        for rec in results:
-            print(f"  {rec}")
+        sys.stdout.write(f"Found {len(results)} filament(s):\n")
+        sys.stdout.writelines(f"  {rec}\n" for rec in results)
         sys.exit(0)
     
     # If we get here, no valid filament operation was specified
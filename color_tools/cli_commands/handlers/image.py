@@ -10,40 +10,387 @@ Handles all image subcommands:
 - Palette Quantization: Convert images to retro palettes (CGA, EGA, VGA, etc.) with dithering
 """
 
+import importlib.util
+import os
+import re
 import sys
+from argparse import Namespace
+from dataclasses import dataclass
 from pathlib import Path
-
-# Image analysis is optional (requires Pillow)
-try:
-    from ...image import (
-        extract_unique_colors,
-        redistribute_luminance,
-        format_color_change_report,
-        simulate_cvd_image,
-        correct_cvd_image,
-        quantize_image_to_palette,
-        quantize_image_hyab,
-        add_text_watermark,
-        add_image_watermark,
-        add_svg_watermark,
-        convert_image,
-    )
-    IMAGE_AVAILABLE = True
-except ImportError:
-    IMAGE_AVAILABLE = False
+from typing import TYPE_CHECKING
 
 from ...palette import load_palette
 from ..reporting import get_available_palettes
+from ..utils import exit_with_error
 
+if TYPE_CHECKING:
+    from PIL import Image
 
-def handle_image_command(args):
-    """Handle all image processing commands."""
-    if not IMAGE_AVAILABLE:
-        print("Error: Image processing requires Pillow", file=sys.stderr)
-        print("Install with: pip install color-match-tools[image]", file=sys.stderr)
-        sys.exit(1)
+
+# Output file suffixes (lowercased) that are saved as JPEG
+_JPEG_SUFFIXES = frozenset({".jpg", ".jpeg"})
+
+# "R,G,B" color argument, e.g. "255, 128, 0"
+_RGB_TRIPLE = re.compile(r"^\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*$")
+
+
+def _parse_rgb_triple(value: str, field_name: str, example: str = "255,255,255") -> tuple[int, int, int]:
+    """
+    Parse an "R,G,B" command-line color, exiting with an error if invalid.
+
+    Args:
+        value: Color string such as "255,255,255"
+        field_name: Option name used in the error message (e.g. "--watermark-color")
+        example: Example value shown in the usage hint
+
+    Returns:
+        RGB tuple (r, g, b) with values 0-255
+
+    Raises:
+        SystemExit: If the value isn't three comma-separated integers in 0-255
+    """
+    match = _RGB_TRIPLE.match(value)
+    if match is None:
+        error = "Color must have 3 components (R,G,B)"
+    else:
+        r, g, b = (int(c) for c in match.groups())
+        if r <= 255 and g <= 255 and b <= 255:
+            return r, g, b
+        error = "Color components must be in range 0-255"
+    exit_with_error(
+        1,
+        f"Error: Invalid {field_name} format: {error}",
+        f"Use format: R,G,B (e.g., {example})",
+    )
+
+
+def _image_available() -> bool:
+    """
+    Check whether Pillow is installed without importing it.
+
+    find_spec() only locates the package, so non-image commands never pay
+    for loading Pillow (or numpy, which color_tools.image pulls in with it).
+    """
+    return importlib.util.find_spec("PIL") is not None
+
+
+def _exit_pillow_missing() -> None:
+    """Print the Pillow install hint and exit with status 1."""
+    exit_with_error(
+        1,
+        "Error: Image processing requires Pillow",
+        "Install with: pip install color-match-tools[image]",
+    )
+
+
+def _default_output_path(image_path: Path, tag: str) -> Path:
+    """Return ``<stem>_<tag><suffix>`` next to the input image."""
+    return image_path.with_name(f"{image_path.stem}_{tag}{image_path.suffix}")
+
+
+def _flatten_for_jpeg(img: "Image.Image") -> "Image.Image":
+    """
+    Composite an RGBA image onto a white RGB background.
+
+    Uses getchannel("A") for the paste mask rather than split()[3], which
+    would also allocate the three unused color bands.
+    """
+    from PIL import Image
+
+    background = Image.new('RGB', img.size, (255, 255, 255))
+    background.paste(img, mask=img.getchannel('A'))
+    return background
+
+
+def _run_redistribute_luminance(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """HueForge luminance redistribution (--redistribute-luminance)."""
+    from ...image import extract_unique_colors, redistribute_luminance, format_color_change_report
+
+    print(f"Extracting {args.colors} unique colors from {image_path.name}...")
+    colors = extract_unique_colors(str(image_path), n_colors=args.colors)
+    print(f"Extracted {len(colors)} colors")
+    
+    # Redistribute luminance
+    changes = redistribute_luminance(colors)
+    
+    # Display report
+    report = format_color_change_report(changes)
+    print(report)
+
+
+def _run_cvd_simulate(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """Colorblindness simulation (--cvd-simulate TYPE)."""
+    from ...image import simulate_cvd_image
+
+    print(f"Simulating {args.cvd_simulate} for {image_path.name}...")
+    sim_image = simulate_cvd_image(str(image_path), args.cvd_simulate, output_path)
+    
+    if output_path:
+        print(f"CVD simulation saved to: {output_path}")
+    else:
+        # Generate default output name
+        default_output = _default_output_path(image_path, f"{args.cvd_simulate}_sim")
+        sim_image.save(default_output)
+        print(f"CVD simulation saved to: {default_output}")
+
+
+def _run_cvd_correct(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """Colorblindness correction (--cvd-correct TYPE)."""
+    from ...image import correct_cvd_image
+
+    print(f"Applying {args.cvd_correct} correction to {image_path.name}...")
+    corrected_image = correct_cvd_image(str(image_path), args.cvd_correct, output_path)
+    
+    if output_path:
+        print(f"CVD correction saved to: {output_path}")
+    else:
+        # Generate default output name
+        default_output = _default_output_path(image_path, f"{args.cvd_correct}_corrected")
+        corrected_image.save(default_output)
+        print(f"CVD correction saved to: {default_output}")
+
+
+def _run_quantize_palette(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """Retro palette quantization (--quantize-palette NAME)."""
+    from ...image import quantize_image_to_palette
+
+    dither_text = " with dithering" if args.dither else ""
+    print(f"Converting {image_path.name} to {args.quantize_palette} palette{dither_text}...")
+    print(f"Using {args.metric} distance metric")
+    
+    # Load palette info for reporting
+    try:
+        palette_info = load_palette(args.quantize_palette)
+        print(f"Target palette: {len(palette_info.records)} colors")
+    except Exception as e:
+        print(f"Warning: Could not load palette info: {e}", file=sys.stderr)
+    
+    quantized_image = quantize_image_to_palette(
+        str(image_path), 
+        args.quantize_palette,
+        metric=args.metric,
+        dither=args.dither,
+        output_path=output_path
+    )
+    
+    if output_path:
+        print(f"Quantized image saved to: {output_path}")
+    else:
+        # Generate default output name
+        dither_suffix = "_dithered" if args.dither else ""
+        default_output = _default_output_path(image_path, f"{args.quantize_palette}{dither_suffix}")
+        quantized_image.save(default_output)
+        print(f"Quantized image saved to: {default_output}")
+
+
+def _run_quantize_hyab(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """HyAB k-means quantization (--quantize-hyab)."""
+    from ...image import quantize_image_hyab
+
+    n_colors = getattr(args, 'colors', 16) or 16
+    l_weight = getattr(args, 'l_weight', 2.0)
+    use_l_median = getattr(args, 'use_l_median', True)
+    print(f"Quantizing {image_path.name} to {n_colors} colors using HyAB k-means...")
+    print(f"  l_weight={l_weight}, use_l_median={use_l_median}")
+    quantized_image = quantize_image_hyab(
+        str(image_path),
+        n_colors=n_colors,
+        l_weight=l_weight,
+        use_l_median=use_l_median,
+    )
+    if output_path:
+        quantized_image.save(output_path)
+        print(f"HyAB-quantized image saved to: {output_path}")
+    else:
+        default_output = _default_output_path(image_path, f"hyab{n_colors}")
+        quantized_image.save(default_output)
+        print(f"HyAB-quantized image saved to: {default_output}")
+
+
+@dataclass(frozen=True)
+class _WatermarkOptions:
+    """
+    The --watermark-* options, validated and parsed once.
+    
+    ``kind`` is "text", "image" or "svg" and ``source`` is the matching
+    --watermark-text/-image/-svg value. Colors are already parsed to RGB.
+    """
+    kind: str
+    source: str
+    position: str
+    opacity: float
+    margin: int
+    scale: float
+    font_name: "str | None"
+    font_file: "str | None"
+    font_size: int
+    color: tuple[int, int, int]
+    stroke_color: "tuple[int, int, int] | None"
+    stroke_width: int
+    
+    @classmethod
+    def from_args(cls, args: Namespace) -> "_WatermarkOptions":
+        """Build the options from parsed arguments, exiting with an error if invalid."""
+        # Exactly one watermark source must be given
+        kind = source = None
+        for option in ("text", "image", "svg"):
+            value = getattr(args, f"watermark_{option}")
+            if value:
+                if kind is not None:
+                    exit_with_error(1, "Error: Only one watermark source allowed (--watermark-text, --watermark-image, or --watermark-svg)")
+                kind, source = option, value
+        if kind is None:
+            exit_with_error(1, "Error: Watermark requires one of: --watermark-text, --watermark-image, or --watermark-svg")
+        
+        # Colors only apply to text watermarks
+        color: tuple[int, int, int] = (255, 255, 255)
+        stroke_color = None
+        if kind == "text":
+            color = _parse_rgb_triple(args.watermark_color, "--watermark-color")
+            if args.watermark_stroke_color:
+                stroke_color = _parse_rgb_triple(
+                    args.watermark_stroke_color, "--watermark-stroke-color", example="0,0,0"
+                )
+        
+        return cls(
+            kind=kind,
+            source=source,
+            position=args.watermark_position,
+            opacity=args.watermark_opacity,
+            margin=args.watermark_margin,
+            scale=args.watermark_scale,
+            font_name=args.watermark_font_name,
+            font_file=args.watermark_font_file,
+            font_size=args.watermark_font_size,
+            color=color,
+            stroke_color=stroke_color,
+            stroke_width=args.watermark_stroke_width,
+        )
+
+
+def _run_watermark(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """Text, image, or SVG watermarking (--watermark)."""
+    from PIL import Image
+    from ...image import add_text_watermark, add_image_watermark, add_svg_watermark
+    
+    options = _WatermarkOptions.from_args(args)
+    
+    # Load input image
+    print(f"Loading image: {image_path.name}...")
+    with Image.open(str(image_path)) as _f:
+        img = _f.copy()
+    
+    # Apply appropriate watermark type
+    if options.kind == "text":
+        print(f"Adding text watermark: '{options.source}'")
+        watermarked = add_text_watermark(
+            img,
+            text=options.source,
+            position=options.position,
+            font_name=options.font_name,
+            font_file=options.font_file,
+            font_size=options.font_size,
+            color=options.color,
+            opacity=options.opacity,
+            stroke_color=options.stroke_color,
+            stroke_width=options.stroke_width,
+            margin=options.margin
+        )
+    
+    elif options.kind == "image":
+        print(f"Adding image watermark: {Path(options.source).name}")
+        watermarked = add_image_watermark(
+            img,
+            watermark_path=options.source,
+            position=options.position,
+            scale=options.scale,
+            opacity=options.opacity,
+            margin=options.margin
+        )
     
-    # Handle --list-palettes first (doesn not require file)
+    else:
+        print(f"Adding SVG watermark: {Path(options.source).name}")
+        try:
+            watermarked = add_svg_watermark(
+                img,
+                svg_path=options.source,
+                position=options.position,
+                scale=options.scale,
+                opacity=options.opacity,
+                margin=options.margin
+            )
+        except ImportError as e:
+            exit_with_error(1, f"Error: {e}")
+    
+    # Save watermarked image
+    if output_path:
+        dest = Path(output_path)
+    else:
+        # Generate default output name
+        dest = _default_output_path(image_path, "watermarked")
+    
+    # JPEG has no alpha channel - flatten RGBA onto white first
+    if dest.suffix.lower() in _JPEG_SUFFIXES and watermarked.mode == 'RGBA':
+        watermarked = _flatten_for_jpeg(watermarked)
+    
+    watermarked.save(output_path or dest)
+    print(f"Watermarked image saved to: {output_path or dest}")
+
+
+def _run_convert(args: Namespace, image_path: Path, output_path: "str | None") -> None:
+    """Image format conversion (--convert FORMAT)."""
+    from ...image import convert_image
+
+    # Determine lossless setting for WebP/AVIF
+    lossless = None if args.lossy else None  # Will use format defaults
+    if args.convert.lower() in ('webp', 'avif') and not args.lossy:
+        lossless = True  # Force lossless unless --lossy is specified
+    
+    print(f"Converting {image_path.name} to {args.convert.upper()}...")
+    
+    try:
+        output_file = convert_image(
+            input_path=image_path,
+            output_path=output_path,
+            output_format=args.convert,
+            quality=args.quality,
+            lossless=lossless
+        )
+        print(f"Converted image saved to: {output_file}")
+    except ImportError as e:
+        exit_with_error(1, f"Error: {e}", "For HEIC support, install: pip install pillow-heif")
+
+
+# Shown when the image command is run without an operation flag
+_NO_OPERATION_HELP = "\n".join((
+    "Error: No operation specified. Choose one of:",
+    "  --redistribute-luminance    (HueForge color analysis)",
+    "  --cvd-simulate TYPE         (colorblindness simulation)",
+    "  --cvd-correct TYPE          (colorblindness correction)",
+    "  --quantize-palette NAME     (convert to retro palette)",
+    "  --quantize-hyab             (HyAB k-means quantization)",
+    "  --watermark                 (add text/image/SVG watermark with --watermark-text/--watermark-image/--watermark-svg)",
+    "  --convert FORMAT            (convert image format: png, jpg, webp, heic, avif, etc.)",
+    "  --list-palettes             (show available palettes)",
+))
+
+# Image operations as (args attribute, runner), in the order they're listed in
+# the "No operation specified" help. Exactly one may be active per invocation.
+_IMAGE_OPERATIONS = (
+    ("redistribute_luminance", _run_redistribute_luminance),
+    ("cvd_simulate", _run_cvd_simulate),
+    ("cvd_correct", _run_cvd_correct),
+    ("quantize_palette", _run_quantize_palette),
+    ("quantize_hyab", _run_quantize_hyab),
+    ("watermark", _run_watermark),
+    ("convert", _run_convert),
+)
+
+
+def handle_image_command(args: Namespace) -> None:
+    """Handle all image processing commands."""
+    # Handle --list-palettes first: it needs neither a file nor Pillow, so it
+    # runs before the image stack is imported
     if args.list_palettes:
         try:
             available_palettes = get_available_palettes()
@@ -57,278 +404,46 @@ def handle_image_command(args):
             else:
                 print("No palettes found")
         except Exception as e:
-            print(f"Error listing palettes: {e}", file=sys.stderr)
-            sys.exit(1)
+            exit_with_error(1, f"Error listing palettes: {e}")
         sys.exit(0)
     
+    if not _image_available():
+        _exit_pillow_missing()
+
+    # Image analysis is optional (requires Pillow) - import only once we know
+    # an image operation is actually running
+    try:
+        from ...image import IMAGE_AVAILABLE
+    except ImportError:
+        IMAGE_AVAILABLE = False
+    if not IMAGE_AVAILABLE:
+        _exit_pillow_missing()
+    
     # Check if file is provided and exists for operations that need it
     if not args.file:
-        print("Error: --file is required for this operation", file=sys.stderr)
-        sys.exit(1)
+        exit_with_error(1, "Error: --file is required for this operation")
     
     image_path = Path(args.file)
-    if not image_path.exists():
-        print(f"Error: Image file not found: {image_path}", file=sys.stderr)
-        sys.exit(1)
+    try:
+        os.stat(image_path)
+    except FileNotFoundError:
+        exit_with_error(1, f"Error: Image file not found: {image_path}")
+    except OSError as e:
+        exit_with_error(1, f"Error: Cannot access image file: {image_path} ({e.strerror})")
     
     # Determine output path
     output_path = args.output
     
-    # Count active operations
-    operations = [
-        args.redistribute_luminance,
-        args.cvd_simulate is not None,
-        args.cvd_correct is not None,
-        args.quantize_palette is not None,
-        getattr(args, 'quantize_hyab', False),
-        args.watermark,
-        args.convert is not None,
-    ]
-    active_count = sum(operations)
+    # Find the requested operation(s)
+    active = [run for name, run in _IMAGE_OPERATIONS if getattr(args, name, None)]
     
-    if active_count == 0:
-        print("Error: No operation specified. Choose one of:", file=sys.stderr)
-        print("  --redistribute-luminance    (HueForge color analysis)", file=sys.stderr)
-        print("  --cvd-simulate TYPE         (colorblindness simulation)", file=sys.stderr)
-        print("  --cvd-correct TYPE          (colorblindness correction)", file=sys.stderr)
-        print("  --quantize-palette NAME     (convert to retro palette)", file=sys.stderr)
-        print("  --quantize-hyab             (HyAB k-means quantization)", file=sys.stderr)
-        print("  --watermark                 (add text/image/SVG watermark with --watermark-text/--watermark-image/--watermark-svg)", file=sys.stderr)
-        print("  --convert FORMAT            (convert image format: png, jpg, webp, heic, avif, etc.)", file=sys.stderr)
-        print("  --list-palettes             (show available palettes)", file=sys.stderr)
-        sys.exit(1)
-    elif active_count > 1:
-        print("Error: Only one operation allowed at a time", file=sys.stderr)
-        sys.exit(1)
+    if not active:
+        exit_with_error(1, _NO_OPERATION_HELP)
+    elif len(active) > 1:
+        exit_with_error(1, "Error: Only one operation allowed at a time")
     
     # Execute the requested operation
     try:
-        if args.redistribute_luminance:
-            # HueForge luminance redistribution (existing functionality)
-            print(f"Extracting {args.colors} unique colors from {image_path.name}...")
-            colors = extract_unique_colors(str(image_path), n_colors=args.colors)
-            print(f"Extracted {len(colors)} colors")
-            
-            # Redistribute luminance
-            changes = redistribute_luminance(colors)
-            
-            # Display report
-            report = format_color_change_report(changes)
-            print(report)
-        
-        elif args.cvd_simulate:
-            # CVD simulation
-            print(f"Simulating {args.cvd_simulate} for {image_path.name}...")
-            sim_image = simulate_cvd_image(str(image_path), args.cvd_simulate, output_path)
-            
-            if output_path:
-                print(f"CVD simulation saved to: {output_path}")
-            else:
-                # Generate default output name
-                default_output = image_path.with_name(f"{image_path.stem}_{args.cvd_simulate}_sim{image_path.suffix}")
-                sim_image.save(default_output)
-                print(f"CVD simulation saved to: {default_output}")
-        
-        elif args.cvd_correct:
-            # CVD correction
-            print(f"Applying {args.cvd_correct} correction to {image_path.name}...")
-            corrected_image = correct_cvd_image(str(image_path), args.cvd_correct, output_path)
-            
-            if output_path:
-                print(f"CVD correction saved to: {output_path}")
-            else:
-                # Generate default output name
-                default_output = image_path.with_name(f"{image_path.stem}_{args.cvd_correct}_corrected{image_path.suffix}")
-                corrected_image.save(default_output)
-                print(f"CVD correction saved to: {default_output}")
-        
-        elif args.quantize_palette:
-            # Palette quantization
-            dither_text = " with dithering" if args.dither else ""
-            print(f"Converting {image_path.name} to {args.quantize_palette} palette{dither_text}...")
-            print(f"Using {args.metric} distance metric")
-            
-            # Load palette info for reporting
-            try:
-                palette_info = load_palette(args.quantize_palette)
-                print(f"Target palette: {len(palette_info.records)} colors")
-            except Exception as e:
-                print(f"Warning: Could not load palette info: {e}", file=sys.stderr)
-            
-            quantized_image = quantize_image_to_palette(
-                str(image_path), 
-                args.quantize_palette,
-                metric=args.metric,
-                dither=args.dither,
-                output_path=output_path
-            )
-            
-            if output_path:
-                print(f"Quantized image saved to: {output_path}")
-            else:
-                # Generate default output name
-                dither_suffix = "_dithered" if args.dither else ""
-                default_output = image_path.with_name(f"{image_path.stem}_{args.quantize_palette}{dither_suffix}{image_path.suffix}")
-                quantized_image.save(default_output)
-                print(f"Quantized image saved to: {default_output}")
-
-        elif getattr(args, 'quantize_hyab', False):
-            # HyAB k-means quantization
-            n_colors = getattr(args, 'colors', 16) or 16
-            l_weight = getattr(args, 'l_weight', 2.0)
-            use_l_median = getattr(args, 'use_l_median', True)
-            print(f"Quantizing {image_path.name} to {n_colors} colors using HyAB k-means...")
-            print(f"  l_weight={l_weight}, use_l_median={use_l_median}")
-            quantized_image = quantize_image_hyab(
-                str(image_path),
-                n_colors=n_colors,
-                l_weight=l_weight,
-                use_l_median=use_l_median,
-            )
-            if output_path:
-                quantized_image.save(output_path)
-                print(f"HyAB-quantized image saved to: {output_path}")
-            else:
-                default_output = image_path.with_name(f"{image_path.stem}_hyab{n_colors}{image_path.suffix}")
-                quantized_image.save(default_output)
-                print(f"HyAB-quantized image saved to: {default_output}")
-
-        elif args.watermark:
-            # Watermarking
-            from PIL import Image
-            
-            # Check that at least one watermark source is specified
-            watermark_sources = [args.watermark_text, args.watermark_image, args.watermark_svg]
-            if not any(watermark_sources):
-                print("Error: Watermark requires one of: --watermark-text, --watermark-image, or --watermark-svg", file=sys.stderr)
-                sys.exit(1)
-            
-            # Check for conflicting watermark sources
-            source_count = sum(bool(s) for s in watermark_sources)
-            if source_count > 1:
-                print("Error: Only one watermark source allowed (--watermark-text, --watermark-image, or --watermark-svg)", file=sys.stderr)
-                sys.exit(1)
-            
-            # Load input image
-            print(f"Loading image: {image_path.name}...")
-            with Image.open(str(image_path)) as _f:
-                img = _f.copy()
-            
-            # Apply appropriate watermark type
-            if args.watermark_text:
-                # Parse color arguments
-                try:
-                    color_parts = args.watermark_color.split(',')
-                    color = tuple(int(c.strip()) for c in color_parts)
-                    if len(color) != 3:
-                        raise ValueError("Color must have 3 components (R,G,B)")
-                except Exception as e:
-                    print(f"Error: Invalid --watermark-color format: {e}", file=sys.stderr)
-                    print("Use format: R,G,B (e.g., 255,255,255)", file=sys.stderr)
-                    sys.exit(1)
-                
-                stroke_color = None
-                if args.watermark_stroke_color:
-                    try:
-                        stroke_parts = args.watermark_stroke_color.split(',')
-                        stroke_color = tuple(int(c.strip()) for c in stroke_parts)
-                        if len(stroke_color) != 3:
-                            raise ValueError("Stroke color must have 3 components (R,G,B)")
-                    except Exception as e:
-                        print(f"Error: Invalid --watermark-stroke-color format: {e}", file=sys.stderr)
-                        print("Use format: R,G,B (e.g., 0,0,0)", file=sys.stderr)
-                        sys.exit(1)
-                
-                print(f"Adding text watermark: '{args.watermark_text}'")
-                watermarked = add_text_watermark(
-                    img,
-                    text=args.watermark_text,
-                    position=args.watermark_position,
-                    font_name=args.watermark_font_name,
-                    font_file=args.watermark_font_file,
-                    font_size=args.watermark_font_size,
-                    color=color,
-                    opacity=args.watermark_opacity,
-                    stroke_color=stroke_color,
-                    stroke_width=args.watermark_stroke_width,
-                    margin=args.watermark_margin
-                )
-            
-            elif args.watermark_image:
-                print(f"Adding image watermark: {Path(args.watermark_image).name}")
-                watermarked = add_image_watermark(
-                    img,
-                    watermark_path=args.watermark_image,
-                    position=args.watermark_position,
-                    scale=args.watermark_scale,
-                    opacity=args.watermark_opacity,
-                    margin=args.watermark_margin
-                )
-            
-            elif args.watermark_svg:
-                print(f"Adding SVG watermark: {Path(args.watermark_svg).name}")
-                try:
-                    watermarked = add_svg_watermark(
-                        img,
-                        svg_path=args.watermark_svg,
-                        position=args.watermark_position,
-                        scale=args.watermark_scale,
-                        opacity=args.watermark_opacity,
-                        margin=args.watermark_margin
-                    )
-                except ImportError as e:
-                    print(f"Error: {e}", file=sys.stderr)
-                    sys.exit(1)
-            
-            # Save watermarked image
-            if output_path:
-                # Convert RGBA to RGB if saving as JPEG
-                if output_path.lower().endswith(('.jpg', '.jpeg')) and watermarked.mode == 'RGBA':
-                    # Create white background
-                    rgb_img = Image.new('RGB', watermarked.size, (255, 255, 255))
-                    rgb_img.paste(watermarked, mask=watermarked.split()[3])  # Use alpha channel as mask
-                    watermarked = rgb_img
-                
-                watermarked.save(output_path)
-                print(f"Watermarked image saved to: {output_path}")
-            else:
-                # Generate default output name
-                default_output = image_path.with_name(f"{image_path.stem}_watermarked{image_path.suffix}")
-                
-                # Convert RGBA to RGB if saving as JPEG
-                if default_output.suffix.lower() in ['.jpg', '.jpeg'] and watermarked.mode == 'RGBA':
-                    rgb_img = Image.new('RGB', watermarked.size, (255, 255, 255))
-                    rgb_img.paste(watermarked, mask=watermarked.split()[3])
-                    watermarked = rgb_img
-                
-                watermarked.save(default_output)
-                print(f"Watermarked image saved to: {default_output}")
-        
-        elif args.convert:
-            # Image format conversion
-            from PIL import Image
-            
-            # Determine lossless setting for WebP/AVIF
-            lossless = None if args.lossy else None  # Will use format defaults
-            if args.convert.lower() in ('webp', 'avif') and not args.lossy:
-                lossless = True  # Force lossless unless --lossy is specified
-            
-            print(f"Converting {image_path.name} to {args.convert.upper()}...")
-            
-            try:
-                output_file = convert_image(
-                    input_path=image_path,
-                    output_path=output_path,
-                    output_format=args.convert,
-                    quality=args.quality,
-                    lossless=lossless
-                )
-                print(f"Converted image saved to: {output_file}")
-            except ImportError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                print("For HEIC support, install: pip install pillow-heif", file=sys.stderr)
-                sys.exit(1)
-    
+        active[0](args, image_path, output_path)
     except Exception as e:
-        print(f"Error processing image: {e}", file=sys.stderr)
-        sys.exit(1)
+        exit_with_error(1, f"Error processing image: {e}")
@@ -3,7 +3,7 @@
 import sys
 from argparse import Namespace
 
-from ..utils import parse_hex_or_exit
+from ..utils import get_rgb_from_args
 from ...naming import generate_color_name
 
 
@@ -18,31 +18,7 @@ def handle_name_command(args: Namespace) -> None:
         0: Success
         2: Invalid input
     """
-    # Validate mutual exclusivity of --value and --hex
-    if args.value is not None and args.hex is not None:
-        print("Error: Cannot specify both --value and --hex", file=sys.stderr)
-        sys.exit(2)
-    
-    if args.value is None and args.hex is None:
-        print("Error: Name command requires either --value or --hex", file=sys.stderr)
-        sys.exit(2)
-    
-    # Handle hex input
-    if args.hex is not None:
-        try:
-            r, g, b = parse_hex_or_exit(args.hex)
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(2)
-    else:
-        # Handle --value input
-        r, g, b = args.value
-        # Validate RGB values
-        if not all(0 <= v <= 255 for v in [r, g, b]):
-            print("Error: RGB values must be in range 0-255")
-            sys.exit(2)
-    
-    rgb = (r, g, b)
+    rgb = get_rgb_from_args(args, "Name command requires either --value or --hex")
     name, match_type = generate_color_name(rgb, near_threshold=args.threshold)
     
     if args.show_type:
@@ -32,25 +32,30 @@ def handle_validate_command(args: Namespace) -> None:
             "delta_e": result.delta_e,
             "message": result.message
         }
-        print(json.dumps(output, indent=2))
+        sys.stdout.write(json.dumps(output, indent=2) + "\n")
     else:
         # Human-readable output
         if result.is_match:
-            print(f"✓ MATCH")
-            print(f"Name:       '{args.name}' → matched to '{result.name_match}'")
-            print(f"Hex:        {result.hex_value}")
-            print(f"Confidence: {result.name_confidence:.0%}")
-            print(f"Delta E:    {result.delta_e:.2f} (threshold: {args.threshold})")
+            lines = [
+                "✓ MATCH",
+                f"Name:       '{args.name}' → matched to '{result.name_match}'",
+                f"Hex:        {result.hex_value}",
+                f"Confidence: {result.name_confidence:.0%}",
+                f"Delta E:    {result.delta_e:.2f} (threshold: {args.threshold})",
+            ]
             if result.suggested_hex and result.suggested_hex != result.hex_value:
-                print(f"Note:       Exact match for '{result.name_match}' would be {result.suggested_hex}")
+                lines.append(f"Note:       Exact match for '{result.name_match}' would be {result.suggested_hex}")
         else:
-            print(f"✗ NO MATCH")
-            print(f"Name:       '{args.name}' → matched to '{result.name_match}'")
-            print(f"Hex:        {result.hex_value}")
-            print(f"Suggested:  {result.suggested_hex}")
-            print(f"Confidence: {result.name_confidence:.0%}")
-            print(f"Delta E:    {result.delta_e:.2f} (threshold: {args.threshold})")
-            print(f"Reason:     {result.message}")
+            lines = [
+                "✗ NO MATCH",
+                f"Name:       '{args.name}' → matched to '{result.name_match}'",
+                f"Hex:        {result.hex_value}",
+                f"Suggested:  {result.suggested_hex}",
+                f"Confidence: {result.name_confidence:.0%}",
+                f"Delta E:    {result.delta_e:.2f} (threshold: {args.threshold})",
+                f"Reason:     {result.message}",
+            ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Exit with code 0 for match, 1 for no match
     sys.exit(0 if result.is_match else 1)
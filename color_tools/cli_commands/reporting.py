@@ -5,13 +5,22 @@ Functions for generating override reports and managing hash files for user data
 """
 
 from __future__ import annotations
+import functools
+import json
+import os
 import sys
-import logging
+import tempfile
+from collections import Counter
 from pathlib import Path
+from typing import NoReturn
 
 from ..constants import ColorConstants
-from ..palette import Palette, load_colors, load_palette
-from ..filament_palette import FilamentPalette, load_filaments, load_maker_synonyms
+from ..palette import load_colors_with_overrides
+from ..filament_palette import load_filaments_with_overrides, load_maker_synonyms_with_overrides
+from .utils import exit_with_error
+
+# Package data directory (color_tools/data), resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
 
 def show_override_report(json_dir: str | None = None) -> None:
@@ -24,89 +33,45 @@ def show_override_report(json_dir: str | None = None) -> None:
     Args:
         json_dir: Optional directory containing JSON files. If None, uses package default.
     """
-    # Set up logging to capture override messages
-    log_messages = []
-    
-    class ListHandler(logging.Handler):
-        def emit(self, record):
-            log_messages.append(self.format(record))
-    
-    # Configure logging to capture override info
-    logger = logging.getLogger('color_tools.palette')
-    logger.setLevel(logging.INFO)
-    handler = ListHandler()
-    logger.addHandler(handler)
-    
-    print("User Override Report")
-    print("=" * 50)
+    lines = ["User Override Report", "=" * 50]
     
     try:
-        # Load colors and capture override messages
-        palette = Palette.load_default() if json_dir is None else None
-        if palette is None and json_dir:
-            colors = load_colors(json_dir)
-            palette = Palette(colors)
-        elif palette is None:
-            colors = load_colors()
-            palette = Palette(colors)
-        
-        # Load filaments and capture override messages  
-        filament_palette = FilamentPalette.load_default() if json_dir is None else None
-        if filament_palette is None and json_dir:
-            filaments = load_filaments(json_dir)
-            synonyms = load_maker_synonyms(json_dir)
-            filament_palette = FilamentPalette(filaments, synonyms)
-        elif filament_palette is None:
-            filaments = load_filaments()
-            synonyms = load_maker_synonyms()  
-            filament_palette = FilamentPalette(filaments, synonyms)
-        
-        # Display captured log messages
-        if log_messages:
-            print("\nOverride Details:")
-            for msg in log_messages:
-                if "User colors override" in msg:
-                    print(f"  Colors: {msg}")
-                elif "User filaments override" in msg:
-                    print(f"  Filaments: {msg}")
-                elif "User synonyms override" in msg:
-                    print(f"  Synonyms: {msg}")
-                elif "User synonyms extend" in msg:
-                    print(f"  Synonyms: {msg}")
-        else:
-            print("\nNo user overrides detected.")
-        
-        # Count sources
-        color_sources = {}
-        for record in palette.records:
-            source = record.source
-            color_sources[source] = color_sources.get(source, 0) + 1
-        
-        filament_sources = {}
-        for record in filament_palette.records:
-            source = record.source
-            filament_sources[source] = filament_sources.get(source, 0) + 1
-        
-        # Summary
-        print(f"\nSummary:")
-        print(f"  Total colors: {len(palette.records)}")
-        print(f"  Total filaments: {len(filament_palette.records)}")
-        
-        print(f"\nActive Sources:")
-        print("  Colors:")
-        for source, count in sorted(color_sources.items()):
-            print(f"    {source}: {count} records")
-        
-        print("  Filaments:")
-        for source, count in sorted(filament_sources.items()):
-            print(f"    {source}: {count} records")
-        
+        # Loaders return their override details alongside the data
+        colors, color_overrides = load_colors_with_overrides(json_dir)
+        filaments, filament_overrides = load_filaments_with_overrides(json_dir)
+        _, synonym_overrides = load_maker_synonyms_with_overrides(json_dir)
     except Exception as e:
-        print(f"\nError loading data: {e}")
+        lines.append(f"\nError loading data: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.exit(1)
-    finally:
-        # Clean up logging
-        logger.removeHandler(handler)
+    
+    override_lines = [f"  Colors: {msg}" for msg in color_overrides]
+    override_lines += [f"  Filaments: {msg}" for msg in filament_overrides]
+    override_lines += [f"  Synonyms: {msg}" for msg in synonym_overrides]
+    
+    if override_lines:
+        lines.append("\nOverride Details:")
+        lines.extend(override_lines)
+    else:
+        lines.append("\nNo user overrides detected.")
+    
+    # Count sources
+    color_sources = Counter(record.source for record in colors)
+    filament_sources = Counter(record.source for record in filaments)
+    
+    # Summary
+    lines.append("\nSummary:")
+    lines.append(f"  Total colors: {len(colors)}")
+    lines.append(f"  Total filaments: {len(filaments)}")
+    
+    lines.append("\nActive Sources:")
+    lines.append("  Colors:")
+    lines.extend(f"    {source}: {count} records" for source, count in sorted(color_sources.items()))
+    
+    lines.append("  Filaments:")
+    lines.extend(f"    {source}: {count} records" for source, count in sorted(filament_sources.items()))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def generate_user_hashes(json_dir: str | None = None) -> None:
@@ -123,13 +88,11 @@ def generate_user_hashes(json_dir: str | None = None) -> None:
     if json_dir:
         data_dir = Path(json_dir)
         if not data_dir.exists():
-            print(f"Error: Data directory does not exist: {data_dir}", file=sys.stderr)
-            sys.exit(1)
+            exit_with_error(1, f"Error: Data directory does not exist: {data_dir}")
         if not data_dir.is_dir():
-            print(f"Error: --json must be a directory: {data_dir}", file=sys.stderr)
-            sys.exit(1)
+            exit_with_error(1, f"Error: --json must be a directory: {data_dir}")
     else:
-        data_dir = Path(__file__).parent / "data"
+        data_dir = _DATA_DIR
     
     user_dir = data_dir / "user"
     
@@ -155,8 +118,8 @@ def generate_user_hashes(json_dir: str | None = None) -> None:
         
         if file_path.exists():
             try:
-                hash_file = ColorConstants.save_user_data_hash(file_path)
                 hash_value = ColorConstants.generate_user_data_hash(file_path)
+                hash_file = ColorConstants.save_user_data_hash(file_path, hash_value)
                 print(f"✓ Generated {hash_file.name}")
                 print(f"  File: {file_path.name}")
                 print(f"  Hash: {hash_value}")
@@ -174,10 +137,117 @@ def generate_user_hashes(json_dir: str | None = None) -> None:
         print("Create user data files (user/user-colors.json, etc.) first.")
 
 
+# Name of the on-disk palette index, stored under the user cache directory.
+# Maps each palette file to the (mtime_ns, size) it had when its colors were
+# counted, so repeat listings skip re-parsing palettes that haven't changed.
+_PALETTE_INDEX_FILENAME = "palette_index.json"
+
+
+def _palette_index_path() -> Path:
+    """Return the palette index location (honours XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "color_tools" / _PALETTE_INDEX_FILENAME
+
+
+def _count_palette_colors(palette_file: Path) -> int:
+    """
+    Count the colors in a palette file without building a Palette.
+
+    Only the JSON structure is checked (an array of color objects); the
+    records themselves aren't parsed, so listing palettes skips the color
+    record validation and index building that load_palette() does.
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the file isn't a JSON array of objects
+    """
+    with open(palette_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list) or not all(isinstance(entry, dict) for entry in data):
+        raise ValueError(f"Expected array of colors at root level in {palette_file}")
+    return len(data)
+
+
+def _load_palette_index(palette_files: list[tuple[str, Path]]) -> list[tuple[str, int]]:
+    """
+    Count the colors in each palette, reusing counts cached by earlier runs.
+
+    A palette is only read when its file is new or its mtime/size changed
+    since it was last counted. The index is rewritten only when something was
+    recounted. Any problem reading or writing the index falls back to reading
+    palettes directly, so the cache can never break a listing.
+
+    Args:
+        palette_files: (palette_name, palette_file) pairs to count
+
+    Returns:
+        List of (palette_name, color_count) tuples in the order given.
+        color_count is -1 if the palette fails to load.
+    """
+    index_path = _palette_index_path()
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        if not isinstance(index, dict):
+            index = {}
+    except (OSError, ValueError):
+        index = {}
+
+    stale = False
+    palette_data = []
+    for name, palette_file in palette_files:
+        key = str(palette_file.resolve())
+        try:
+            st = palette_file.stat()
+        except OSError:
+            # Palette removed (or unreadable) since the directory was listed
+            palette_data.append((name, -1))
+            continue
+        signature = [st.st_mtime_ns, st.st_size]
+        entry = index.get(key)
+        if (isinstance(entry, list) and len(entry) == 3
+                and entry[:2] == signature and isinstance(entry[2], int)):
+            color_count = entry[2]
+        else:
+            try:
+                color_count = _count_palette_colors(palette_file)
+            except (OSError, ValueError):
+                # If palette fails to load, include it with -1 count
+                color_count = -1
+            index[key] = signature + [color_count]
+            stale = True
+        palette_data.append((name, color_count))
+
+    if stale:
+        # Drop entries for palette files that no longer exist
+        index = {k: v for k, v in index.items() if Path(k).exists()}
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a private temp file and swap it in, so overlapping runs
+            # never leave (or read) a half-written index
+            fd, tmp_name = tempfile.mkstemp(
+                dir=index_path.parent, prefix=index_path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(index, f)
+                os.replace(tmp_name, index_path)
+            except OSError:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
+    return palette_data
+
+
 def get_available_palettes(json_path: Path | str | None = None) -> list[tuple[str, int]]:
     """
     Get list of available palette names from both core and user palettes with color counts.
     
+    Color counts are served from a small on-disk index keyed on each palette
+    file's mtime and size, so only new or modified palettes are parsed.
+    
     Args:
         json_path: Optional custom data directory. If None, uses package default.
     
@@ -187,35 +257,145 @@ def get_available_palettes(json_path: Path | str | None = None) -> list[tuple[st
     """
     # Determine data directory
     if json_path is None:
-        data_dir = Path(__file__).parent.parent / "data"
+        data_dir = _DATA_DIR
     else:
         data_dir = Path(json_path)
     
-    palette_names = []
+    core_palettes_dir = data_dir / "palettes"
+    user_palettes_dir = data_dir / "user" / "palettes"
+    palette_files = _list_palette_files(
+        core_palettes_dir, _dir_stamp(core_palettes_dir),
+        user_palettes_dir, _dir_stamp(user_palettes_dir),
+    )
+    return _load_palette_index(list(palette_files))
+
+
+def _dir_stamp(directory: Path) -> int | None:
+    """Return a directory's mtime_ns, or None if it doesn't exist."""
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _list_palette_files(
+    core_dir: Path, core_stamp: int | None,
+    user_dir: Path, user_stamp: int | None,
+) -> tuple[tuple[str, Path], ...]:
+    """
+    List (name, path) for core palettes and user-*.json palettes, sorted by name.
+    
+    The directory mtimes are part of the cache key, so adding or removing a
+    palette file invalidates the cached listing; repeated calls in one process
+    (e.g. listing palettes after a failed lookup) skip the directory scans.
+    """
+    palette_files = []
     
     # Core palettes
-    core_palettes_dir = data_dir / "palettes"
-    if core_palettes_dir.exists():
-        palette_names.extend([p.stem for p in core_palettes_dir.glob("*.json")])
+    if core_stamp is not None:
+        palette_files.extend((p.stem, p) for p in core_dir.glob("*.json"))
     
     # User palettes (only user-*.json files)
-    user_palettes_dir = data_dir / "user" / "palettes"
-    if user_palettes_dir.exists():
-        user_palettes = [p.stem for p in user_palettes_dir.glob("user-*.json")]
-        palette_names.extend(user_palettes)
+    if user_stamp is not None:
+        palette_files.extend((p.stem, p) for p in user_dir.glob("user-*.json"))
     
-    # Load each palette and count colors
-    palette_data = []
-    for name in sorted(palette_names):
-        try:
-            palette = load_palette(name, json_path)
-            color_count = len(palette.records)
-            palette_data.append((name, color_count))
-        except Exception:
-            # If palette fails to load, include it with -1 count
-            palette_data.append((name, -1))
+    return tuple(sorted(palette_files))
+
+
+def _integrity_failure(verified: list[str], messages: list[str]) -> NoReturn:
+    """Write the checks that passed so far, report a failed check on stderr and exit 1."""
+    if verified:
+        sys.stdout.write("".join(verified))
+        sys.stdout.flush()
+    exit_with_error(1, *messages)
+
+
+def _run_integrity_checks(args) -> list[str]:
+    """
+    Run the requested --verify-* checks and return their success lines.
     
-    return palette_data
+    Exits with status 1 (via _integrity_failure) as soon as a check fails.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    data_dir = Path(args.json) if args.json else None
+    
+    # Success lines are collected and written together once the checks finish
+    # (or just before a failure is reported, so the output order is unchanged).
+    verified: list[str] = []
+    
+    # The file-based checks are mostly disk reads, so they run on worker threads
+    # while the constants and matrices are hashed. The pool is scoped to the
+    # checks (no threads start unless one is submitted), so an early failure
+    # exits only after the in-flight hashes finish, never leaving work behind.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        data_check = pool.submit(ColorConstants.verify_all_data_files, data_dir) if args.verify_data else None
+        user_data_check = pool.submit(ColorConstants.verify_all_user_data, data_dir) if args.verify_user_data else None
+        
+        # Verify constants integrity if requested. The hash is computed once so a
+        # failure can report it without hashing the constants again.
+        if args.verify_constants:
+            current_hash = ColorConstants._compute_hash()
+            if current_hash != ColorConstants._EXPECTED_HASH:
+                _integrity_failure(verified, [
+                    "ERROR: ColorConstants integrity check FAILED!",
+                    "The color science constants have been modified.",
+                    f"Expected hash: {ColorConstants._EXPECTED_HASH}",
+                    f"Current hash:  {current_hash}",
+                ])
+            verified.append("✓ ColorConstants integrity verified\n")
+    
+        # Verify matrices integrity if requested
+        if args.verify_matrices:
+            current_hash = ColorConstants._compute_matrices_hash()
+            if current_hash != ColorConstants.MATRICES_EXPECTED_HASH:
+                _integrity_failure(verified, [
+                    "ERROR: Transformation matrices integrity check FAILED!",
+                    "The CVD transformation matrices have been modified.",
+                    f"Expected hash: {ColorConstants.MATRICES_EXPECTED_HASH}",
+                    f"Current hash:  {current_hash}",
+                ])
+            verified.append("✓ Transformation matrices integrity verified\n")
+    
+        # Verify data files integrity if requested
+        if data_check is not None:
+            all_valid, errors = data_check.result()
+        
+            if not all_valid:
+                _integrity_failure(
+                    verified,
+                    ["ERROR: Data file integrity check FAILED!", *(f"  {error}" for error in errors)],
+                )
+            verified.append("✓ Data files integrity verified (colors.json, filaments.json, maker_synonyms.json, 20 palettes)\n")
+    
+        # Verify user data files integrity if requested
+        if user_data_check is not None:
+            all_valid, errors = user_data_check.result()
+        
+            if not all_valid:
+                _integrity_failure(
+                    verified,
+                    ["ERROR: User data file integrity check FAILED!", *(f"  {error}" for error in errors)],
+                )
+        
+            # Count files checked, from one directory listing (same matches as
+            # glob("*.sha256"), which skips dotfiles)
+            user_dir = (data_dir or _DATA_DIR) / "user"
+            try:
+                with os.scandir(user_dir) as entries:
+                    hash_count = sum(
+                        1 for entry in entries
+                        if entry.name.endswith(".sha256") and not entry.name.startswith(".")
+                    )
+            except OSError:
+                hash_count = None
+            if hash_count:
+                verified.append(f"✓ User data files integrity verified ({hash_count} files checked)\n")
+            elif hash_count == 0:
+                verified.append("✓ No user data hash files found to verify\n")
+    
+    return verified
 
 
 def handle_verification_flags(args) -> bool:
@@ -242,59 +422,10 @@ def handle_verification_flags(args) -> bool:
         generate_user_hashes(args.json)
         sys.exit(0)
     
-    # Verify constants integrity if requested
-    if args.verify_constants:
-        if not ColorConstants.verify_integrity():
-            print("ERROR: ColorConstants integrity check FAILED!", file=sys.stderr)
-            print("The color science constants have been modified.", file=sys.stderr)
-            print(f"Expected hash: {ColorConstants._EXPECTED_HASH}", file=sys.stderr)
-            print(f"Current hash:  {ColorConstants._compute_hash()}", file=sys.stderr)
-            sys.exit(1)
-        print("✓ ColorConstants integrity verified")
-    
-    # Verify matrices integrity if requested
-    if args.verify_matrices:
-        if not ColorConstants.verify_matrices_integrity():
-            print("ERROR: Transformation matrices integrity check FAILED!", file=sys.stderr)
-            print("The CVD transformation matrices have been modified.", file=sys.stderr)
-            print(f"Expected hash: {ColorConstants.MATRICES_EXPECTED_HASH}", file=sys.stderr)
-            print(f"Current hash:  {ColorConstants._compute_matrices_hash()}", file=sys.stderr)
-            sys.exit(1)
-        print("✓ Transformation matrices integrity verified")
-    
-    # Verify data files integrity if requested
-    if args.verify_data:
-        # Determine data directory (use args.json if provided, otherwise None for default)
-        data_dir = Path(args.json) if args.json else None
-        all_valid, errors = ColorConstants.verify_all_data_files(data_dir)
-        
-        if not all_valid:
-            print("ERROR: Data file integrity check FAILED!", file=sys.stderr)
-            for error in errors:
-                print(f"  {error}", file=sys.stderr)
-            sys.exit(1)
-        print("✓ Data files integrity verified (colors.json, filaments.json, maker_synonyms.json, 20 palettes)")
-    
-    # Verify user data files integrity if requested
-    if args.verify_user_data:
-        # Determine data directory (use args.json if provided, otherwise None for default)
-        data_dir = Path(args.json) if args.json else None
-        all_valid, errors = ColorConstants.verify_all_user_data(data_dir)
-        
-        if not all_valid:
-            print("ERROR: User data file integrity check FAILED!", file=sys.stderr)
-            for error in errors:
-                print(f"  {error}", file=sys.stderr)
-            sys.exit(1)
-        
-        # Count files checked
-        user_dir = (data_dir or (Path(__file__).parent.parent / "data")) / "user"
-        if user_dir.exists():
-            hash_files = list(user_dir.glob("*.sha256"))
-            if hash_files:
-                print(f"✓ User data files integrity verified ({len(hash_files)} files checked)")
-            else:
-                print("✓ No user data hash files found to verify")
+    if args.verify_constants or args.verify_matrices or args.verify_data or args.verify_user_data:
+        verified = _run_integrity_checks(args)
+        if verified:
+            sys.stdout.write("".join(verified))
     
     # Handle --check-overrides flag
     if args.check_overrides:
@@ -5,8 +5,10 @@ Helper functions used across CLI command handlers to reduce duplication.
 """
 
 from __future__ import annotations
+import functools
 import sys
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, NoReturn
 
 if TYPE_CHECKING:
     import argparse
@@ -14,6 +16,24 @@ if TYPE_CHECKING:
 from ..constants import ColorConstants
 
 
+def exit_with_error(code: int, *lines: str) -> NoReturn:
+    """
+    Write a (possibly multi-line) error message to stderr and exit.
+    
+    The lines go out in a single write, so a message can't be interleaved
+    with other output when stderr is shared or piped to a log.
+    
+    Args:
+        code: Process exit status
+        *lines: Message lines, without trailing newlines
+        
+    Raises:
+        SystemExit: Always, with the given code
+    """
+    sys.stderr.write("\n".join(lines) + "\n")
+    sys.exit(code)
+
+
 def validate_color_input_exclusivity(args: argparse.Namespace) -> None:
     """
     Validate that --value and --hex are mutually exclusive.
@@ -26,22 +46,26 @@ def validate_color_input_exclusivity(args: argparse.Namespace) -> None:
     """
     if hasattr(args, 'value') and hasattr(args, 'hex'):
         if args.value is not None and args.hex is not None:
-            print("Error: Cannot specify both --value and --hex", file=sys.stderr)
-            sys.exit(2)
+            exit_with_error(2, "Error: Cannot specify both --value and --hex")
 
 
-def get_rgb_from_args(args: argparse.Namespace) -> tuple[int, int, int]:
+def get_rgb_from_args(
+    args: argparse.Namespace,
+    missing_error: str = "Either --value or --hex is required",
+) -> tuple[int, int, int]:
     """
     Extract RGB tuple from either --value or --hex arguments.
     
     Args:
         args: Parsed command-line arguments with either 'value' or 'hex' attribute
+        missing_error: Message printed when neither argument was given
         
     Returns:
         RGB tuple (r, g, b) with values 0-255
         
     Raises:
-        SystemExit: If neither --value nor --hex is provided, or if hex is invalid
+        SystemExit: If neither --value nor --hex is provided, if hex is invalid,
+            or if a --value component is outside 0-255
     """
     from ..conversions import hex_to_rgb
     
@@ -50,20 +74,25 @@ def get_rgb_from_args(args: argparse.Namespace) -> tuple[int, int, int]:
     
     # Check that at least one is provided
     if args.value is None and args.hex is None:
-        print("Error: Either --value or --hex is required", file=sys.stderr)
-        sys.exit(2)
+        exit_with_error(2, f"Error: {missing_error}")
     
     # Handle hex input
     if args.hex is not None:
         result = hex_to_rgb(args.hex)
         if result is None:
-            print(f"Error: Invalid hex color code: '{args.hex}'", file=sys.stderr)
-            print("Expected format: #RGB, RGB, #RRGGBB, or RRGGBB", file=sys.stderr)
-            sys.exit(2)
+            exit_with_error(
+                2,
+                f"Error: Invalid hex color code: '{args.hex}'",
+                "Expected format: #RGB, RGB, #RRGGBB, or RRGGBB",
+            )
         return result
     
-    # Handle --value input (RGB values)
-    return tuple(args.value)  # type: ignore[return-value]
+    # Handle --value input (RGB values). Any bit outside the low 8 - including
+    # the sign bits of a negative value - means a component is out of range.
+    r, g, b = args.value
+    if (r | g | b) & ~0xFF:
+        exit_with_error(2, "Error: RGB values must be in range 0-255")
+    return (r, g, b)
 
 
 def parse_hex_or_exit(hex_string: str) -> tuple[int, int, int]:
@@ -83,13 +112,23 @@ def parse_hex_or_exit(hex_string: str) -> tuple[int, int, int]:
     
     result = hex_to_rgb(hex_string)
     if result is None:
-        print(f"Error: Invalid hex color code: '{hex_string}'", file=sys.stderr)
-        print("Expected format: #RGB, RGB, #RRGGBB, or RRGGBB", file=sys.stderr)
-        sys.exit(2)
+        exit_with_error(
+            2,
+            f"Error: Invalid hex color code: '{hex_string}'",
+            "Expected format: #RGB, RGB, #RRGGBB, or RRGGBB",
+        )
     
     return result
 
 
+# Lab/LCh validation bounds, read from ColorConstants once at import
+_NUMBER = (int, float)
+_L_MIN, _L_MAX = ColorConstants.NORMALIZED_MIN, ColorConstants.XYZ_SCALE_FACTOR
+_AB_MIN, _AB_MAX = ColorConstants.AB_MIN, ColorConstants.AB_MAX
+_C_MIN, _C_MAX = ColorConstants.CHROMA_MIN, ColorConstants.CHROMA_MAX
+_H_MIN, _H_MAX = ColorConstants.NORMALIZED_MIN, ColorConstants.HUE_CIRCLE_DEGREES
+
+
 def is_valid_lab(lab_tuple) -> bool:
     """
     Validate if a Lab tuple is within the standard 8-bit Lab range.
@@ -107,12 +146,10 @@ def is_valid_lab(lab_tuple) -> bool:
     L, a, b = lab_tuple
 
     # Type check
-    if not all(isinstance(v, (int, float)) for v in (L, a, b)):
+    if not (isinstance(L, _NUMBER) and isinstance(a, _NUMBER) and isinstance(b, _NUMBER)):
         return False
 
-    return (ColorConstants.NORMALIZED_MIN <= L <= ColorConstants.XYZ_SCALE_FACTOR) and \
-           (ColorConstants.AB_MIN <= a <= ColorConstants.AB_MAX) and \
-           (ColorConstants.AB_MIN <= b <= ColorConstants.AB_MAX)
+    return _L_MIN <= L <= _L_MAX and _AB_MIN <= a <= _AB_MAX and _AB_MIN <= b <= _AB_MAX
 
 
 def is_valid_lch(lch_tuple) -> bool:
@@ -132,29 +169,34 @@ def is_valid_lch(lch_tuple) -> bool:
     L, C, h = lch_tuple
 
     # Type check
-    if not all(isinstance(v, (int, float)) for v in (L, C, h)):
+    if not (isinstance(L, _NUMBER) and isinstance(C, _NUMBER) and isinstance(h, _NUMBER)):
         return False
 
-    return (ColorConstants.NORMALIZED_MIN <= L <= ColorConstants.XYZ_SCALE_FACTOR) and \
-           (ColorConstants.CHROMA_MIN <= C <= ColorConstants.CHROMA_MAX) and \
-           (ColorConstants.NORMALIZED_MIN <= h < ColorConstants.HUE_CIRCLE_DEGREES)
+    return _L_MIN <= L <= _L_MAX and _C_MIN <= C <= _C_MAX and _H_MIN <= h < _H_MAX
+
+
+@functools.lru_cache(maxsize=1)
+def _program_name_for(argv0: str) -> str:
+    """Map ``sys.argv[0]`` to the program name shown in help text."""
+    # If we're running as a module, show that
+    if argv0.endswith("__main__.py") or argv0.endswith("-m"):
+        return "python -m color_tools"
+    # If we have an installed command name, use that
+    return Path(argv0).name
 
 
 def get_program_name() -> str:
     """
     Determine the proper program name based on how we were invoked.
     
+    The result is memoized on ``sys.argv[0]``, so repeated parser builds in
+    one process (e.g. the interactive wizard) don't redo the path handling.
+    
     Returns:
         Program name to display in help text
     """
-    from pathlib import Path
-    
     try:
-        # If we're running as a module, show that
-        if sys.argv[0].endswith("__main__.py") or sys.argv[0].endswith("-m"):
-            return "python -m color_tools"
-        # If we have an installed command name, use that
-        return Path(sys.argv[0]).name
+        return _program_name_for(sys.argv[0])
     except (IndexError, AttributeError):
         # Fallback
         return "color-tools"
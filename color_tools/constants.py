@@ -248,13 +248,13 @@ class ColorConstants:
             True if file hash matches expected hash, False otherwise
         """
         import hashlib
-        from pathlib import Path
         
-        if not Path(filepath).exists():
+        # Open directly rather than stat()ing first; a missing file just fails
+        try:
+            with open(filepath, 'rb') as f:
+                content = f.read().replace(b'\r\n', b'\n')
+        except FileNotFoundError:
             return False
-
-        with open(filepath, 'rb') as f:
-            content = f.read().replace(b'\r\n', b'\n')
         actual_hash = hashlib.sha256(content).hexdigest()
 
         return actual_hash == expected_hash
@@ -280,22 +280,12 @@ class ColorConstants:
         else:
             data_dir = Path(data_dir)
         
-        errors = []
-        
-        # Verify colors.json
-        colors_path = data_dir / cls.COLORS_JSON_FILENAME
-        if not cls.verify_data_file(colors_path, cls.COLORS_JSON_HASH):
-            errors.append(f"colors.json integrity check FAILED: {colors_path}")
-        
-        # Verify filaments.json
-        filaments_path = data_dir / cls.FILAMENTS_JSON_FILENAME
-        if not cls.verify_data_file(filaments_path, cls.FILAMENTS_JSON_HASH):
-            errors.append(f"filaments.json integrity check FAILED: {filaments_path}")
-        
-        # Verify maker_synonyms.json
-        synonyms_path = data_dir / cls.MAKER_SYNONYMS_JSON_FILENAME
-        if not cls.verify_data_file(synonyms_path, cls.MAKER_SYNONYMS_JSON_HASH):
-            errors.append(f"maker_synonyms.json integrity check FAILED: {synonyms_path}")
+        # (label, path, expected hash) for every core data file
+        checks = [
+            ("colors.json", data_dir / cls.COLORS_JSON_FILENAME, cls.COLORS_JSON_HASH),
+            ("filaments.json", data_dir / cls.FILAMENTS_JSON_FILENAME, cls.FILAMENTS_JSON_HASH),
+            ("maker_synonyms.json", data_dir / cls.MAKER_SYNONYMS_JSON_FILENAME, cls.MAKER_SYNONYMS_JSON_HASH),
+        ]
         
         # Verify palette files
         palettes_dir = data_dir / "palettes"
@@ -322,10 +312,18 @@ class ColorConstants:
             ("web.json", cls.WEB_PALETTE_HASH),
         ]
         
-        for palette_file, expected_hash in palette_checks:
-            palette_path = palettes_dir / palette_file
-            if not cls.verify_data_file(palette_path, expected_hash):
-                errors.append(f"{palette_file} integrity check FAILED: {palette_path}")
+        checks.extend(
+            (palette_file, palettes_dir / palette_file, expected_hash)
+            for palette_file, expected_hash in palette_checks
+        )
+        
+        # The files are small, so hash them serially; a thread pool costs
+        # more to start than the hashing itself
+        errors = [
+            f"{label} integrity check FAILED: {path}"
+            for label, path, expected_hash in checks
+            if not cls.verify_data_file(path, expected_hash)
+        ]
         
         return (len(errors) == 0, errors)
     
@@ -408,10 +406,10 @@ class ColorConstants:
         from pathlib import Path
         
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"User data file not found: {path}")
-        
-        content = path.read_bytes().replace(b'\r\n', b'\n')
+        try:
+            content = path.read_bytes().replace(b'\r\n', b'\n')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"User data file not found: {path}") from None
         return hashlib.sha256(content).hexdigest()
     
     @classmethod
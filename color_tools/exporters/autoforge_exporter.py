@@ -14,7 +14,7 @@ import csv
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from color_tools.exporters.base import PaletteExporter, ExporterMetadata
+from color_tools.exporters.base import PaletteExporter, ExporterMetadata, WRITE_BUFFER_SIZE
 from color_tools.exporters import register_exporter
 
 if TYPE_CHECKING:
@@ -22,6 +22,18 @@ if TYPE_CHECKING:
     from color_tools.filament_palette import FilamentRecord
 
 
+def _autoforge_row(filament: FilamentRecord) -> tuple:
+    """Build one AutoForge CSV row: Brand, Name, TD, Color, Owned."""
+    # Combine maker, type, and finish for Brand column
+    brand_parts = [filament.maker]
+    if filament.type:
+        brand_parts.append(filament.type)
+    if filament.finish:
+        brand_parts.append(filament.finish)
+    td = filament.td_value if filament.td_value is not None else ''
+    return (' '.join(brand_parts), filament.color, td, filament.hex, 'TRUE')
+
+
 @register_exporter
 class AutoForgeExporter(PaletteExporter):
     """
@@ -78,27 +90,13 @@ class AutoForgeExporter(PaletteExporter):
         
         output_path = Path(output_path)
         
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             # Write header
             writer.writerow(['Brand', 'Name', 'TD', 'Color', 'Owned'])
             
             # Write data rows
-            for filament in filaments:
-                # Combine maker, type, and finish for Brand column
-                brand_parts = [filament.maker]
-                if filament.type:
-                    brand_parts.append(filament.type)
-                if filament.finish:
-                    brand_parts.append(filament.finish)
-                brand = ' '.join(brand_parts)
-                
-                name = filament.color
-                td = filament.td_value if filament.td_value is not None else ''
-                color = filament.hex
-                owned = 'TRUE'
-                
-                writer.writerow([brand, name, td, color, owned])
+            writer.writerows(_autoforge_row(filament) for filament in filaments)
         
         return str(output_path)
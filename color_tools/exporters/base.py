@@ -32,17 +32,47 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import operator
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from color_tools.palette import ColorRecord
     from color_tools.filament_palette import FilamentRecord
 
 
+# Write buffer for exporters that stream one row or record at a time, so a
+# whole export usually reaches the disk in a few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def record_fields(record_type: type) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    """
+    Get a record dataclass's field names and a getter for their values.
+    
+    The getter returns the field values as a tuple in declaration order,
+    so exporters can build rows or dicts without dataclasses.asdict(),
+    which deep-copies every field of every record.
+    
+    Args:
+        record_type: Record dataclass type (e.g. ColorRecord, FilamentRecord)
+    
+    Returns:
+        Tuple of (field names, values getter)
+    """
+    names = tuple(f.name for f in fields(record_type))
+    getter = operator.attrgetter(*names)
+    if len(names) == 1:
+        # attrgetter with one name returns the bare value, not a 1-tuple
+        return names, lambda record: (getter(record),)
+    return names, getter
+
+
 @dataclass(frozen=True)
 class ExporterMetadata:
     """
@@ -8,11 +8,11 @@ Automatically registered and available via the exporter registry.
 from __future__ import annotations
 
 import csv
-from dataclasses import asdict
+import operator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from color_tools.exporters.base import PaletteExporter, ExporterMetadata
+from color_tools.exporters.base import PaletteExporter, ExporterMetadata, WRITE_BUFFER_SIZE, record_fields
 from color_tools.exporters import register_exporter
 
 if TYPE_CHECKING:
@@ -20,6 +20,22 @@ if TYPE_CHECKING:
     from color_tools.filament_palette import FilamentRecord
 
 
+_COLOR_FIELDS = operator.attrgetter('name', 'hex', 'rgb', 'hsl', 'lab', 'lch')
+
+
+def _color_row(color: ColorRecord) -> tuple:
+    """Build one color CSV row, joining each tuple field into a single cell."""
+    name, hex_code, rgb, hsl, lab, lch = _COLOR_FIELDS(color)
+    return (
+        name,
+        hex_code,
+        '%s,%s,%s' % rgb,
+        '%.1f,%.1f,%.1f' % hsl,
+        '%.1f,%.1f,%.1f' % lab,
+        '%.1f,%.1f,%.1f' % lch,
+    )
+
+
 @register_exporter
 class CSVExporter(PaletteExporter):
     """
@@ -66,28 +82,14 @@ class CSVExporter(PaletteExporter):
             return str(output_path)
         
         # Colors have tuples, need custom handling
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             # Write header
             writer.writerow(['name', 'hex', 'rgb', 'hsl', 'lab', 'lch'])
             
             # Write data rows
-            for color in colors:
-                # Convert tuples to comma-separated strings
-                rgb_str = ','.join(map(str, color.rgb))
-                hsl_str = ','.join(f'{v:.1f}' for v in color.hsl)
-                lab_str = ','.join(f'{v:.1f}' for v in color.lab)
-                lch_str = ','.join(f'{v:.1f}' for v in color.lch)
-                
-                writer.writerow([
-                    color.name,
-                    color.hex,
-                    rgb_str,
-                    hsl_str,
-                    lab_str,
-                    lch_str
-                ])
+            writer.writerows(_color_row(color) for color in colors)
         
         return str(output_path)
     
@@ -109,14 +111,13 @@ class CSVExporter(PaletteExporter):
                 writer.writerow(['id', 'maker', 'type', 'finish', 'color', 'hex', 'td_value'])
             return str(output_path)
         
-        # Get all field names from first filament (dataclass)
-        fieldnames = list(asdict(filaments[0]).keys())
+        # Get all field names from the first filament's dataclass
+        fieldnames, values = record_fields(type(filaments[0]))
         
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             
-            for filament in filaments:
-                writer.writerow(asdict(filament))
+            writer.writerows(values(filament) for filament in filaments)
         
         return str(output_path)
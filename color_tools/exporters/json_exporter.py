@@ -10,11 +10,10 @@ The exporter is automatically registered and available via the exporter registry
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, TextIO
 
-from color_tools.exporters.base import PaletteExporter, ExporterMetadata
+from color_tools.exporters.base import PaletteExporter, ExporterMetadata, WRITE_BUFFER_SIZE, record_fields
 from color_tools.exporters import register_exporter
 
 if TYPE_CHECKING:
@@ -22,6 +21,25 @@ if TYPE_CHECKING:
     from color_tools.filament_palette import FilamentRecord
 
 
+def _write_json_array(f: TextIO, records: Iterable) -> None:
+    """
+    Write dataclass records to f as a JSON array, one record at a time.
+    
+    Output matches json.dump([asdict(r) for r in records], f, indent=2,
+    ensure_ascii=False) byte for byte, without holding every record's dict
+    in memory at once. Re-indenting on "\n" is safe because json.dumps
+    escapes newlines inside strings.
+    """
+    first = True
+    for record in records:
+        names, values = record_fields(type(record))
+        f.write("[\n  " if first else ",\n  ")
+        text = json.dumps(dict(zip(names, values(record))), indent=2, ensure_ascii=False)
+        f.write(text.replace("\n", "\n  "))
+        first = False
+    f.write("[]" if first else "\n]")
+
+
 @register_exporter
 class JSONExporter(PaletteExporter):
     """
@@ -65,11 +83,8 @@ class JSONExporter(PaletteExporter):
         
         output_path = Path(output_path)
         
-        # Convert dataclasses to dicts
-        data = [asdict(c) for c in colors]
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            _write_json_array(f, colors)
         
         return str(output_path)
     
@@ -84,10 +99,7 @@ class JSONExporter(PaletteExporter):
         
         output_path = Path(output_path)
         
-        # Convert dataclasses to dicts
-        data = [asdict(f) for f in filaments]
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            _write_json_array(f, filaments)
         
         return str(output_path)
@@ -29,7 +29,6 @@ from typing import TYPE_CHECKING
 
 from color_tools.exporters import register_exporter
 from color_tools.exporters.base import ExporterMetadata, PaletteExporter
-from color_tools.image.png_writer import SimplePNGWriter
 
 if TYPE_CHECKING:
     from color_tools.filament_palette import FilamentRecord
@@ -85,6 +84,10 @@ class PaletteLutExporter(PaletteExporter):
         output_path: Path | str | None,
     ) -> str:
         """Write a 1×N LUT PNG strip from a list of ColorRecords."""
+        # Imported here: color_tools.image's package __init__ pulls in Pillow
+        # and numpy, which every `import color_tools` would otherwise pay for.
+        from color_tools.image.png_writer import SimplePNGWriter
+
         if output_path is None:
             output_path = Path(f"palette_lut_{len(colors)}.png")
 
@@ -174,21 +174,63 @@ def _parse_filament_records(data: list, source_file: str = "JSON data") -> List[
     return records
 
 
-def load_filaments(json_path: Path | str | None = None) -> List[FilamentRecord]:
+def _filament_override_messages(
+    records: List[FilamentRecord], user_records: List[FilamentRecord]
+) -> List[str]:
+    """Describe user filaments that replace core filaments exactly or by RGB."""
+    # For filaments, we consider a conflict when maker+type+color+hex all match
+    core_sigs = {}
+    for r in records:
+        sig = (r.maker, r.type, r.color, r.hex)
+        core_sigs[sig] = r
+    
+    exact_overrides = []
+    rgb_overrides = []
+    core_rgbs = {r.rgb: r for r in records}
+    
+    for user_record in user_records:
+        # Check for exact filament match (same maker+type+color+hex)
+        user_sig = (user_record.maker, user_record.type, user_record.color, user_record.hex)
+        if user_sig in core_sigs:
+            core_record = core_sigs[user_sig]
+            exact_overrides.append((
+                f"{user_record.maker} {user_record.type} {user_record.color}",
+                core_record.source,
+                user_record.source
+            ))
+        
+        # Check for RGB conflicts (different filaments with same RGB)
+        elif user_record.rgb in core_rgbs:
+            core_record = core_rgbs[user_record.rgb]
+            rgb_overrides.append((
+                f"{user_record.maker} {user_record.type} {user_record.color} {user_record.rgb}",
+                f"{core_record.maker} {core_record.type} {core_record.color} ({core_record.source})",
+                user_record.source
+            ))
+    
+    messages = []
+    if exact_overrides:
+        messages.append(f"User filaments override {len(exact_overrides)} core filaments exactly: {exact_overrides}")
+    if rgb_overrides:
+        messages.append(f"User filaments override {len(rgb_overrides)} core filaments by RGB: {rgb_overrides}")
+    return messages
+
+
+def load_filaments_with_overrides(
+    json_path: Path | str | None = None,
+) -> Tuple[List[FilamentRecord], List[str]]:
     """
-    Load filament database from JSON files (core + user additions).
+    Load filaments like load_filaments(), also returning the user override messages.
     
-    Loads filaments from both the core filaments.json file and optional 
-    user/user-filaments.json file in the data directory. Core filaments are loaded 
-    first, followed by user filaments.
+    load_filaments() only logs these messages; this returns them so callers
+    such as the --check-overrides report can show them directly.
     
     Args:
-        json_path: Path to directory containing JSON files, or path to specific
-                   filaments JSON file. If None, looks for filaments.json in 
-                   the package's data/ directory.
+        json_path: Same as for load_filaments()
     
     Returns:
-        List of FilamentRecord objects (core filaments + user filaments)
+        Tuple of (records, override_messages). override_messages is empty
+        when there is no user-filaments.json or nothing is overridden.
     """
     if json_path is None:
         # Default: look in package's data/ directory
@@ -213,6 +255,7 @@ def load_filaments(json_path: Path | str | None = None) -> List[FilamentRecord]:
     
     # Parse core filament records using helper function
     records = _parse_filament_records(data, str(json_path))
+    overrides: List[str] = []
     
     # Load optional user filaments from same directory
     user_json_path = data_dir / ColorConstants.USER_FILAMENTS_JSON_FILENAME
@@ -226,65 +269,53 @@ def load_filaments(json_path: Path | str | None = None) -> List[FilamentRecord]:
         # Parse user filament records using helper function
         user_records = _parse_filament_records(user_data, str(user_json_path))
         
-        # Detect and log overrides before merging
+        # Detect overrides before merging
         if user_records:
-            # For filaments, we consider a conflict when maker+type+color+hex all match
-            core_sigs = {}
-            for r in records:
-                sig = (r.maker, r.type, r.color, r.hex)
-                core_sigs[sig] = r
-            
-            exact_overrides = []
-            rgb_overrides = []
-            core_rgbs = {r.rgb: r for r in records}
-            
-            for user_record in user_records:
-                # Check for exact filament match (same maker+type+color+hex)
-                user_sig = (user_record.maker, user_record.type, user_record.color, user_record.hex)
-                if user_sig in core_sigs:
-                    core_record = core_sigs[user_sig]
-                    exact_overrides.append((
-                        f"{user_record.maker} {user_record.type} {user_record.color}",
-                        core_record.source,
-                        user_record.source
-                    ))
-                
-                # Check for RGB conflicts (different filaments with same RGB)
-                elif user_record.rgb in core_rgbs:
-                    core_record = core_rgbs[user_record.rgb]
-                    rgb_overrides.append((
-                        f"{user_record.maker} {user_record.type} {user_record.color} {user_record.rgb}",
-                        f"{core_record.maker} {core_record.type} {core_record.color} ({core_record.source})",
-                        user_record.source
-                    ))
-            
-            # Log override information
-            if exact_overrides:
-                logger.info(f"User filaments override {len(exact_overrides)} core filaments exactly: {exact_overrides}")
-            if rgb_overrides:
-                logger.info(f"User filaments override {len(rgb_overrides)} core filaments by RGB: {rgb_overrides}")
+            overrides = _filament_override_messages(records, user_records)
         
         records.extend(user_records)
     
     logger.debug("Loaded %d filaments from %s", len(records), json_path)
-    return records
+    return records, overrides
 
 
-def load_maker_synonyms(json_path: Path | str | None = None) -> Dict[str, List[str]]:
+def load_filaments(json_path: Path | str | None = None) -> List[FilamentRecord]:
     """
-    Load maker synonyms from JSON files (core + user additions).
+    Load filament database from JSON files (core + user additions).
     
-    Loads synonyms from both the core maker_synonyms.json file and optional
-    user/user-synonyms.json file in the data directory. Synonyms are merged, with
-    user additions extending or replacing core synonyms per maker.
+    Loads filaments from both the core filaments.json file and optional 
+    user/user-filaments.json file in the data directory. Core filaments are loaded 
+    first, followed by user filaments.
     
     Args:
         json_path: Path to directory containing JSON files, or path to specific
-                   maker_synonyms JSON file. If None, looks for maker_synonyms.json 
-                   in the package's data/ directory.
+                   filaments JSON file. If None, looks for filaments.json in 
+                   the package's data/ directory.
     
     Returns:
-        Dictionary mapping canonical maker names to lists of synonyms
+        List of FilamentRecord objects (core filaments + user filaments)
+    """
+    records, overrides = load_filaments_with_overrides(json_path)
+    for message in overrides:
+        logger.info("%s", message)
+    return records
+
+
+def load_maker_synonyms_with_overrides(
+    json_path: Path | str | None = None,
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Load synonyms like load_maker_synonyms(), also returning the override messages.
+    
+    load_maker_synonyms() only logs these messages; this returns them so
+    callers such as the --check-overrides report can show them directly.
+    
+    Args:
+        json_path: Same as for load_maker_synonyms()
+    
+    Returns:
+        Tuple of (synonyms, override_messages). override_messages is empty
+        when there is no user-synonyms.json or nothing is overridden.
     """
     if json_path is None:
         # Default: look in package's data/ directory
@@ -305,6 +336,7 @@ def load_maker_synonyms(json_path: Path | str | None = None) -> Dict[str, List[s
             synonyms = json.load(f)
     except FileNotFoundError:
         synonyms = {}
+    overrides: List[str] = []
     
     # Load optional user synonyms from same directory and merge
     user_json_path = data_dir / ColorConstants.USER_SYNONYMS_JSON_FILENAME
@@ -312,7 +344,7 @@ def load_maker_synonyms(json_path: Path | str | None = None) -> Dict[str, List[s
         with open(user_json_path, "r", encoding="utf-8") as f:
             user_synonyms = json.load(f)
         
-        # Log synonym overrides before merging
+        # Track synonym overrides while merging
         overridden_makers = []
         extended_makers = []
         
@@ -342,12 +374,34 @@ def load_maker_synonyms(json_path: Path | str | None = None) -> Dict[str, List[s
                 # Add new maker with their synonyms
                 synonyms[maker] = user_syn_list
         
-        # Log override information
+        # Describe override information
         if overridden_makers:
-            logger.info(f"User synonyms override {len(overridden_makers)} core makers: {[(m, f'core: {c}', f'user: {u}') for m, c, u in overridden_makers]}")
+            overrides.append(f"User synonyms override {len(overridden_makers)} core makers: {[(m, f'core: {c}', f'user: {u}') for m, c, u in overridden_makers]}")
         if extended_makers:
-            logger.info(f"User synonyms extend {len(extended_makers)} core makers: {[(m, f'{old}->{new} synonyms') for m, old, new in extended_makers]}")
+            overrides.append(f"User synonyms extend {len(extended_makers)} core makers: {[(m, f'{old}->{new} synonyms') for m, old, new in extended_makers]}")
+    
+    return synonyms, overrides
+
+
+def load_maker_synonyms(json_path: Path | str | None = None) -> Dict[str, List[str]]:
+    """
+    Load maker synonyms from JSON files (core + user additions).
+    
+    Loads synonyms from both the core maker_synonyms.json file and optional
+    user/user-synonyms.json file in the data directory. Synonyms are merged, with
+    user additions extending or replacing core synonyms per maker.
     
+    Args:
+        json_path: Path to directory containing JSON files, or path to specific
+                   maker_synonyms JSON file. If None, looks for maker_synonyms.json 
+                   in the package's data/ directory.
+    
+    Returns:
+        Dictionary mapping canonical maker names to lists of synonyms
+    """
+    synonyms, overrides = load_maker_synonyms_with_overrides(json_path)
+    for message in overrides:
+        logger.info("%s", message)
     return synonyms
 
 
@@ -873,6 +927,38 @@ class FilamentPalette:
         """Get sorted list of all finishes."""
         return sorted(self._by_finish.keys())
 
+    def group_counts(self, group: str) -> List[Tuple[str, int]]:
+        """
+        Get (name, filament count) pairs for every maker, type, or finish.
+
+        Counts come straight from the lookup indices, so listing all groups
+        is a single pass rather than one ``find_by_*`` call per group. Maker
+        counts still honour synonyms, matching ``len(find_by_maker(name))``.
+
+        Args:
+            group: One of ``"maker"``, ``"type"``, or ``"finish"``.
+
+        Returns:
+            List of (name, count) tuples sorted by name.
+
+        Raises:
+            ValueError: If group is not a known grouping.
+        """
+        indices = {"maker": self._by_maker, "type": self._by_type, "finish": self._by_finish}
+        if group not in indices:
+            raise ValueError(f"Unknown group {group!r}; expected one of {sorted(indices)}")
+        index = indices[group]
+        counts = []
+        for name in sorted(index):
+            if group == "maker":
+                # Only synonyms that are themselves index keys change the count
+                aliases = self._expand_maker_names([name]) & index.keys()
+                if len(aliases) > 1:
+                    counts.append((name, len(self.find_by_maker(name))))
+                    continue
+            counts.append((name, len(index[name])))
+        return counts
+
     def get_override_info(self) -> Dict[str, Dict[str, Any]]:
         """
         Get information about user overrides in this filament palette.
@@ -90,6 +90,7 @@ try:
         analyze_contrast,
         analyze_noise_level,
         analyze_dynamic_range,
+        analyze_batch,
         transform_image,
         simulate_cvd_image,
         correct_cvd_image,
@@ -136,6 +137,7 @@ except ImportError:
     analyze_contrast = _not_available
     analyze_noise_level = _not_available
     analyze_dynamic_range = _not_available
+    analyze_batch = _not_available
     
     # Image transformation functions
     transform_image = _not_available
@@ -187,6 +189,7 @@ __all__ = [
     'analyze_contrast', 
     'analyze_noise_level',
     'analyze_dynamic_range',
+    'analyze_batch',
     # Image transformation functions
     'transform_image',
     'simulate_cvd_image',
@@ -37,6 +37,7 @@ def convert_image(
     output_format: str | None = None,
     quality: int | None = None,
     lossless: bool | None = None,
+    optimize: bool | None = None,
 ) -> Path:
     """
     Convert an image from one format to another with sensible quality defaults.
@@ -54,6 +55,10 @@ def convert_image(
                  - AVIF: 80 for lossy compression
         lossless: Force lossless compression for formats that support it (WebP, AVIF).
                   If None, WebP uses lossless by default.
+        optimize: Run the extra encoder pass that shrinks JPEG/PNG output
+                  (optimal Huffman tables / best zlib settings). Output pixels
+                  are identical either way. If None, defaults to True; pass
+                  False for faster saves at the cost of larger files.
     
     Returns:
         Path object pointing to the created output file
@@ -78,6 +83,9 @@ def convert_image(
         
         >>> # WebP with lossy compression
         >>> convert_image("photo.png", output_format="webp", lossless=False, quality=80)
+        
+        >>> # Faster JPEG save, skipping the Huffman optimization pass
+        >>> convert_image("photo.png", output_format="jpg", optimize=False)
     """
     input_path = Path(input_path)
     
@@ -125,12 +133,14 @@ def convert_image(
         
         # Prepare save options
         save_kwargs = {}
+        if optimize is None:
+            optimize = True
         
         # Format-specific quality/compression settings
         if output_format == "jpeg":
             # JPEG quality: 67 is Photoshop quality 8/12 equivalent
             save_kwargs["quality"] = quality if quality is not None else 67
-            save_kwargs["optimize"] = True
+            save_kwargs["optimize"] = optimize
         
         elif output_format == "webp":
             # WebP: Default to lossless unless explicitly set to lossy
@@ -151,7 +161,7 @@ def convert_image(
         
         elif output_format == "png":
             # PNG is always lossless, optimize compression
-            save_kwargs["optimize"] = True
+            save_kwargs["optimize"] = optimize
         
         # Save converted image (output_format is guaranteed non-None at this point)
         assert output_format is not None, "output_format should be set by now"
@@ -173,6 +173,37 @@ def _calculate_position(
     return positions_map[position]
 
 
+def _composite_watermark(
+    image: Image.Image,
+    watermark: Image.Image,
+    position: tuple[int, int]
+) -> Image.Image:
+    """
+    Alpha-composite an RGBA watermark onto a copy of an RGBA image.
+    
+    Only the watermark's footprint is composited, rather than a transparent
+    overlay the size of the whole image; the result is pixel-for-pixel the
+    same. Parts of the watermark outside the image are clipped.
+    
+    Args:
+        image: RGBA base image (not modified)
+        watermark: RGBA watermark image
+        position: (x, y) of the watermark's top-left corner; may be negative
+        
+    Returns:
+        New RGBA image with the watermark applied
+    """
+    x, y = position
+    # The patch matches the overlay region the watermark covers, shifted so
+    # its top-left corner lies inside the image
+    patch = Image.new('RGBA', watermark.size, (0, 0, 0, 0))
+    patch.paste(watermark, (min(x, 0), min(y, 0)), watermark)
+    
+    watermarked = image.copy()
+    watermarked.alpha_composite(patch, dest=(max(x, 0), max(y, 0)))
+    return watermarked
+
+
 def add_text_watermark(
     image: Image.Image,
     text: str,
@@ -329,10 +360,8 @@ def add_image_watermark(
     
     # Apply opacity
     if opacity < 1.0:
-        # Split into channels and adjust alpha
-        r, g, b, a = watermark.split()
-        a = a.point(lambda x: int(x * opacity))
-        watermark = Image.merge('RGBA', (r, g, b, a))
+        # Scale the alpha channel in place; RGB is left untouched
+        watermark.putalpha(watermark.getchannel('A').point(lambda x: int(x * opacity)))
     
     # Calculate position
     x, y = _calculate_position(
@@ -342,14 +371,8 @@ def add_image_watermark(
         margin
     )
     
-    # Create overlay and paste watermark
-    overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-    overlay.paste(watermark, (x, y), watermark)
-    
-    # Composite overlay onto original image
-    watermarked = Image.alpha_composite(image, overlay)
-    
-    return watermarked
+    # Composite the watermark onto a copy of the base image
+    return _composite_watermark(image, watermark, (x, y))
 
 
 def add_svg_watermark(
@@ -420,9 +443,7 @@ def add_svg_watermark(
     
     # Apply opacity
     if opacity < 1.0:
-        r, g, b, a = watermark.split()
-        a = a.point(lambda x: int(x * opacity))
-        watermark = Image.merge('RGBA', (r, g, b, a))
+        watermark.putalpha(watermark.getchannel('A').point(lambda x: int(x * opacity)))
     
     # Calculate position
     x, y = _calculate_position(
@@ -436,13 +457,7 @@ def add_svg_watermark(
     if image.mode != 'RGBA':
         image = image.convert('RGBA')
     
-    # Create overlay and paste watermark
-    overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
-    overlay.paste(watermark, (x, y), watermark)
-    
-    # Composite overlay onto original image
-    watermarked = Image.alpha_composite(image, overlay)
-    
-    return watermarked
+    # Composite the watermark onto a copy of the base image
+    return _composite_watermark(image, watermark, (x, y))
 
 
@@ -60,17 +60,28 @@ def _get_style() -> "Style | None":
 # Parser introspection helpers
 # ---------------------------------------------------------------------------
 
+# Subparsers already built by _get_subparser(), keyed on command name. The
+# wizard asks for choices many times per session; building the parser once
+# per command avoids repeating the argparse construction each time.
+_SUBPARSER_CACHE: "dict[str, argparse.ArgumentParser | None]" = {}
+
+
 def _get_subparser(command: str) -> "argparse.ArgumentParser | None":
     """Return the subparser for the given command name, or None."""
+    if command in _SUBPARSER_CACHE:
+        return _SUBPARSER_CACHE[command]
+    sub = None
     try:
         from .cli import build_parser
-        parser = build_parser()
+        parser = build_parser(command, lazy=True)
         for action in parser._actions:
             if hasattr(action, '_name_parser_map'):
-                return action._name_parser_map.get(command)
+                sub = action._name_parser_map.get(command)
+                break
     except Exception:
-        pass
-    return None
+        return None
+    _SUBPARSER_CACHE[command] = sub
+    return sub
 
 
 def _get_choices(command: str, dest: str) -> list[str]:
@@ -37,7 +37,12 @@ Example:
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Tuple, Dict, List, Optional, Union, Set, Any
+from typing import Callable, Tuple, Dict, List, Optional, Union, Set, Any, Iterable
+from collections import OrderedDict
+from functools import partial
+from operator import itemgetter
+import functools
+import heapq
 import json
 import logging
 from pathlib import Path
@@ -158,34 +163,67 @@ def _parse_color_records(data: list, source_file: str = "JSON data") -> List[Col
 
 
 
-def load_colors(json_path: Path | str | None = None) -> List[ColorRecord]:
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it can't be stat()ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _color_override_messages(
+    records: List[ColorRecord], user_records: List[ColorRecord]
+) -> List[str]:
+    """Describe user colors that replace core colors by name or by RGB."""
+    core_names = {r.name.lower(): r for r in records}
+    core_rgbs = {r.rgb: r for r in records}
+    
+    name_overrides = []
+    rgb_overrides = []
+    
+    for user_record in user_records:
+        # Check for name conflicts
+        if user_record.name.lower() in core_names:
+            core_record = core_names[user_record.name.lower()]
+            name_overrides.append((user_record.name, core_record.source, user_record.source))
+        
+        # Check for RGB conflicts (different records with same RGB)
+        if user_record.rgb in core_rgbs:
+            core_record = core_rgbs[user_record.rgb]
+            if core_record.name.lower() != user_record.name.lower():  # Different names, same RGB
+                rgb_overrides.append((
+                    f"{user_record.name} {user_record.rgb}",
+                    f"{core_record.name} ({core_record.source})",
+                    user_record.source
+                ))
+    
+    messages = []
+    if name_overrides:
+        messages.append(f"User colors override {len(name_overrides)} core colors by name: {name_overrides}")
+    if rgb_overrides:
+        messages.append(f"User colors override {len(rgb_overrides)} core colors by RGB: {rgb_overrides}")
+    return messages
+
+
+@functools.lru_cache(maxsize=8)
+def _load_color_records(
+    json_path: Path,
+    core_stamp: Optional[Tuple[int, int]],
+    user_json_path: Path,
+    user_stamp: Optional[Tuple[int, int]],
+) -> Tuple[Tuple[ColorRecord, ...], Tuple[str, ...]]:
     """
-    Load CSS color database from JSON files (core + user additions).
+    Parse core + user colors for load_colors().
     
-    Loads colors from both the core colors.json file and optional user/user-colors.json
-    file in the data directory. Core colors are loaded first, followed by user colors.
-    
-    Args:
-        json_path: Path to directory containing JSON files, or path to specific
-                   colors JSON file. If None, looks for colors.json in the 
-                   package's data/ directory.
+    Cached on each file's (mtime_ns, size), so loading the same unchanged
+    files again in one process skips the JSON parse; editing either file
+    changes the key and forces a reload. Records are frozen, so the tuple
+    is safe to share - load_colors() hands callers their own list.
     
     Returns:
-        List of ColorRecord objects (core colors + user colors)
+        Tuple of (records, override messages)
     """
-    if json_path is None:
-        # Default: look in package's data/ directory
-        data_dir = Path(__file__).parent / "data"
-        json_path = data_dir / ColorConstants.COLORS_JSON_FILENAME
-    else:
-        json_path = Path(json_path)
-        # If it's a directory, append the filename
-        if json_path.is_dir():
-            data_dir = json_path
-            json_path = json_path / ColorConstants.COLORS_JSON_FILENAME
-        else:
-            data_dir = json_path.parent
-    
     # Load core colors
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -196,10 +234,10 @@ def load_colors(json_path: Path | str | None = None) -> List[ColorRecord]:
     
     # Parse color records using helper function
     records = _parse_color_records(data, str(json_path))
+    overrides: List[str] = []
     
     # Load optional user colors from same directory
-    user_json_path = data_dir / ColorConstants.USER_COLORS_JSON_FILENAME
-    if user_json_path.exists():
+    if user_stamp is not None:
         with open(user_json_path, "r", encoding="utf-8") as f:
             user_data = json.load(f)
         
@@ -209,39 +247,72 @@ def load_colors(json_path: Path | str | None = None) -> List[ColorRecord]:
         # Parse user color records using helper function
         user_records = _parse_color_records(user_data, str(user_json_path))
         
-        # Detect and log overrides before merging
+        # Detect overrides before merging
         if user_records:
-            core_names = {r.name.lower(): r for r in records}
-            core_rgbs = {r.rgb: r for r in records}
-            
-            name_overrides = []
-            rgb_overrides = []
-            
-            for user_record in user_records:
-                # Check for name conflicts
-                if user_record.name.lower() in core_names:
-                    core_record = core_names[user_record.name.lower()]
-                    name_overrides.append((user_record.name, core_record.source, user_record.source))
-                
-                # Check for RGB conflicts (different records with same RGB)
-                if user_record.rgb in core_rgbs:
-                    core_record = core_rgbs[user_record.rgb]
-                    if core_record.name.lower() != user_record.name.lower():  # Different names, same RGB
-                        rgb_overrides.append((
-                            f"{user_record.name} {user_record.rgb}",
-                            f"{core_record.name} ({core_record.source})",
-                            user_record.source
-                        ))
-            
-            # Log override information
-            if name_overrides:
-                logger.info(f"User colors override {len(name_overrides)} core colors by name: {name_overrides}")
-            if rgb_overrides:
-                logger.info(f"User colors override {len(rgb_overrides)} core colors by RGB: {rgb_overrides}")
+            overrides = _color_override_messages(records, user_records)
         
         records.extend(user_records)
     
+    return tuple(records), tuple(overrides)
+
+
+def load_colors_with_overrides(
+    json_path: Path | str | None = None,
+) -> Tuple[List[ColorRecord], List[str]]:
+    """
+    Load colors like load_colors(), also returning the user override messages.
+    
+    load_colors() only logs these messages; this returns them so callers such
+    as the --check-overrides report can show them directly.
+    
+    Args:
+        json_path: Same as for load_colors()
+    
+    Returns:
+        Tuple of (records, override_messages). override_messages describes
+        user colors that replace core colors by name or RGB, and is empty
+        when there is no user-colors.json or nothing is overridden.
+    """
+    if json_path is None:
+        # Default: look in package's data/ directory
+        data_dir = Path(__file__).parent / "data"
+        json_path = data_dir / ColorConstants.COLORS_JSON_FILENAME
+    else:
+        json_path = Path(json_path)
+        # If it's a directory, append the filename
+        if json_path.is_dir():
+            data_dir = json_path
+            json_path = json_path / ColorConstants.COLORS_JSON_FILENAME
+        else:
+            data_dir = json_path.parent
+    
+    user_json_path = data_dir / ColorConstants.USER_COLORS_JSON_FILENAME
+    records, overrides = _load_color_records(
+        json_path, _file_stamp(json_path), user_json_path, _file_stamp(user_json_path)
+    )
+    
     logger.debug("Loaded %d CSS colors from %s", len(records), json_path)
+    return list(records), list(overrides)
+
+
+def load_colors(json_path: Path | str | None = None) -> List[ColorRecord]:
+    """
+    Load CSS color database from JSON files (core + user additions).
+    
+    Loads colors from both the core colors.json file and optional user/user-colors.json
+    file in the data directory. Core colors are loaded first, followed by user colors.
+    
+    Args:
+        json_path: Path to directory containing JSON files, or path to specific
+                   colors JSON file. If None, looks for colors.json in the 
+                   package's data/ directory.
+    
+    Returns:
+        List of ColorRecord objects (core colors + user colors)
+    """
+    records, overrides = load_colors_with_overrides(json_path)
+    for message in overrides:
+        logger.info("%s", message)
     return records
 
 
@@ -333,6 +404,20 @@ def load_palette(name: str, json_path: "Path | str | None" = None) -> 'Palette':
         
         raise FileNotFoundError(error_msg)
     
+    records = _load_palette_records(palette_file, _file_stamp(palette_file))
+    return Palette(list(records))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_palette_records(
+    palette_file: Path, stamp: Optional[Tuple[int, int]]
+) -> Tuple[ColorRecord, ...]:
+    """
+    Parse a palette file for load_palette(), cached on its (mtime_ns, size).
+    
+    Raises:
+        ValueError: If the palette file is malformed or contains invalid data
+    """
     # Load the palette JSON data
     try:
         with open(palette_file, "r", encoding="utf-8") as f:
@@ -344,9 +429,7 @@ def load_palette(name: str, json_path: "Path | str | None" = None) -> 'Palette':
         raise ValueError(f"Expected array of colors at root level in {palette_file}")
     
     # Parse color records using shared helper function
-    records = _parse_color_records(data, str(palette_file))
-    
-    return Palette(records)
+    return tuple(_parse_color_records(data, str(palette_file)))
 
 
 
@@ -354,6 +437,43 @@ def load_palette(name: str, json_path: "Path | str | None" = None) -> 'Palette':
 # Helper Functions
 # ============================================================================
 
+# Per-palette bound on memoized nearest_color()/nearest_colors() queries
+_NEAREST_CACHE_SIZE = 4096
+
+
+def _lab_distance_fn(
+    metric: str,
+    cmc_l: float = ColorConstants.CMC_L_DEFAULT,
+    cmc_c: float = ColorConstants.CMC_C_DEFAULT,
+) -> Callable[[Tuple[float, float, float], Tuple[float, float, float]], float]:
+    """
+    Resolve a LAB distance metric name to a two-argument distance function.
+    
+    Resolving once up front keeps the metric (and CMC l:c) dispatch out of the
+    per-record loops in the nearest-color searches.
+    
+    Raises:
+        ValueError: If the metric name is unknown
+    """
+    metric_l = metric.lower()
+    if metric_l in ("de2000", "ciede2000"):
+        return delta_e_2000
+    if metric_l in ("de94", "cie94"):
+        return delta_e_94
+    if metric_l in ("de76", "cie76", "euclidean"):
+        return delta_e_76
+    if metric_l in ("cmc", "decmc", "cmc21", "cmc11"):
+        # Allow shorthands
+        if metric_l == "cmc21":
+            cmc_l, cmc_c = ColorConstants.CMC_L_DEFAULT, ColorConstants.CMC_C_DEFAULT
+        elif metric_l == "cmc11":
+            cmc_l, cmc_c = ColorConstants.CMC_C_DEFAULT, ColorConstants.CMC_C_DEFAULT
+        return partial(delta_e_cmc, l=cmc_l, c=cmc_c)
+    if metric_l == "hyab":
+        return delta_e_hyab
+    raise ValueError("Unknown metric. Use 'euclidean'/'de76'/'de94'/'de2000'/'cmc'/'hyab'.")
+
+
 # ============================================================================
 # Palette Classes
 # ============================================================================
@@ -367,10 +487,24 @@ class Palette:
     we keep multiple dictionaries pointing to the same ColorRecords.
     
     For a palette with ~150 CSS colors, this is totally fine! 🚀
+    
+    Nearest-color queries are memoized per palette (bounded LRU). ``records``
+    is stored as a tuple so it can't be mutated in place behind the cache;
+    assigning a new sequence rebuilds the indices and clears the memo.
     """
     
     def __init__(self, records: List[ColorRecord]) -> None:
         self.records = records
+
+    @property
+    def records(self) -> Tuple[ColorRecord, ...]:
+        """All colors in the palette, in load order."""
+        return self._records
+
+    @records.setter
+    def records(self, records: Iterable[ColorRecord]) -> None:
+        self._records: Tuple[ColorRecord, ...] = tuple(records)
+        self._nearest_cache: OrderedDict[tuple, Any] = OrderedDict()
         
         # Build multiple indices for O(1) lookups with user override priority
         self._by_name: Dict[str, ColorRecord] = {}
@@ -380,7 +514,7 @@ class Palette:
         self._by_lch: Dict[str, ColorRecord] = {}
         
         # Populate indices with override priority
-        for record in records:
+        for record in self._records:
             name_key = record.name.lower()
             hsl_key = _rounded_key(record.hsl)
             lab_key = _rounded_key(record.lab)
@@ -432,6 +566,24 @@ class Palette:
         """Find color by LCH match (with rounding for fuzzy matching)."""
         return self._by_lch.get(_rounded_key(lch, rounding))
 
+    def _cached_nearest(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return the memoized result for a nearest-color query, computing it on a miss.
+        
+        Repeated queries (the same color looked up many times while mapping an
+        image, or by naming helpers) skip the full distance scan. The cache is
+        a bounded LRU so long-running sessions can't grow it without limit.
+        """
+        cache = self._nearest_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = compute()
+        cache[key] = result
+        if len(cache) > _NEAREST_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
     def nearest_color(
         self,
         value: Tuple[float, float, float],
@@ -456,6 +608,20 @@ class Palette:
         Returns:
             (nearest_color_record, distance) tuple
         """
+        key = (tuple(value), space.lower(), metric.lower(), cmc_l, cmc_c)
+        return self._cached_nearest(
+            key, lambda: self._nearest_color_uncached(value, space, metric, cmc_l, cmc_c)
+        )
+
+    def _nearest_color_uncached(
+        self,
+        value: Tuple[float, float, float],
+        space: str,
+        metric: str,
+        cmc_l: float,
+        cmc_c: float,
+    ) -> Tuple[ColorRecord, float]:
+        """Linear scan behind nearest_color(); see that method for details."""
         best_rec: Optional[ColorRecord] = None
         best_d = float("inf")
 
@@ -463,8 +629,14 @@ class Palette:
 
         # RGB space - use simple Euclidean distance
         if space.lower() == "rgb":
+            # An exact palette entry is always nearest (distance 0), and the RGB
+            # index already resolves duplicates by source priority like the scan
+            exact = self._by_rgb.get(tuple(value))  # type: ignore[arg-type]
+            if exact is not None:
+                return exact, 0.0
+            target = tuple(map(float, value))
             for r in self.records:
-                d = euclidean(tuple(map(float, value)), tuple(map(float, r.rgb)))
+                d = euclidean(target, r.rgb)
                 if d < best_d or (d == best_d and best_rec and _should_prefer_source(r.source, best_rec.source)):
                     best_rec, best_d = r, d
             logger.debug("nearest_color result: %s (%.4f)", getattr(best_rec, "name", None), best_d)
@@ -490,32 +662,9 @@ class Palette:
             return best_rec, best_d  # type: ignore
 
         # LAB space - choose the appropriate Delta E metric
-        metric_l = metric.lower()
-        if metric_l in ("de2000", "ciede2000"):
-            fn = delta_e_2000
-        elif metric_l in ("de94", "cie94"):
-            fn = delta_e_94
-        elif metric_l in ("de76", "cie76", "euclidean"):
-            fn = delta_e_76
-        elif metric_l in ("cmc", "decmc", "cmc21", "cmc11"):
-            # CMC has special handling for l:c ratios
-            fn = None  # Will handle specially below
-        elif metric_l == "hyab":
-            fn = delta_e_hyab
-        else:
-            raise ValueError("Unknown metric. Use 'euclidean'/'de76'/'de94'/'de2000'/'cmc'/'hyab'.")
-
+        distance = _lab_distance_fn(metric, cmc_l, cmc_c)
         for r in self.records:
-            if metric_l in ("cmc", "decmc", "cmc21", "cmc11"):
-                # Allow shorthands
-                l, c = cmc_l, cmc_c
-                if metric_l == "cmc21":
-                    l, c = ColorConstants.CMC_L_DEFAULT, ColorConstants.CMC_C_DEFAULT
-                elif metric_l == "cmc11":
-                    l, c = ColorConstants.CMC_C_DEFAULT, ColorConstants.CMC_C_DEFAULT
-                d = delta_e_cmc(value, r.lab, l=l, c=c)
-            else:
-                d = fn(value, r.lab)  # type: ignore
+            d = distance(value, r.lab)
             if d < best_d or (d == best_d and best_rec and _should_prefer_source(r.source, best_rec.source)):
                 best_rec, best_d = r, d
 
@@ -554,63 +703,43 @@ class Palette:
         count = min(count, 50)
         count = max(count, 1)
         
-        results: List[Tuple[ColorRecord, float]] = []
-
-        # RGB space - use simple Euclidean distance
-        if space.lower() == "rgb":
-            for r in self.records:
-                d = euclidean(tuple(map(float, value)), tuple(map(float, r.rgb)))
-                results.append((r, d))
-            results.sort(key=lambda x: x[1])
-            return results[:count]
-
-        # HSL space - use circular hue distance
-        if space.lower() == "hsl":
-            for r in self.records:
-                d = hsl_euclidean(value, r.hsl)
-                results.append((r, d))
-            results.sort(key=lambda x: x[1])
-            return results[:count]
-
-        # LCH space - use Euclidean distance with hue wraparound
-        if space.lower() == "lch":
-            for r in self.records:
-                d = hsl_euclidean(value, r.lch)  # hsl_euclidean handles circular hue properly
-                results.append((r, d))
-            results.sort(key=lambda x: x[1])
-            return results[:count]
+        key = (tuple(value), space.lower(), metric.lower(), cmc_l, cmc_c, count)
+        results = self._cached_nearest(
+            key, lambda: tuple(self._nearest_colors_uncached(value, space, metric, count, cmc_l, cmc_c))
+        )
+        # Hand back a fresh list so callers can't mutate the cached entry
+        return list(results)
 
-        # LAB space - choose the appropriate Delta E metric
-        metric_l = metric.lower()
-        if metric_l in ("de2000", "ciede2000"):
-            fn = delta_e_2000
-        elif metric_l in ("de94", "cie94"):
-            fn = delta_e_94
-        elif metric_l in ("de76", "cie76", "euclidean"):
-            fn = delta_e_76
-        elif metric_l in ("cmc", "decmc", "cmc21", "cmc11"):
-            # CMC has special handling for l:c ratios
-            fn = None  # Will handle specially below
-        elif metric_l == "hyab":
-            fn = delta_e_hyab
+    def _nearest_colors_uncached(
+        self,
+        value: Tuple[float, float, float],
+        space: str,
+        metric: str,
+        count: int,
+        cmc_l: float,
+        cmc_c: float,
+    ) -> List[Tuple[ColorRecord, float]]:
+        """Scoring pass behind nearest_colors(); see that method for details."""
+        # Score every record, then keep the closest `count`. nsmallest() is
+        # O(N log count) rather than sorting all N, and like sort() it keeps
+        # equal distances in palette order.
+        space_l = space.lower()
+        if space_l == "rgb":
+            # RGB space - use simple Euclidean distance
+            target = tuple(map(float, value))
+            results = [(r, euclidean(target, r.rgb)) for r in self.records]
+        elif space_l == "hsl":
+            # HSL space - use circular hue distance
+            results = [(r, hsl_euclidean(value, r.hsl)) for r in self.records]
+        elif space_l == "lch":
+            # LCH space - hsl_euclidean handles the circular hue properly
+            results = [(r, hsl_euclidean(value, r.lch)) for r in self.records]
         else:
-            raise ValueError("Unknown metric. Use 'euclidean'/'de76'/'de94'/'de2000'/'cmc'/'hyab'.")
+            # LAB space - choose the appropriate Delta E metric
+            distance = _lab_distance_fn(metric, cmc_l, cmc_c)
+            results = [(r, distance(value, r.lab)) for r in self.records]
 
-        for r in self.records:
-            if metric_l in ("cmc", "decmc", "cmc21", "cmc11"):
-                # Allow shorthands
-                l, c = cmc_l, cmc_c
-                if metric_l == "cmc21":
-                    l, c = ColorConstants.CMC_L_DEFAULT, ColorConstants.CMC_C_DEFAULT
-                elif metric_l == "cmc11":
-                    l, c = ColorConstants.CMC_C_DEFAULT, ColorConstants.CMC_C_DEFAULT
-                d = delta_e_cmc(value, r.lab, l=l, c=c)
-            else:
-                d = fn(value, r.lab)  # type: ignore
-            results.append((r, d))
-        
-        results.sort(key=lambda x: x[1])
-        return results[:count]
+        return heapq.nsmallest(count, results, key=itemgetter(1))
 
     def get_override_info(self) -> Dict[str, Dict[str, Dict[str, Tuple[str, str]]]]:
         """
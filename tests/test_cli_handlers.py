@@ -16,16 +16,36 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import sys
+import tempfile
 import unittest
 from argparse import Namespace
 from unittest.mock import MagicMock, patch
 
 
+_cache_dir = None
+_cache_patch = None
+
+
+def setUpModule():
+    """Point XDG_CACHE_HOME at a scratch dir so --list-palettes never writes the real palette index."""
+    global _cache_dir, _cache_patch
+    _cache_dir = tempfile.TemporaryDirectory()
+    _cache_patch = patch.dict(os.environ, {"XDG_CACHE_HOME": _cache_dir.name})
+    _cache_patch.start()
+
+
+def tearDownModule():
+    _cache_patch.stop()
+    _cache_dir.cleanup()
+
+
 # ---------------------------------------------------------------------------
 # CVD
 # ---------------------------------------------------------------------------
 
+
 class TestHandleCvdCommand(unittest.TestCase):
     """Tests for handle_cvd_command."""
 
@@ -139,6 +159,37 @@ class TestHandleCvdCommand(unittest.TestCase):
         code = self._run(args)
         self.assertEqual(code, 2)
 
+    # --- --values-file ---
+
+    def _values_file(self, text):
+        import tempfile, os
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.unlink, f.name)
+        return f.name
+
+    def test_values_file_transforms_each_line(self):
+        """--values-file prints one result per color, skipping blanks and comments."""
+        from color_tools.color_deficiency import simulate_cvd
+        path = self._values_file("255,0,0\n# reds and greens\n\n0 255 0\n#00f\n")
+        code, output = self._run_capture(self._make_args(values_file=path))
+        self.assertEqual(code, 0)
+        lines = output.splitlines()
+        self.assertEqual(lines[:2], ["Mode: simulate", "Type: protanopia (red-blind)"])
+        self.assertEqual(len(lines), 5)
+        r, g, b = simulate_cvd((0, 0, 255), 'protanopia')
+        self.assertEqual(lines[4], f"(0, 0, 255) -> ({r}, {g}, {b})")
+
+    def test_values_file_invalid_line_exits_2(self):
+        """An out-of-range color in --values-file exits 2."""
+        path = self._values_file("255,0,0\n256,0,0\n")
+        self.assertEqual(self._run(self._make_args(values_file=path)), 2)
+
+    def test_values_file_with_hex_exits_2(self):
+        """--values-file can't be combined with --hex."""
+        path = self._values_file("255,0,0\n")
+        self.assertEqual(self._run(self._make_args(values_file=path, hex='#FF0000')), 2)
+
 
 # ---------------------------------------------------------------------------
 # Name
@@ -317,6 +368,13 @@ class TestHandleConvertCommand(unittest.TestCase):
         defaults.update(kwargs)
         return Namespace(**defaults)
 
+    def test_every_cli_space_has_a_conversion(self):
+        """Each --from/--to choice has both an RGB-in and RGB-out conversion."""
+        from color_tools.cli import _CONVERT_SPACE_CHOICES
+        from color_tools.cli_commands.handlers.convert import _TO_RGB, _FROM_RGB
+        self.assertEqual(set(_TO_RGB), set(_CONVERT_SPACE_CHOICES))
+        self.assertEqual(set(_FROM_RGB), set(_CONVERT_SPACE_CHOICES))
+
     # --- --check-gamut branch ---
 
     def test_check_gamut_by_hex_exits_0(self):
@@ -337,6 +395,14 @@ class TestHandleConvertCommand(unittest.TestCase):
         _, output = self._run_capture(args)
         self.assertTrue('IN' in output or 'OUT OF' in output)
 
+    def test_check_gamut_hex_is_in_gamut_without_round_trip(self):
+        """A --hex color is reported in gamut without the LAB -> RGB check."""
+        args = self._make_args(hex='#00FF00', check_gamut=True)
+        with patch('color_tools.cli_commands.handlers.convert.is_in_srgb_gamut') as mock_check:
+            _, output = self._run_capture(args)
+        mock_check.assert_not_called()
+        self.assertIn('is IN sRGB gamut', output)
+
     def test_check_gamut_both_inputs_exits_2(self):
         """Gamut check with both --value and --hex exits 2."""
         args = self._make_args(value=[50.0, 0.0, 0.0], hex='#FF0000', check_gamut=True)
@@ -596,6 +662,17 @@ class TestHandleFilamentCommand(unittest.TestCase):
         code, _ = self._run_capture(args)
         self.assertEqual(code, 0)
 
+    def test_list_export_formats_skips_palette_load(self):
+        """--list-export-formats and --nearest input errors never load the palette."""
+        from color_tools.filament_palette import FilamentPalette
+        with patch.object(FilamentPalette, 'load_default') as load:
+            code, _ = self._run_capture(self._make_args(list_export_formats=True))
+            self.assertEqual(code, 0)
+            with patch('sys.stderr', io.StringIO()):
+                code, _ = self._run_capture(self._make_args(nearest=True))
+            self.assertEqual(code, 2)
+        load.assert_not_called()
+
     def test_nearest_by_hex_exits_0(self):
         """--nearest with --hex exits 0."""
         args = self._make_args(nearest=True, hex='#FF0000')
@@ -698,7 +775,7 @@ class TestHandleImageCommand(unittest.TestCase):
     def test_image_not_available_exits_1(self):
         """Exits 1 with helpful message when Pillow is not installed."""
         import color_tools.cli_commands.handlers.image as img_mod
-        with patch.object(img_mod, 'IMAGE_AVAILABLE', False):
+        with patch.object(img_mod, '_image_available', return_value=False):
             args = self._make_args()
             code, output = self._run_capture(args)
         self.assertEqual(code, 1)
@@ -707,7 +784,7 @@ class TestHandleImageCommand(unittest.TestCase):
         """Error message when Pillow missing mentions Pillow."""
         import color_tools.cli_commands.handlers.image as img_mod
         captured_err = io.StringIO()
-        with patch.object(img_mod, 'IMAGE_AVAILABLE', False):
+        with patch.object(img_mod, '_image_available', return_value=False):
             with patch('sys.stderr', captured_err):
                 args = self._make_args()
                 with self.assertRaises(SystemExit):
@@ -720,6 +797,14 @@ class TestHandleImageCommand(unittest.TestCase):
         code, _ = self._run_capture(args)
         self.assertEqual(code, 0)
 
+    def test_list_palettes_does_not_need_pillow(self):
+        """--list-palettes works even when Pillow is not installed."""
+        import color_tools.cli_commands.handlers.image as img_mod
+        with patch.object(img_mod, '_image_available', return_value=False):
+            code, output = self._run_capture(self._make_args(list_palettes=True))
+        self.assertEqual(code, 0)
+        self.assertIn('cga4', output)
+
     def test_list_palettes_output_has_palettes(self):
         """--list-palettes output lists palette names."""
         args = self._make_args(list_palettes=True)
@@ -766,6 +851,14 @@ class TestHandleImageCommand(unittest.TestCase):
         finally:
             os.unlink(tmp_path)
 
+    def test_operation_table_matches_image_parser(self):
+        """Every dispatched operation is a real option of the image subcommand."""
+        from color_tools.cli import build_parser
+        from color_tools.cli_commands.handlers.image import _IMAGE_OPERATIONS
+        image_args = build_parser('image', lazy=True).parse_args(['image'])
+        for name, _ in _IMAGE_OPERATIONS:
+            self.assertTrue(hasattr(image_args, name), name)
+
 
 # ---------------------------------------------------------------------------
 # Image handler — operation branches
@@ -873,9 +966,9 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         """--redistribute-luminance runs, prints the report, and returns normally."""
         import color_tools.cli_commands.handlers.image as img_mod
         mock_colors = [(255, 0, 0), (0, 255, 0)]
-        with patch.object(img_mod, 'extract_unique_colors', return_value=mock_colors), \
-             patch.object(img_mod, 'redistribute_luminance', return_value=[]), \
-             patch.object(img_mod, 'format_color_change_report', return_value='THE REPORT'):
+        with patch('color_tools.image.extract_unique_colors', return_value=mock_colors), \
+             patch('color_tools.image.redistribute_luminance', return_value=[]), \
+             patch('color_tools.image.format_color_change_report', return_value='THE REPORT'):
             args = self._make_args(file=self._img_path, redistribute_luminance=True)
             out = self._run_expect_return(args)
         self.assertIn('THE REPORT', out)
@@ -885,7 +978,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         """--cvd-simulate without --output saves to a default filename."""
         import color_tools.cli_commands.handlers.image as img_mod
         mock_image = MagicMock()
-        with patch.object(img_mod, 'simulate_cvd_image', return_value=mock_image):
+        with patch('color_tools.image.simulate_cvd_image', return_value=mock_image):
             args = self._make_args(file=self._img_path, cvd_simulate='protanopia')
             out = self._run_expect_return(args)
         mock_image.save.assert_called_once()
@@ -896,7 +989,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         """--cvd-simulate with explicit --output passes output_path to function."""
         import color_tools.cli_commands.handlers.image as img_mod
         mock_image = MagicMock()
-        with patch.object(img_mod, 'simulate_cvd_image', return_value=mock_image):
+        with patch('color_tools.image.simulate_cvd_image', return_value=mock_image):
             args = self._make_args(
                 file=self._img_path, cvd_simulate='deuteranopia',
                 output='/tmp/out_sim.png',
@@ -910,7 +1003,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         """--cvd-correct saves to default filename."""
         import color_tools.cli_commands.handlers.image as img_mod
         mock_image = MagicMock()
-        with patch.object(img_mod, 'correct_cvd_image', return_value=mock_image):
+        with patch('color_tools.image.correct_cvd_image', return_value=mock_image):
             args = self._make_args(file=self._img_path, cvd_correct='tritanopia')
             out = self._run_expect_return(args)
         mock_image.save.assert_called_once()
@@ -924,7 +1017,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         mock_palette.records = [MagicMock()] * 4
         mock_image = MagicMock()
         with patch.object(img_mod, 'load_palette', return_value=mock_palette), \
-             patch.object(img_mod, 'quantize_image_to_palette', return_value=mock_image):
+             patch('color_tools.image.quantize_image_to_palette', return_value=mock_image):
             args = self._make_args(file=self._img_path, quantize_palette='cga4')
             self._run_expect_return(args)
         mock_image.save.assert_called_once()
@@ -937,7 +1030,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         mock_palette.records = [MagicMock()] * 4
         mock_image = MagicMock()
         with patch.object(img_mod, 'load_palette', return_value=mock_palette), \
-             patch.object(img_mod, 'quantize_image_to_palette', return_value=mock_image):
+             patch('color_tools.image.quantize_image_to_palette', return_value=mock_image):
             args = self._make_args(
                 file=self._img_path, quantize_palette='cga4',
                 output='/tmp/out_quant.png',
@@ -953,6 +1046,19 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         _, err = self._run_expect_exit(args, expected_code=1)
         self.assertIn('Watermark requires', err)
 
+    def test_watermark_options_parsed_once(self):
+        """Watermark options are gathered into one struct with colors parsed."""
+        from color_tools.cli_commands.handlers.image import _WatermarkOptions
+        args = self._make_args(
+            watermark=True, watermark_text='hello',
+            watermark_color='10, 20, 30', watermark_stroke_color='0,0,0',
+        )
+        options = _WatermarkOptions.from_args(args)
+        self.assertEqual((options.kind, options.source), ('text', 'hello'))
+        self.assertEqual(options.color, (10, 20, 30))
+        self.assertEqual(options.stroke_color, (0, 0, 0))
+        self.assertEqual(options.position, 'bottom-right')
+
     @unittest.skipUnless(_PIL_FOR_HANDLER, 'Requires Pillow')
     def test_watermark_multiple_sources_exits_1(self):
         """--watermark with both --watermark-text and --watermark-image exits 1."""
@@ -969,7 +1075,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         import color_tools.cli_commands.handlers.image as img_mod
         mock_watermarked = MagicMock()
         mock_watermarked.mode = 'RGB'
-        with patch.object(img_mod, 'add_text_watermark', return_value=mock_watermarked):
+        with patch('color_tools.image.add_text_watermark', return_value=mock_watermarked):
             args = self._make_args(
                 file=self._img_path, watermark=True,
                 watermark_text='hello world',
@@ -978,13 +1084,34 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         mock_watermarked.save.assert_called_once()
         self.assertIn('watermarked', out)
 
+    @unittest.skipUnless(_PIL_FOR_HANDLER, 'Requires Pillow')
+    def test_watermark_rgba_to_jpeg_flattens_on_white(self):
+        """An RGBA watermark result saved as JPEG is composited onto white."""
+        import os
+        import tempfile
+        from PIL import Image as _PILImage
+        rgba = _PILImage.new('RGBA', (4, 4), (0, 0, 0, 0))
+        fd, out_path = tempfile.mkstemp(suffix='.jpg')
+        os.close(fd)
+        self._extra_files.append(out_path)
+        with patch('color_tools.image.add_text_watermark', return_value=rgba):
+            args = self._make_args(
+                file=self._img_path, watermark=True,
+                watermark_text='hello', output=out_path,
+            )
+            self._run_expect_return(args)
+        with _PILImage.open(out_path) as saved:
+            self.assertEqual(saved.mode, 'RGB')
+            r, g, b = saved.getpixel((0, 0))
+        self.assertGreater(min(r, g, b), 245)
+
     @unittest.skipUnless(_PIL_FOR_HANDLER, 'Requires Pillow')
     def test_watermark_image_saves_default(self):
         """--watermark-image adds watermark and returns normally."""
         import color_tools.cli_commands.handlers.image as img_mod
         mock_watermarked = MagicMock()
         mock_watermarked.mode = 'RGB'
-        with patch.object(img_mod, 'add_image_watermark', return_value=mock_watermarked):
+        with patch('color_tools.image.add_image_watermark', return_value=mock_watermarked):
             args = self._make_args(
                 file=self._img_path, watermark=True,
                 watermark_image='/some/wm.png',
@@ -996,7 +1123,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
     def test_convert_returns_normally(self):
         """--convert jpg calls convert_image and prints result."""
         import color_tools.cli_commands.handlers.image as img_mod
-        with patch.object(img_mod, 'convert_image', return_value='/tmp/out.jpg'):
+        with patch('color_tools.image.convert_image', return_value='/tmp/out.jpg'):
             args = self._make_args(file=self._img_path, convert='jpg')
             out = self._run_expect_return(args)
         self.assertIn('out.jpg', out)
@@ -1005,7 +1132,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
     def test_general_exception_exits_1(self):
         """An unexpected exception in the operation body exits 1 with message."""
         import color_tools.cli_commands.handlers.image as img_mod
-        with patch.object(img_mod, 'simulate_cvd_image', side_effect=RuntimeError('boom')):
+        with patch('color_tools.image.simulate_cvd_image', side_effect=RuntimeError('boom')):
             args = self._make_args(file=self._img_path, cvd_simulate='protanopia')
             _, err = self._run_expect_exit(args, expected_code=1)
         self.assertIn('boom', err)
@@ -1041,13 +1168,34 @@ class TestHandleImageCommandOperations(unittest.TestCase):
         _, err = self._run_expect_exit(args, expected_code=1)
         self.assertIn('watermark-color', err)
 
+    @unittest.skipUnless(_PIL_FOR_HANDLER, 'Requires Pillow')
+    def test_watermark_out_of_range_color_exits_1(self):
+        """A --watermark-color component above 255 causes sys.exit(1)."""
+        args = self._make_args(
+            file=self._img_path, watermark=True,
+            watermark_text='hello', watermark_color='256,0,0',
+        )
+        _, err = self._run_expect_exit(args, expected_code=1)
+        self.assertIn('0-255', err)
+
+    @unittest.skipUnless(_PIL_FOR_HANDLER, 'Requires Pillow')
+    def test_watermark_invalid_stroke_color_exits_1(self):
+        """An invalid --watermark-stroke-color value causes sys.exit(1)."""
+        args = self._make_args(
+            file=self._img_path, watermark=True,
+            watermark_text='hello', watermark_color='255,255,255',
+            watermark_stroke_color='0,0',
+        )
+        _, err = self._run_expect_exit(args, expected_code=1)
+        self.assertIn('watermark-stroke-color', err)
+
     @unittest.skipUnless(_PIL_FOR_HANDLER, 'Requires Pillow')
     def test_watermark_svg_succeeds(self):
         """--watermark-svg path returns normally when add_svg_watermark succeeds."""
         import color_tools.cli_commands.handlers.image as img_mod
         mock_wm = MagicMock()
         mock_wm.mode = 'RGB'
-        with patch.object(img_mod, 'add_svg_watermark', return_value=mock_wm):
+        with patch('color_tools.image.add_svg_watermark', return_value=mock_wm):
             args = self._make_args(
                 file=self._img_path, watermark=True,
                 watermark_svg='/some/test.svg',
@@ -1059,7 +1207,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
     def test_watermark_svg_import_error_exits_1(self):
         """ImportError from add_svg_watermark exits 1."""
         import color_tools.cli_commands.handlers.image as img_mod
-        with patch.object(img_mod, 'add_svg_watermark',
+        with patch('color_tools.image.add_svg_watermark',
                           side_effect=ImportError('cairosvg not installed')):
             args = self._make_args(
                 file=self._img_path, watermark=True,
@@ -1074,7 +1222,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
     def test_convert_webp_defaults_to_lossless(self):
         """--convert webp without --lossy uses lossless=True."""
         import color_tools.cli_commands.handlers.image as img_mod
-        with patch.object(img_mod, 'convert_image', return_value='/tmp/out.webp') as mock_cv:
+        with patch('color_tools.image.convert_image', return_value='/tmp/out.webp') as mock_cv:
             args = self._make_args(file=self._img_path, convert='webp', lossy=False)
             self._run_expect_return(args)
         call_kwargs = mock_cv.call_args.kwargs
@@ -1084,7 +1232,7 @@ class TestHandleImageCommandOperations(unittest.TestCase):
     def test_convert_import_error_exits_1(self):
         """ImportError from convert_image exits 1 with HEIC hint."""
         import color_tools.cli_commands.handlers.image as img_mod
-        with patch.object(img_mod, 'convert_image',
+        with patch('color_tools.image.convert_image',
                           side_effect=ImportError('pillow-heif required')):
             args = self._make_args(file=self._img_path, convert='heic')
             _, err = self._run_expect_exit(args, expected_code=1)
@@ -14,11 +14,36 @@ Covers:
 from __future__ import annotations
 
 import io
+import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch
 
-from color_tools.cli import main
+from color_tools.cli import (
+    main,
+    build_parser,
+    _sniff_command,
+    _wants_admin_flags,
+    _wants_watermark_options,
+)
+
+
+_cache_dir = None
+_cache_patch = None
+
+
+def setUpModule():
+    """Point XDG_CACHE_HOME at a scratch dir so --list-palettes never writes the real palette index."""
+    global _cache_dir, _cache_patch
+    _cache_dir = tempfile.TemporaryDirectory()
+    _cache_patch = patch.dict(os.environ, {"XDG_CACHE_HOME": _cache_dir.name})
+    _cache_patch.start()
+
+
+def tearDownModule():
+    _cache_patch.stop()
+    _cache_dir.cleanup()
 
 
 class TestCliMain(unittest.TestCase):
@@ -107,6 +132,178 @@ class TestCliMain(unittest.TestCase):
         ])
         self.assertNotEqual(code, 0)
 
+    def test_json_path_that_is_a_file_exits_1(self):
+        """--json pointing at a regular file is rejected as not a directory."""
+        code, _, _ = self._run([
+            '--json', __file__,
+            'color', '--name', 'red',
+        ])
+        self.assertEqual(code, 1)
+
+
+class TestLazyParser(unittest.TestCase):
+    """Tests for argv sniffing and lazy subparser construction."""
+
+    @staticmethod
+    def _subparsers(parser):
+        for action in parser._actions:
+            if hasattr(action, '_name_parser_map'):
+                return action._name_parser_map
+        return {}
+
+    def test_sniff_finds_subcommand(self):
+        """The first known subcommand token is returned."""
+        self.assertEqual(_sniff_command(['color', '--name', 'red']), 'color')
+
+    def test_sniff_help_before_subcommand_builds_full_parser(self):
+        """-h/--help ahead of the subcommand returns None so top-level help is complete."""
+        self.assertIsNone(_sniff_command(['--help', 'color']))
+        self.assertIsNone(_sniff_command(['-h', 'color']))
+        self.assertEqual(_sniff_command(['color', '--help']), 'color')
+
+    def test_sniff_skips_global_option_values(self):
+        """Values of --json/--log-file are not mistaken for subcommands."""
+        self.assertEqual(_sniff_command(['--json', 'color', 'filament', '--list-makers']), 'filament')
+
+    def test_sniff_no_subcommand(self):
+        """No subcommand (e.g. --version) returns None."""
+        self.assertIsNone(_sniff_command(['--version']))
+        self.assertIsNone(_sniff_command([]))
+
+    def test_abbreviated_admin_flag_before_subcommand(self):
+        """Short abbreviations of admin flags still parse alongside a subcommand."""
+        for argv in (['--che', 'color', '--name', 'red'], ['--gen', 'color', '--name', 'red']):
+            with self.subTest(argv=argv):
+                self.assertTrue(_wants_admin_flags(argv))
+                parser = build_parser('color', lazy=True, with_admin_flags=_wants_admin_flags(argv))
+                args = parser.parse_args(argv)
+                self.assertEqual(args.command, 'color')
+        self.assertFalse(_wants_admin_flags(['color', '--name', 'red']))
+
+    def test_lazy_builds_only_requested_subcommand(self):
+        """lazy=True with a command registers only that subparser."""
+        parser = build_parser('cvd', lazy=True)
+        self.assertEqual(list(self._subparsers(parser)), ['cvd'])
+
+    def test_lazy_without_command_registers_stubs(self):
+        """lazy=True without a command still lists every subcommand."""
+        eager = self._subparsers(build_parser())
+        stubs = self._subparsers(build_parser(None, lazy=True))
+        self.assertEqual(list(stubs), list(eager))
+        self.assertEqual(len(stubs['color']._actions), 0)
+
+    def test_lazy_parse_matches_eager(self):
+        """A lazily built parser produces the same namespace as the full one."""
+        argv = ['color', '--nearest', '--hex', '#FF0000', '--metric', 'de94']
+        lazy = build_parser('color', lazy=True).parse_args(argv)
+        eager = build_parser().parse_args(argv)
+        self.assertEqual(vars(lazy), vars(eager))
+
+    def test_epilog_only_built_for_top_level_help(self):
+        """The examples epilog is skipped when a subcommand was selected."""
+        self.assertIsNone(build_parser('color', lazy=True).epilog)
+        epilog = build_parser(None, lazy=True).epilog
+        self.assertIn('Examples:', epilog)
+        self.assertNotIn('$prog', epilog)
+
+    def test_every_subcommand_has_a_handler(self):
+        """Each registered subcommand dispatches to a handler."""
+        from color_tools.cli import _COMMAND_HANDLERS, _SUBCOMMAND_BUILDERS
+        self.assertEqual(set(_COMMAND_HANDLERS), set(_SUBCOMMAND_BUILDERS))
+        from color_tools.cli_commands import handlers
+        for handler_name, _ in _COMMAND_HANDLERS.values():
+            self.assertTrue(callable(getattr(handlers, handler_name)))
+
+    def test_wants_admin_flags(self):
+        """Verification flags (and their abbreviations) are detected in argv."""
+        self.assertTrue(_wants_admin_flags(['--verify-all', 'color', '--name', 'red']))
+        self.assertTrue(_wants_admin_flags(['--verify-c']))
+        self.assertFalse(_wants_admin_flags(['color', '--name', 'red']))
+
+    def test_wants_watermark_options(self):
+        """Watermark options are needed for --watermark* tokens and help."""
+        self.assertTrue(_wants_watermark_options(['image', '--file', 'a.png', '--watermark']))
+        self.assertTrue(_wants_watermark_options(['image', '-h']))
+        self.assertFalse(_wants_watermark_options(['image', '--file', 'a.png', '--convert', 'png']))
+
+    def test_image_parser_without_watermark_options(self):
+        """The image parser still parses non-watermark operations without them."""
+        parser = build_parser('image', lazy=True, with_watermark_options=False)
+        args = parser.parse_args(['image', '--file', 'a.png', '--convert', 'png'])
+        self.assertEqual(args.convert, 'png')
+        self.assertFalse(args.watermark)
+        self.assertFalse(hasattr(args, 'watermark_text'))
+
+    def test_without_admin_flags_defaults_false(self):
+        """Skipping the verification flags still leaves their dests False."""
+        args = build_parser('color', lazy=True, with_admin_flags=False).parse_args(
+            ['color', '--name', 'red'])
+        self.assertFalse(args.verify_all)
+        self.assertFalse(args.verify_user_data)
+        self.assertFalse(args.generate_user_hashes)
+        self.assertFalse(args.check_overrides)
+
+
+class TestStartupImports(unittest.TestCase):
+    """Non-image commands must not load the optional image stack."""
+
+    def test_cli_import_does_not_load_pillow(self):
+        """Importing color_tools.cli leaves PIL and numpy unloaded."""
+        import subprocess
+        code = (
+            "import sys, color_tools.cli; "
+            "print(any(m.split('.')[0] in ('PIL', 'numpy') for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), 'False', result.stderr)
+
+    def test_cli_import_defers_handler_modules(self):
+        """Handler modules load on first use, not when the CLI is imported."""
+        import subprocess
+        code = (
+            "import sys, color_tools.cli; "
+            "loaded = lambda: sorted(m for m in sys.modules if '.handlers.' in m); "
+            "print(loaded()); "
+            "from color_tools.cli_commands import handle_name_command; "
+            "print(loaded())"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True)
+        self.assertEqual(
+            result.stdout.split(),
+            ['[]', "['color_tools.cli_commands.handlers.name']"],
+            result.stderr,
+        )
+
+    def test_list_palettes_does_not_load_pillow(self):
+        """Running image --list-palettes never imports the image stack."""
+        import subprocess
+        code = (
+            "import sys, io, contextlib; from color_tools.cli import main; "
+            "sys.argv = ['color-tools', 'image', '--list-palettes']; "
+            "out = io.StringIO()\n"
+            "with contextlib.redirect_stdout(out):\n"
+            "    try: main()\n"
+            "    except SystemExit: pass\n"
+            "print(any(m.split('.')[0] in ('PIL', 'numpy') for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), 'False', result.stderr)
+
+    def test_image_parser_does_not_load_pillow(self):
+        """Parsing an image command line defers Pillow to the handler."""
+        import subprocess
+        code = (
+            "import sys; from color_tools.cli import build_parser; "
+            "build_parser('image', lazy=True).parse_args(['image', '--list-palettes']); "
+            "print('PIL' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True)
+        self.assertEqual(result.stdout.strip(), 'False', result.stderr)
+
 
 if __name__ == '__main__':
     unittest.main()
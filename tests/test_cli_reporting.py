@@ -10,6 +10,7 @@ Covers:
 from __future__ import annotations
 
 import io
+import json
 import os
 import sys
 import tempfile
@@ -18,6 +19,7 @@ from argparse import Namespace
 from pathlib import Path
 from unittest.mock import patch
 
+from color_tools.constants import ColorConstants
 from color_tools.cli_commands.reporting import (
     get_available_palettes,
     generate_user_hashes,
@@ -26,6 +28,23 @@ from color_tools.cli_commands.reporting import (
 )
 
 
+_cache_dir = None
+_cache_patch = None
+
+
+def setUpModule():
+    """Point XDG_CACHE_HOME at a scratch dir so --list-palettes never writes the real palette index."""
+    global _cache_dir, _cache_patch
+    _cache_dir = tempfile.TemporaryDirectory()
+    _cache_patch = patch.dict(os.environ, {"XDG_CACHE_HOME": _cache_dir.name})
+    _cache_patch.start()
+
+
+def tearDownModule():
+    _cache_patch.stop()
+    _cache_dir.cleanup()
+
+
 class TestGetAvailablePalettes(unittest.TestCase):
     """Tests for get_available_palettes."""
 
@@ -91,6 +110,101 @@ class TestGetAvailablePalettes(unittest.TestCase):
         names = [name for name, _ in result]
         self.assertIn('test_palette', names)
 
+    def test_repeat_call_reuses_listing_until_dir_changes(self):
+        """The directory listing is cached until a palette file is added."""
+        with tempfile.TemporaryDirectory() as tmp:
+            palettes_dir = Path(tmp) / "palettes"
+            palettes_dir.mkdir()
+            (palettes_dir / "one.json").write_text("[]", encoding="utf-8")
+            first = get_available_palettes(tmp)
+            with patch.object(Path, 'glob', side_effect=AssertionError("rescanned")):
+                self.assertEqual(get_available_palettes(tmp), first)
+            (palettes_dir / "two.json").write_text("[]", encoding="utf-8")
+            # Bump the mtime explicitly in case the filesystem clock is coarse
+            stamp = palettes_dir.stat().st_mtime_ns + 1_000_000_000
+            os.utime(palettes_dir, ns=(stamp, stamp))
+            names = [name for name, _ in get_available_palettes(tmp)]
+        self.assertEqual(names, ['one', 'two'])
+
+
+class TestPaletteIndex(unittest.TestCase):
+    """Tests for the on-disk palette count index behind get_available_palettes."""
+
+    _RED = ('{"name": "red", "hex": "#FF0000", "rgb": [255, 0, 0], '
+            '"hsl": [0.0, 100.0, 50.0], "lab": [53.0, 80.0, 67.0], '
+            '"lch": [53.0, 104.0, 40.0]}')
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        self.index_path = tmp / "cache" / "palette_index.json"
+        self.palettes_dir = tmp / "data" / "palettes"
+        self.palettes_dir.mkdir(parents=True)
+        self.palette_file = self.palettes_dir / "tiny.json"
+        self.palette_file.write_text(f"[{self._RED}]", encoding="utf-8")
+        self._patcher = patch(
+            'color_tools.cli_commands.reporting._palette_index_path',
+            return_value=self.index_path,
+        )
+        self._patcher.start()
+
+    def tearDown(self):
+        self._patcher.stop()
+        self._tmp.cleanup()
+
+    def test_index_written_on_first_listing(self):
+        """The first listing writes the index file."""
+        result = get_available_palettes(self.palettes_dir.parent)
+        self.assertEqual(result, [('tiny', 1)])
+        self.assertTrue(self.index_path.exists())
+
+    def test_unchanged_palettes_are_not_reloaded(self):
+        """A second listing serves counts from the index without loading palettes."""
+        get_available_palettes(self.palettes_dir.parent)
+        with patch('color_tools.cli_commands.reporting._count_palette_colors',
+                   side_effect=AssertionError("palette was reloaded")):
+            result = get_available_palettes(self.palettes_dir.parent)
+        self.assertEqual(result, [('tiny', 1)])
+
+    def test_modified_palette_is_recounted(self):
+        """Changing a palette file invalidates its cached count."""
+        get_available_palettes(self.palettes_dir.parent)
+        self.palette_file.write_text(f"[{self._RED}, {self._RED}]", encoding="utf-8")
+        result = get_available_palettes(self.palettes_dir.parent)
+        self.assertEqual(result, [('tiny', 2)])
+
+    def test_malformed_palette_counts_as_error(self):
+        """A palette that isn't an array of colors is listed with count -1."""
+        self.palette_file.write_text('{"records": []}', encoding="utf-8")
+        result = get_available_palettes(self.palettes_dir.parent)
+        self.assertEqual(result, [('tiny', -1)])
+
+    def test_corrupt_index_is_ignored(self):
+        """An unreadable index falls back to loading palettes."""
+        self.index_path.parent.mkdir(parents=True)
+        self.index_path.write_text("not json", encoding="utf-8")
+        result = get_available_palettes(self.palettes_dir.parent)
+        self.assertEqual(result, [('tiny', 1)])
+
+    def test_truncated_index_entry_is_ignored(self):
+        """An index entry missing its count is recounted instead of crashing."""
+        get_available_palettes(self.palettes_dir.parent)
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        key = str(self.palette_file.resolve())
+        index[key] = index[key][:2]
+        self.index_path.write_text(json.dumps(index), encoding="utf-8")
+        result = get_available_palettes(self.palettes_dir.parent)
+        self.assertEqual(result, [('tiny', 1)])
+        self.assertEqual(len(json.loads(self.index_path.read_text(encoding="utf-8"))[key]), 3)
+
+    def test_palette_removed_before_stat_counts_as_error(self):
+        """A palette that vanishes between listing and stat is listed with count -1."""
+        from color_tools.cli_commands.reporting import _load_palette_index
+        missing = self.palettes_dir / "gone.json"
+        result = _load_palette_index([('gone', missing), ('tiny', self.palette_file)])
+        self.assertEqual(result, [('gone', -1), ('tiny', 1)])
+        self.assertEqual(list(self.index_path.parent.glob("*.tmp")), [])
+
 
 class TestHandleVerificationFlags(unittest.TestCase):
     """Tests for handle_verification_flags."""
@@ -146,13 +260,40 @@ class TestHandleVerificationFlags(unittest.TestCase):
         self.assertTrue(args.verify_matrices)
         self.assertTrue(args.verify_user_data)
 
+    def test_verify_constants_failure_hashes_once(self):
+        """A failed --verify-constants reports the hash it computed, once."""
+        captured = io.StringIO()
+        args = self._make_args(verify_constants=True)
+        with patch.object(ColorConstants, '_compute_hash', return_value='bad') as mock_hash:
+            with patch('sys.stderr', captured):
+                with self.assertRaises(SystemExit) as ctx:
+                    handle_verification_flags(args)
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertEqual(mock_hash.call_count, 1)
+        self.assertIn('Current hash:  bad', captured.getvalue())
+
+    def test_passed_checks_reported_before_failure(self):
+        """Checks that passed are still printed when a later check fails."""
+        out, err = io.StringIO(), io.StringIO()
+        args = self._make_args(verify_constants=True, verify_matrices=True)
+        with patch.object(ColorConstants, '_compute_matrices_hash', return_value='bad'):
+            with patch('sys.stdout', out), patch('sys.stderr', err):
+                with self.assertRaises(SystemExit) as ctx:
+                    handle_verification_flags(args)
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertEqual(out.getvalue(), "✓ ColorConstants integrity verified\n")
+        self.assertIn('Transformation matrices integrity check FAILED', err.getvalue())
+
     def test_generate_user_hashes_calls_sys_exit(self):
         """generate_user_hashes=True calls sys.exit(0) after generating."""
         captured = io.StringIO()
-        args = self._make_args(generate_user_hashes=True)
-        with patch('sys.stdout', captured):
-            with self.assertRaises(SystemExit) as ctx:
-                handle_verification_flags(args)
+        # Use a scratch data dir so the package's own user/*.sha256 files
+        # aren't rewritten by the test run
+        with tempfile.TemporaryDirectory() as tmp:
+            args = self._make_args(generate_user_hashes=True, json=tmp)
+            with patch('sys.stdout', captured):
+                with self.assertRaises(SystemExit) as ctx:
+                    handle_verification_flags(args)
         self.assertEqual(ctx.exception.code, 0)
 
     def test_check_overrides_calls_sys_exit(self):
@@ -211,6 +352,23 @@ class TestGenerateUserHashes(unittest.TestCase):
             sha_file = user_dir / 'user-colors.json.sha256'
             self.assertTrue(sha_file.exists())
 
+    def test_hashes_each_file_once(self):
+        """Each user file is hashed once; the printed hash matches the .sha256 file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            user_dir = Path(tmp) / "user"
+            user_dir.mkdir()
+            user_colors = user_dir / "user-colors.json"
+            user_colors.write_text('[]', encoding='utf-8')
+            captured = io.StringIO()
+            with patch.object(
+                ColorConstants, 'generate_user_data_hash',
+                wraps=ColorConstants.generate_user_data_hash,
+            ) as spy, patch('sys.stdout', captured):
+                generate_user_hashes(tmp)
+            self.assertEqual(spy.call_count, 1)
+            saved = (user_dir / 'user-colors.json.sha256').read_text().split()[0]
+            self.assertIn(f"Hash: {saved}", captured.getvalue())
+
 
 class TestShowOverrideReport(unittest.TestCase):
     """Smoke tests for show_override_report."""
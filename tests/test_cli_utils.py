@@ -2,6 +2,7 @@
 Tests for color_tools.cli_commands.utils module.
 
 Covers:
+- exit_with_error
 - validate_color_input_exclusivity
 - get_rgb_from_args
 - parse_hex_or_exit
@@ -17,6 +18,7 @@ from argparse import Namespace
 from unittest.mock import patch
 
 from color_tools.cli_commands.utils import (
+    exit_with_error,
     get_program_name,
     get_rgb_from_args,
     is_valid_lab,
@@ -26,6 +28,18 @@ from color_tools.cli_commands.utils import (
 )
 
 
+class TestExitWithError(unittest.TestCase):
+    """Tests for exit_with_error."""
+
+    def test_writes_all_lines_at_once_and_exits(self):
+        """All message lines go to stderr in one write, then the process exits."""
+        with patch('sys.stderr') as mock_stderr:
+            with self.assertRaises(SystemExit) as ctx:
+                exit_with_error(2, "Error: bad", "Tip: try again")
+        self.assertEqual(ctx.exception.code, 2)
+        mock_stderr.write.assert_called_once_with("Error: bad\nTip: try again\n")
+
+
 class TestValidateColorInputExclusivity(unittest.TestCase):
     """Tests for validate_color_input_exclusivity."""
 
@@ -122,6 +136,15 @@ class TestGetRgbFromArgs(unittest.TestCase):
         result = get_rgb_from_args(args)
         self.assertEqual(result, (255, 255, 255))
 
+    def test_value_out_of_range_exits_code_2(self):
+        """Values above 255 or below 0 exit with code 2."""
+        for value in ([256, 0, 0], [0, -1, 0], [0, 0, 1000]):
+            with self.subTest(value=value):
+                args = Namespace(value=value, hex=None)
+                with self.assertRaises(SystemExit) as ctx:
+                    get_rgb_from_args(args)
+                self.assertEqual(ctx.exception.code, 2)
+
 
 class TestParseHexOrExit(unittest.TestCase):
     """Tests for parse_hex_or_exit."""
@@ -354,6 +377,13 @@ class TestGetProgramName(unittest.TestCase):
             result = get_program_name()
         self.assertIsInstance(result, str)
 
+    def test_follows_argv_changes(self):
+        """Memoization doesn't return a stale name after argv[0] changes."""
+        with patch.object(sys, 'argv', ['/usr/local/bin/color-tools']):
+            self.assertEqual(get_program_name(), "color-tools")
+        with patch.object(sys, 'argv', ['path/to/__main__.py']):
+            self.assertEqual(get_program_name(), "python -m color_tools")
+
 
 if __name__ == '__main__':
     unittest.main()
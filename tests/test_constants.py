@@ -148,6 +148,37 @@ class TestHashVerification(unittest.TestCase):
         computed = ColorConstants._compute_matrices_hash()
         expected = ColorConstants.MATRICES_EXPECTED_HASH
         self.assertEqual(computed, expected)
+    
+    def test_data_files_integrity(self):
+        """Test that the packaged data files match their stored hashes."""
+        all_valid, errors = ColorConstants.verify_all_data_files()
+        self.assertTrue(all_valid, errors)
+    
+    def test_data_file_errors_in_check_order(self):
+        """Test that missing data files are reported in a stable order."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            all_valid, errors = ColorConstants.verify_all_data_files(Path(tmp))
+        self.assertFalse(all_valid)
+        self.assertEqual(len(errors), 23)  # 3 core files + 20 palettes
+        self.assertTrue(errors[0].startswith("colors.json"))
+        self.assertTrue(errors[1].startswith("filaments.json"))
+        self.assertTrue(errors[-1].startswith("web.json"))
+    
+    def test_data_file_hash_ignores_line_endings(self):
+        """Test that CRLF and LF copies of a file hash the same."""
+        import hashlib
+        import tempfile
+        expected = hashlib.sha256(b'{"a": 1}\n').hexdigest()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.json"
+            path.write_bytes(b'{"a": 1}\r\n')
+            self.assertTrue(ColorConstants.verify_data_file(path, expected))
+            self.assertEqual(ColorConstants.generate_user_data_hash(path), expected)
+            missing = Path(tmp) / "missing.json"
+            self.assertFalse(ColorConstants.verify_data_file(missing, expected))
+            with self.assertRaises(FileNotFoundError):
+                ColorConstants.generate_user_data_hash(missing)
 
 
 if __name__ == '__main__':
@@ -779,6 +779,40 @@ class TestJSONExporter(unittest.TestCase):
                 data = json.load(f)
             
             self.assertEqual(data[0]['name'], 'café')
+    
+    def test_json_matches_indented_dump(self):
+        """Streamed JSON output matches json.dump(..., indent=2) byte for byte."""
+        from dataclasses import asdict
+        from color_tools.exporters import get_exporter
+        
+        filaments = [
+            FilamentRecord(id='a', maker='Maker "Q"', type='PLA', finish=None,
+                           color='Café\nRed', hex='#FF0000', other_names=['x', 'y']),
+            FilamentRecord(id='b', maker='Maker', type='PETG', finish='Silk',
+                           color='Blue', hex='#0000FF', td_value=2.5),
+        ]
+        exporter = get_exporter('json')
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for records in (filaments, []):
+                output_path = Path(tmpdir) / 'filaments.json'
+                exporter.export_filaments(records, output_path)
+                expected = json.dumps([asdict(f) for f in records], indent=2, ensure_ascii=False)
+                self.assertEqual(output_path.read_text(encoding='utf-8'), expected)
+    
+    def test_record_fields_matches_asdict(self):
+        """record_fields() yields the same keys and values as asdict()."""
+        from dataclasses import asdict
+        from color_tools.exporters.base import record_fields
+        
+        filament = FilamentRecord(id='a', maker='M', type='PLA', finish=None,
+                                  color='Red', hex='#FF0000', other_names=['x'])
+        color = ColorRecord(name='red', hex='#FF0000', rgb=(255, 0, 0),
+                            hsl=(0.0, 100.0, 50.0), lab=(53.2, 80.1, 67.2),
+                            lch=(53.2, 104.6, 40.0))
+        for record in (filament, color):
+            names, values = record_fields(type(record))
+            self.assertEqual(dict(zip(names, values(record))), asdict(record))
 
 
 class TestExporterErrorHandling(unittest.TestCase):
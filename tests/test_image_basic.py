@@ -198,6 +198,55 @@ class TestCountUniqueColors(unittest.TestCase):
         
         count = self.count_unique_colors(Path(img_path))
         self.assertEqual(count, 1)
+    
+    def test_presence_table_path_matches_sort(self):
+        """The large-image presence table counts the same as np.unique on rows."""
+        from unittest.mock import patch
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 16, size=(40, 50, 3), dtype=np.uint8)
+        fd, img_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        Image.fromarray(pixels).save(img_path)
+        self.test_files.append(img_path)
+        
+        expected = len(np.unique(pixels.reshape(-1, 3), axis=0))
+        self.assertEqual(self.count_unique_colors(img_path), expected)
+        with patch('color_tools.image.basic._LARGE_IMAGE_PIXELS', 0):
+            self.assertEqual(self.count_unique_colors(img_path), expected)
+    
+    def test_strip_packing_matches_whole_image(self):
+        """Packing keys in small strips gives the same counts as one pass."""
+        from unittest.mock import patch
+        rng = np.random.default_rng(1)
+        pixels = rng.integers(0, 8, size=(37, 23, 3), dtype=np.uint8)
+        fd, img_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        Image.fromarray(pixels).convert('RGBA').save(img_path)
+        self.test_files.append(img_path)
+        
+        expected = len(np.unique(pixels.reshape(-1, 3), axis=0))
+        with patch('color_tools.image.basic._KEY_STRIP_PIXELS', 50):
+            self.assertEqual(self.count_unique_colors(img_path), expected)
+    
+    def test_palette_and_grayscale_counted_from_histogram(self):
+        """Indexed and grayscale images count the colors their RGB conversion has."""
+        # Indices 0 and 3 share a color; index 4 is unused
+        img = Image.new('P', (4, 1))
+        img.putpalette([10, 20, 30, 0, 0, 0, 255, 255, 255, 10, 20, 30, 1, 2, 3])
+        img.putdata([0, 1, 2, 3])
+        fd, p_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        img.save(p_path)
+        self.test_files.append(p_path)
+        self.assertEqual(self.count_unique_colors(p_path), 3)
+        
+        gray = Image.new('L', (3, 1))
+        gray.putdata([0, 128, 128])
+        fd, l_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        gray.save(l_path)
+        self.test_files.append(l_path)
+        self.assertEqual(self.count_unique_colors(l_path), 2)
 
 
 @unittest.skipUnless(PILLOW_AVAILABLE and NUMPY_AVAILABLE, "Requires Pillow and numpy")
@@ -268,6 +317,26 @@ class TestGetColorHistogram(unittest.TestCase):
             if os.path.exists(filepath):
                 os.remove(filepath)
     
+    def test_bincount_path_matches_sort(self):
+        """Both histogram paths agree with np.unique over RGB rows, with native ints."""
+        from unittest.mock import patch
+        rng = np.random.default_rng(1)
+        pixels = rng.integers(0, 16, size=(40, 50, 3), dtype=np.uint8)
+        fd, img_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        Image.fromarray(pixels).save(img_path)
+        self.test_files.append(img_path)
+        
+        colors, counts = np.unique(pixels.reshape(-1, 3), axis=0, return_counts=True)
+        expected = {tuple(int(v) for v in c): int(n) for c, n in zip(colors, counts)}
+        for threshold in (1 << 20, 0):
+            with patch('color_tools.image.basic._LARGE_IMAGE_PIXELS', threshold):
+                histogram = self.get_color_histogram(img_path)
+            self.assertEqual(histogram, expected)
+            key, count = next(iter(histogram.items()))
+            self.assertIs(type(key[0]), int)
+            self.assertIs(type(count), int)
+    
     def test_solid_color_histogram(self):
         """Test histogram of a solid color image."""
         color = (128, 64, 32)
@@ -342,6 +411,24 @@ class TestGetDominantColor(unittest.TestCase):
             if os.path.exists(filepath):
                 os.remove(filepath)
     
+    def test_numpy_fallback_matches_getcolors(self):
+        """Both paths pick the most common color, breaking ties toward the lowest RGB."""
+        from unittest.mock import patch
+        # Two colors with equal counts plus a rarer third
+        pixels = np.zeros((4, 4, 3), dtype=np.uint8)
+        pixels[:2] = (200, 10, 10)
+        pixels[2:] = (10, 200, 10)
+        pixels[3, 3] = (1, 2, 3)
+        pixels[0, 0] = (1, 2, 3)
+        fd, img_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        Image.fromarray(pixels).save(img_path)
+        self.test_files.append(img_path)
+        
+        self.assertEqual(self.get_dominant_color(img_path), (10, 200, 10))
+        with patch('color_tools.image.basic._GETCOLORS_LIMIT', 1):
+            self.assertEqual(self.get_dominant_color(img_path), (10, 200, 10))
+    
     def test_solid_color_returns_that_color(self):
         """Test that a solid color image returns its color."""
         color = (255, 128, 64)
@@ -389,6 +476,22 @@ class TestGetDominantColor(unittest.TestCase):
         
         dominant = self.get_dominant_color(path)
         self.assertEqual(dominant, (255, 0, 0))
+    
+    def test_max_pixels_samples_large_image(self):
+        """max_pixels counts a nearest-neighbour sample of the image."""
+        # Left three quarters blue, right quarter green
+        pixels = np.zeros((100, 200, 3), dtype=np.uint8)
+        pixels[:, :150] = (0, 0, 255)
+        pixels[:, 150:] = (0, 255, 0)
+        fd, path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        Image.fromarray(pixels).save(path)
+        self.test_files.append(path)
+        
+        self.assertEqual(self.get_dominant_color(path, max_pixels=500), (0, 0, 255))
+        self.assertEqual(self.get_dominant_color(path, max_pixels=10**6), (0, 0, 255))
+        with self.assertRaises(ValueError):
+            self.get_dominant_color(path, max_pixels=0)
 
 
 @unittest.skipUnless(PILLOW_AVAILABLE and NUMPY_AVAILABLE, "Requires Pillow and numpy")
@@ -607,6 +710,17 @@ class TestAnalyzeNoiseLevel(unittest.TestCase):
         result = self.analyze_noise_level(img_path)
         
         self.assertIn('noise_sigma', result)
+    
+    def test_downsample(self):
+        """Test that downsample decimates the crop and rejects values below 1."""
+        img_path = create_checkerboard_image(200, 200)
+        self.test_files.append(img_path)
+        
+        result = self.analyze_noise_level(img_path, downsample=2)
+        self.assertGreaterEqual(result['noise_sigma'], 0.0)
+        
+        with self.assertRaises(ValueError):
+            self.analyze_noise_level(img_path, downsample=0)
 
 
 @unittest.skipUnless(PILLOW_AVAILABLE and NUMPY_AVAILABLE, "Requires Pillow and numpy")
@@ -762,6 +876,58 @@ class TestBasicIntegration(unittest.TestCase):
         # Analyze dynamic range
         dynamic_range = self.analyze_dynamic_range(img_path)
         self.assertIn('range', dynamic_range)
+    
+    def test_analyze_batch_preserves_order(self):
+        """analyze_batch returns one result per path, in input order."""
+        from color_tools.image import analyze_batch
+        paths = [
+            create_dark_image(20, 20),
+            create_bright_image(20, 20),
+            create_solid_image(20, 20, (128, 128, 128)),
+        ]
+        self.test_files.extend(paths)
+        
+        results = analyze_batch(paths, max_workers=2)
+        self.assertEqual([r['assessment'] for r in results], ['dark', 'bright', 'normal'])
+        self.assertEqual(analyze_batch(paths, self.count_unique_colors), [1, 1, 1])
+    
+    def test_functions_accept_loaded_image(self):
+        """A loaded PIL image gives the same results as its path and stays open."""
+        img_path = create_gradient_image(64, 16)
+        self.test_files.append(img_path)
+        
+        with Image.open(img_path) as img:
+            self.assertEqual(self.count_unique_colors(img), self.count_unique_colors(img_path))
+            self.assertEqual(self.get_color_histogram(img), self.get_color_histogram(img_path))
+            self.assertEqual(self.get_dominant_color(img), self.get_dominant_color(img_path))
+            self.assertEqual(self.analyze_brightness(img), self.analyze_brightness(img_path))
+            self.assertEqual(self.analyze_contrast(img), self.analyze_contrast(img_path))
+            self.assertEqual(self.analyze_dynamic_range(img), self.analyze_dynamic_range(img_path))
+            # Still usable after the analyses
+            self.assertEqual(img.size, (64, 16))
+            img.load()
+    
+    def test_grayscale_stats_shared_and_refreshed(self):
+        """Brightness/contrast/range share one decode; rewriting the file refreshes it."""
+        from color_tools.image.basic import _load_grayscale_stats
+        img_path = create_gradient_image(64, 8)
+        self.test_files.append(img_path)
+        
+        _load_grayscale_stats.cache_clear()
+        brightness = self.analyze_brightness(img_path)
+        contrast = self.analyze_contrast(img_path)
+        dynamic_range = self.analyze_dynamic_range(img_path)
+        self.assertEqual(_load_grayscale_stats.cache_info().misses, 1)
+        
+        with Image.open(img_path) as img:
+            gray = np.asarray(img.convert('L'))
+        self.assertEqual(brightness['mean_brightness'], float(np.mean(gray)))
+        self.assertAlmostEqual(contrast['contrast_std'], float(np.std(gray)), places=9)
+        self.assertEqual(dynamic_range['min_value'], int(np.min(gray)))
+        self.assertEqual(dynamic_range['max_value'], int(np.max(gray)))
+        
+        Image.new('RGB', (10, 10), (200, 200, 200)).save(img_path)
+        self.assertEqual(self.analyze_brightness(img_path)['mean_brightness'], 200.0)
 
 
 @unittest.skipUnless(PILLOW_AVAILABLE and NUMPY_AVAILABLE, "Requires Pillow and numpy")
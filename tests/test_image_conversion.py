@@ -139,6 +139,21 @@ class TestConvertImage(unittest.TestCase):
             low_quality.stat().st_size
         )
     
+    def test_jpeg_optimize_flag_keeps_pixels(self):
+        """Test that optimize=False decodes to the same pixels as the default."""
+        optimized = convert_image(
+            self.blue_png,
+            output_path=self.test_dir / "optimized.jpg",
+        )
+        fast = convert_image(
+            self.blue_png,
+            output_path=self.test_dir / "fast.jpg",
+            optimize=False
+        )
+        
+        with Image.open(optimized) as a, Image.open(fast) as b:
+            self.assertEqual(a.tobytes(), b.tobytes())
+    
     def test_webp_lossless_default(self):
         """Test that WebP uses lossless compression by default."""
         output = convert_image(self.red_jpg, output_format="webp")
@@ -92,6 +92,10 @@ class TestGetSubparser(unittest.TestCase):
         sub = wiz._get_subparser('nonexistent_command_xyz')
         self.assertIsNone(sub)
 
+    def test_subparser_is_cached(self):
+        wiz = _import_wizard()
+        self.assertIs(wiz._get_subparser('color'), wiz._get_subparser('color'))
+
 
 class TestGetChoices(unittest.TestCase):
     """_get_choices() extracts argparse choices for known args."""
@@ -1,6 +1,7 @@
 """Unit tests for color_tools.palette module."""
 
 import unittest
+import unittest.mock
 import sys
 from pathlib import Path
 
@@ -224,6 +225,116 @@ class TestPalette(unittest.TestCase):
         )
         self.assertIsNotNone(nearest)
         self.assertGreaterEqual(distance, 0)
+    
+    def test_nearest_colors_matches_full_sort(self):
+        """Test nearest_colors returns the same top N as sorting every distance."""
+        from color_tools.distance import delta_e_2000, delta_e_cmc
+        palette = Palette.load_default()
+        target = (50, 25, -30)
+        for metric, distance in (
+            ("de2000", delta_e_2000),
+            ("cmc11", lambda a, b: delta_e_cmc(a, b, l=1.0, c=1.0)),
+        ):
+            with self.subTest(metric=metric):
+                expected = sorted(
+                    ((r, distance(target, r.lab)) for r in palette.records),
+                    key=lambda x: x[1],
+                )[:7]
+                result = palette.nearest_colors(target, space="lab", metric=metric, count=7)
+                self.assertEqual(result, expected)
+    
+    def test_nearest_colors_unknown_metric(self):
+        """Test that an unknown LAB metric raises ValueError."""
+        palette = Palette.load_default()
+        with self.assertRaises(ValueError):
+            palette.nearest_colors((50, 25, -30), space="lab", metric="bogus")
+
+    def test_nearest_color_repeat_query_is_memoized(self):
+        """Test that repeating a query skips the distance scan."""
+        palette = Palette.load_default()
+        first = palette.nearest_color((50, 25, -30))
+        with unittest.mock.patch.object(
+            palette, "_nearest_color_uncached", side_effect=AssertionError("cache miss")
+        ):
+            self.assertEqual(palette.nearest_color([50, 25, -30]), first)
+            # A different metric is a different query
+            with self.assertRaises(AssertionError):
+                palette.nearest_color((50, 25, -30), metric="de76")
+
+    def test_nearest_colors_cached_result_not_shared(self):
+        """Test that mutating a returned list doesn't affect later queries."""
+        palette = Palette.load_default()
+        first = palette.nearest_colors((255, 0, 0), space="rgb", count=3)
+        first.clear()
+        self.assertEqual(len(palette.nearest_colors((255, 0, 0), space="rgb", count=3)), 3)
+
+    def test_nearest_color_exact_rgb_matches_scan(self):
+        """Test that the exact-RGB shortcut returns what the full scan would."""
+        palette = load_palette("vga")
+        for rec in palette.records[:32]:
+            value = tuple(float(c) for c in rec.rgb)
+            fast = palette.nearest_color(value, space="rgb")
+            with unittest.mock.patch.object(palette, "_by_rgb", {}):
+                slow = palette._nearest_color_uncached(value, "rgb", "de2000", 2.0, 1.0)
+            self.assertEqual(fast, slow)
+
+    def test_nearest_cache_is_bounded(self):
+        """Test that the nearest-color memo evicts old queries."""
+        palette = Palette.load_default()
+        with unittest.mock.patch("color_tools.palette._NEAREST_CACHE_SIZE", 4):
+            for r in range(10):
+                palette.nearest_color((r, 0, 0), space="rgb")
+        self.assertEqual(len(palette._nearest_cache), 4)
+
+    def test_reassigning_records_invalidates_nearest_cache(self):
+        """Test that replacing records is seen by later nearest-color queries."""
+        palette = Palette.load_default()
+        black = palette.find_by_name("black")
+        white = palette.find_by_name("white")
+        self.assertEqual(palette.nearest_color((10, 10, 10), space="rgb")[0].name, "black")
+        palette.records = [white]
+        record, _ = palette.nearest_color((10, 10, 10), space="rgb")
+        self.assertEqual(record.name, "white")
+        self.assertIsNone(palette.find_by_rgb(black.rgb))
+
+    def test_records_cannot_be_mutated_in_place(self):
+        """Test that records is immutable so the memo can't go stale."""
+        palette = Palette.load_default()
+        with self.assertRaises(AttributeError):
+            palette.records.append(palette.records[0])  # type: ignore[attr-defined]
+
+
+class TestPaletteLoadCache(unittest.TestCase):
+    """Test that unchanged palette files are parsed once per process."""
+
+    _RED = ('{"name": "red", "hex": "#FF0000", "rgb": [255, 0, 0], '
+            '"hsl": [0.0, 100.0, 50.0], "lab": [53.24, 80.09, 67.2], '
+            '"lch": [53.24, 104.55, 40.0]}')
+
+    def test_load_palette_reuses_parse_until_file_changes(self):
+        """Test that a second load skips parsing and an edit forces a reload."""
+        import os
+        import tempfile
+        from color_tools import palette as palette_mod
+        with tempfile.TemporaryDirectory() as tmp:
+            palette_file = Path(tmp) / "palettes" / "tiny.json"
+            palette_file.parent.mkdir()
+            palette_file.write_text(f"[{self._RED}]", encoding="utf-8")
+            with unittest.mock.patch.object(
+                palette_mod, "_parse_color_records", wraps=palette_mod._parse_color_records
+            ) as parse:
+                first = load_palette("tiny", tmp)
+                second = load_palette("tiny", tmp)
+                self.assertEqual(parse.call_count, 1)
+                # Callers get their own record list
+                self.assertIsNot(first.records, second.records)
+                self.assertEqual(first.records, second.records)
+
+                palette_file.write_text(f"[{self._RED}, {self._RED.replace('red', 'rouge')}]", encoding="utf-8")
+                stamp = palette_file.stat().st_mtime_ns + 1_000_000_000
+                os.utime(palette_file, ns=(stamp, stamp))
+                self.assertEqual(len(load_palette("tiny", tmp).records), 2)
+                self.assertEqual(parse.call_count, 2)
 
 
 class TestFilamentPalette(unittest.TestCase):
@@ -275,6 +386,34 @@ class TestFilamentPalette(unittest.TestCase):
             self.assertGreater(len(results), 0)
             self.assertTrue(all(f.finish == finishes_list[0] for f in results))
     
+    def test_group_counts_match_find_by(self):
+        """group_counts() agrees with the per-group find_by_* lookups."""
+        palette = FilamentPalette.load_default()
+        for group, names, finder in (
+            ("maker", palette.makers, palette.find_by_maker),
+            ("type", palette.types, palette.find_by_type),
+            ("finish", palette.finishes, palette.find_by_finish),
+        ):
+            expected = [(name, len(finder(name))) for name in names]
+            self.assertEqual(palette.group_counts(group), expected)
+    
+    def test_group_counts_merges_maker_synonyms(self):
+        """Maker counts include records filed under a synonym."""
+        records = [
+            FilamentRecord(id="a", maker="Bambu Lab", type="PLA", finish=None,
+                           color="Black", hex="#000000"),
+            FilamentRecord(id="b", maker="Bambu", type="PLA", finish=None,
+                           color="White", hex="#FFFFFF"),
+        ]
+        palette = FilamentPalette(records, maker_synonyms={"Bambu Lab": ["Bambu"]})
+        self.assertEqual(palette.group_counts("maker"), [("Bambu", 2), ("Bambu Lab", 2)])
+    
+    def test_group_counts_rejects_unknown_group(self):
+        """group_counts() raises ValueError for an unknown grouping."""
+        palette = FilamentPalette.load_default()
+        with self.assertRaises(ValueError):
+            palette.group_counts("color")
+    
     def test_filter_combined(self):
         """Test filtering with multiple criteria."""
         palette = FilamentPalette.load_default()
@@ -588,6 +588,65 @@ class TestOverrideReporting(TestUserOverrideSystem):
             len(overrides.get("colors", {}).get("rgb", {})) == 0
         )
 
+    def test_override_report_lists_every_kind(self):
+        """show_override_report lists color, filament, and synonym overrides."""
+        import io
+        from unittest.mock import patch
+        from color_tools.cli_commands.reporting import show_override_report
+        
+        self._create_user_colors([{
+            "name": "red", "hex": "#DC143C", "rgb": [220, 20, 60],
+            "hsl": [348.0, 83.3, 47.1], "lab": [47.1, 70.8, 33.2], "lch": [47.1, 78.3, 25.1]
+        }])
+        self._create_user_filaments([{
+            "maker": "Bambu Lab", "type": "PLA", "finish": "Matte", "color": "Red", "hex": "#FF0000"
+        }])
+        self._create_user_synonyms({"Bambu Lab": ["CustomBambu"]})
+        
+        # A load earlier in the process must not hide overrides from the report
+        self._load_with_custom_dir(load_colors)
+        
+        captured = io.StringIO()
+        with patch('sys.stdout', captured):
+            show_override_report(str(self.data_dir))
+        output = captured.getvalue()
+        
+        self.assertIn("Override Details:", output)
+        self.assertIn("Colors: User colors override 1 core colors by name", output)
+        self.assertIn("Filaments: User filaments override 1 core filaments exactly", output)
+        self.assertIn("Synonyms: User synonyms override 1 core makers", output)
+
+    def test_public_loaders_return_override_messages(self):
+        """The *_with_overrides loaders return records plus override messages."""
+        from color_tools import (
+            load_colors_with_overrides,
+            load_filaments_with_overrides,
+            load_maker_synonyms_with_overrides,
+        )
+        
+        colors, messages = load_colors_with_overrides(self.data_dir)
+        self.assertEqual(len(colors), 2)
+        self.assertEqual(messages, [])
+        
+        self._create_user_colors([{
+            "name": "red", "hex": "#DC143C", "rgb": [220, 20, 60],
+            "hsl": [348.0, 83.3, 47.1], "lab": [47.1, 70.8, 33.2], "lch": [47.1, 78.3, 25.1]
+        }])
+        self._create_user_synonyms({"Bambu Lab": ["CustomBambu"]})
+        
+        colors, messages = load_colors_with_overrides(self.data_dir)
+        self.assertEqual(len(colors), 3)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("by name", messages[0])
+        
+        filaments, messages = load_filaments_with_overrides(self.data_dir)
+        self.assertEqual(len(filaments), 2)
+        self.assertEqual(messages, [])
+        
+        synonyms, messages = load_maker_synonyms_with_overrides(self.data_dir)
+        self.assertEqual(synonyms["Bambu Lab"], ["CustomBambu"])
+        self.assertEqual(len(messages), 1)
+
 
 class TestOverrideIntegration(TestUserOverrideSystem):
     """Test end-to-end override system integration."""
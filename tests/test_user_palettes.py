@@ -1,14 +1,33 @@
 #!/usr/bin/env python3
 
 import json
+import os
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from color_tools.palette import load_palette, Palette
 from color_tools.cli_commands.reporting import get_available_palettes
 
 
+_cache_dir = None
+_cache_patch = None
+
+
+def setUpModule():
+    """Point XDG_CACHE_HOME at a scratch dir so get_available_palettes never writes the real palette index."""
+    global _cache_dir, _cache_patch
+    _cache_dir = TemporaryDirectory()
+    _cache_patch = patch.dict(os.environ, {"XDG_CACHE_HOME": _cache_dir.name})
+    _cache_patch.start()
+
+
+def tearDownModule():
+    _cache_patch.stop()
+    _cache_dir.cleanup()
+
+
 class TestUserPalettes(unittest.TestCase):
     """Test user palette functionality."""
     
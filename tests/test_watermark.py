@@ -236,6 +236,23 @@ class TestImageWatermark(unittest.TestCase):
             watermark_path=rgb_path
         )
         self.assertIsInstance(result, Image.Image)
+    
+    def test_image_watermark_clipped_and_base_untouched(self):
+        """Test a watermark hanging off the edge is clipped and the RGBA base is not modified."""
+        base = Image.new('RGBA', (50, 40), color=(255, 255, 255, 255))
+        opaque_path = Path(self.temp_dir) / "opaque.png"
+        Image.new('RGBA', (30, 30), color=(0, 0, 255, 255)).save(opaque_path)
+        
+        result = add_image_watermark(
+            base, watermark_path=opaque_path, position=(-10, 30), opacity=1.0
+        )
+        
+        self.assertEqual(result.size, (50, 40))
+        self.assertEqual(result.getpixel((0, 39)), (0, 0, 255, 255))
+        self.assertEqual(result.getpixel((19, 30)), (0, 0, 255, 255))
+        self.assertEqual(result.getpixel((20, 30)), (255, 255, 255, 255))
+        self.assertEqual(result.getpixel((0, 29)), (255, 255, 255, 255))
+        self.assertEqual(base.getpixel((0, 39)), (255, 255, 255, 255))
 
 
 @unittest.skipUnless(WATERMARK_AVAILABLE and SVG_AVAILABLE, 